@@ -2,21 +2,75 @@
 RPG Tour par Tour - Jeu Pygame
 Point d'entrée principal du jeu
 """
+import asyncio
+import os
 import pygame
 import sys
+import time
 from src.menu import Menu
+from src.catalog import ENEMY_CATALOG, CatalogError
+from src.character import Character, ImageCharacter
 from src.game import Game
-from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from src.horde import HordeGame
+from src.ui import Button, prerender_buttons
+from src.profiler import PROFILER
+from src.allocations import ALLOC_ENV, AllocationTracker
+from src.latency import LOW_LATENCY_ENV, FramePacer
+from src.gcpolicy import GC_ENV, GC_POLICY
+from src.jobs import JobScheduler, PRIORITY_LOW
+from src.runtime import IPC_ENV, AsyncRuntime
+from src.metrics import METRICS_ENV, FRAME_TIME, FPS_GAUGE, MetricsServer, record_run, record_run_start
+from src.display import RENDERER_ENV, RENDERER_BACKENDS, Display
+from src.settings import Settings, SettingsError
+from src.scenes import SceneManager
+from src.save import Autosaver, SaveError, load_game, parse_save, read_save
+from src.history import RunHistory
+from src.leaderboard import Leaderboard, LeaderboardError
+from src.constants import PROFILER_TRACE_FILE, IDLE_FPS
 
 
-def main():
-    """Fonction principale du jeu"""
+def apply_settings(settings, display, pacer):
+    """
+    Applique les options en cours de partie (sans redémarrer)
+
+    Args:
+        settings (Settings): Options à appliquer
+        display (Display): Fenêtre du jeu
+        pacer (FramePacer): Cadence de la boucle principale
+    """
+    if not display.configure(settings["render_scale"], settings["vsync"],
+                             settings["fullscreen"], settings["pixel_art"]):
+        settings.set("vsync", False)
+    pacer.fps = settings["fps_cap"]
+    pacer.idle_fps = IDLE_FPS if settings["idle_throttle"] else None
+    pacer.low_latency = settings["low_latency"]
+    Game.enemy_action_delay = settings["enemy_delay"]
+    if settings["profiler"]:
+        PROFILER.enable()
+    else:
+        PROFILER.disable()
+
+
+async def run_game():
+    """Boucle de frames : une tâche asyncio, à côté des écritures et calculs de fond"""
     # Initialisation de Pygame
     pygame.init()
 
-    # Configuration de l'écran
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption("RPG Roguelike")
+    # Options conservées entre les lancements (RPG_PROFILE, RPG_LOW_LATENCY et RPG_RENDERER les complètent)
+    settings = Settings()
+    try:
+        settings.load()
+    except SettingsError as e:
+        print(f"Options par défaut: {e}")
+    if PROFILER.enabled:
+        settings.set("profiler", True)
+    if os.environ.get(LOW_LATENCY_ENV, "0") not in ("", "0"):
+        settings.set("low_latency", True)
+    if os.environ.get(RENDERER_ENV) in RENDERER_BACKENDS:
+        settings.set("renderer", os.environ[RENDERER_ENV])
+
+    # Configuration de l'écran : image interne présentée à l'échelle, ou textures SDL
+    display = Display(backend=settings["renderer"])
     clock = pygame.time.Clock()
 
     # Chargement des polices
@@ -24,51 +78,204 @@ def main():
     font_medium = pygame.font.Font(None, 36)
     font_small = pygame.font.Font(None, 24)
 
-    # Création du menu
-    menu = Menu(screen, font_large, font_medium, font_small)
-    game = None
+    # Persistance : sauvegarde, historique et classement
+    autosaver = Autosaver()
+    history = RunHistory(batch_size=1)
+    try:
+        leaderboard = Leaderboard()
+    except LeaderboardError as e:
+        print(f"Classement désactivé: {e}")
+        leaderboard = None
+
+    # Sous-phases mesurées quand le profileur est actif (F3)
+    PROFILER.watch(Character, "draw")
+    PROFILER.watch(ImageCharacter, "draw")
+    PROFILER.watch(Game, "_draw_characters")
+    PROFILER.watch(HordeGame, "_draw_characters")
+    PROFILER.watch(Game, "_draw_pause_menu")
+    PROFILER.watch(Button, "draw")
+
+    # Suivi des allocations par frame (opt-in, ralentit le jeu)
+    allocations = None
+    if os.environ.get(ALLOC_ENV, "0") not in ("", "0"):
+        allocations = AllocationTracker()
+        allocations.start()
+
+    # Cadence : lecture des entrées et présentation, réglée par les options
+    pacer = FramePacer(clock, settings["fps_cap"], present=display.present)
+    apply_settings(settings, display, pacer)
+    screen = display.backend  # Backend de rendu (ouvert par configure)
+
+    # Tâches asyncio de fond (écritures, calculs, IPC locale avec RPG_IPC=chemin_du_socket)
+    runtime = AsyncRuntime()
+    if os.environ.get(IPC_ENV):
+        runtime.serve_ipc(os.environ[IPC_ENV])
+
+    # Travaux d'arrière-plan avancés dans un budget par frame (préparation des étages...)
+    jobs = JobScheduler()
+    Game.jobs = jobs
 
-    # État de l'application
-    current_state = "menu"  # menu, game
+    # Scènes créées une seule fois : une nouvelle run est réinitialisée sur place
+    scenes = SceneManager()
+    menu = Menu(screen, font_large, font_medium, font_small, leaderboard, settings)
+    scenes.register("menu", menu)
+    game = Game(screen, font_large, font_medium, font_small, autosaver)
+    game.run_listeners.append(history.append)
+    if leaderboard:
+        game.run_listeners.append(leaderboard.record)
+    scenes.register("game", game)
+    # Mode infini et mode Horde : ni sauvegarde ni classement
+    scenes.register("endless", Game(screen, font_large, font_medium, font_small, endless=True))
+    scenes.register("horde", HordeGame(screen, font_large, font_medium, font_small))
+    scenes.push("menu")
+    # Runs commencées et terminées comptées dans les métriques, tous modes confondus
+    for scene in scenes.scenes.values():
+        if isinstance(scene, Game):
+            scene.start_listeners.append(record_run_start)
+            scene.run_listeners.append(record_run)
+    # Textes des boutons rendus à l'avance, au fil des premières frames
+    for name, scene in scenes.scenes.items():
+        jobs.submit(prerender_buttons(scene.widgets()), PRIORITY_LOW, f"widgets:{name}")
+
+    # Métriques Prometheus servies par un thread (opt-in : RPG_METRICS=port, hôte:port ou unix:chemin)
+    metrics_server = None
+    if os.environ.get(METRICS_ENV):
+        metrics_server = MetricsServer(address=os.environ[METRICS_ENV])
+        try:
+            metrics_server.start()
+            print(f"Métriques sur {metrics_server.address}/metrics")
+        except (OSError, ValueError) as e:
+            print(f"Métriques indisponibles: {e}")
+            metrics_server = None
+
+    # Ramasse-miettes : objets du démarrage figés, collectes dans les frames au repos
+    GC_POLICY.start(defer=os.environ.get(GC_ENV, "1") not in ("", "0"))
     running = True
 
     # Boucle principale
     while running:
+        frame_start = time.perf_counter()
+        PROFILER.begin_frame()
+        if allocations:
+            allocations.begin_frame()
+
         # Gestion des événements selon l'état
-        if current_state == "menu":
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                
-                action = menu.handle_events(event)
-                if action == "play":
-                    # Créer une nouvelle partie
-                    game = Game(screen, font_large, font_medium, font_small)
-                    current_state = "game"
-                elif action == "quit":
-                    running = False
+        events = display.map_events(await pacer.poll_async())
+        with PROFILER.phase("events"):
+            if scenes.current_name == "menu":
+                for event in events:
+                    if event.type == pygame.QUIT:
+                        running = False
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        PROFILER.toggle()
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F5:
+                        # Rechargement du catalogue d'ennemis (les parties suivantes l'utilisent)
+                        try:
+                            ENEMY_CATALOG.reload()
+                            print("Catalogue d'ennemis rechargé")
+                        except CatalogError as e:
+                            print(f"Catalogue conservé: {e}")
 
-        elif current_state == "game":
-            # Le jeu gère ses propres événements
-            if not game.handle_events():
-                running = False
+                    action = menu.handle_events(event)
+                    if action == "play":
+                        # Run sauvegardée : le menu propose de la continuer ou d'en commencer une nouvelle
+                        autosaver.flush()  # Dernier instantané écrit avant la lecture
+                        saved = read_save(autosaver.path)
+                        floor = None
+                        if saved:
+                            try:
+                                floor = parse_save(saved)["floor"]
+                            except SaveError as e:
+                                print(f"Sauvegarde ignorée: {e}")
+                        if floor is not None:
+                            menu.offer_resume(floor)
+                            continue
+                        action = "new_run"
+                    if action == "continue":
+                        game = scenes.push("game")
+                        game.reset_game()
+                        try:
+                            load_game(game, read_save(autosaver.path) or b"")
+                        except SaveError as e:
+                            print(f"Sauvegarde ignorée: {e}")
+                        break  # Le menu n'est plus affiché
+                    elif action == "new_run":
+                        autosaver.clear()  # La sauvegarde remplacée ne sera plus proposée
+                        game = scenes.push("game")
+                        game.reset_game()
+                        break
+                    elif action in ("endless", "horde"):
+                        game = scenes.push(action)
+                        game.reset_game()
+                        break
+                    elif action == "settings":
+                        # Option modifiée : appliquée tout de suite et conservée
+                        apply_settings(settings, display, pacer)
+                        menu.update_option_buttons()
+                        runtime.spawn(runtime.write_file(settings.path, settings.dumps()), "settings")
+                    elif action == "quit":
+                        running = False
+
+            else:
+                # Le jeu gère ses propres événements
+                if not game.handle_events(events):
+                    running = False
 
         # Mise à jour et affichage
-        if current_state == "menu":
-            menu.draw()
-        elif current_state == "game":
-            game.update()
-            game.draw()
+        if scenes.current_name == "menu":
+            # Menu inchangé : ni rendu ni mise à l'échelle (l'overlay se redessine sur une image propre).
+            # Les textures SDL ne conservent pas l'image précédente : tout est redessiné
+            if menu.needs_redraw() or PROFILER.enabled or not screen.retained:
+                with PROFILER.phase("draw"):
+                    menu.draw()
+                display.dirty = True
+        else:
+            with PROFILER.phase("update"):
+                game.update()
+            with PROFILER.phase("draw"):
+                game.draw()
+            display.dirty = True
 
             # Vérifier si on doit retourner au menu
             if game.return_to_menu:
-                current_state = "menu"
-                game = None
+                scenes.pop()
+
+        with PROFILER.phase("jobs"):
+            jobs.run()
+        PROFILER.draw_hud(screen, font_small, clock.get_fps(), pacer.frame_rate())
+        with PROFILER.phase("flip"):
+            pacer.present()
+        GC_POLICY.end_frame(scenes.current_name == "menu" or game.is_idle())
+        if allocations:
+            allocations.end_frame()
+        FRAME_TIME.observe(time.perf_counter() - frame_start)
+        FPS_GAUGE.set(clock.get_fps())
+        with PROFILER.phase("tick"):
+            await pacer.wait_async()  # Les autres tâches avancent pendant l'attente
+
+    # Nettoyage : écritures en cours terminées, tâches de fond arrêtées
+    await runtime.shutdown()
+    if metrics_server:
+        metrics_server.stop()
+    if pacer.latency.samples:
+        print(pacer.latency.report())
+    GC_POLICY.stop()
+    print(GC_POLICY.report())
+    if allocations:
+        allocations.stop()
+        print(allocations.report())
+    if PROFILER.events:
+        count = PROFILER.export_chrome_trace(PROFILER_TRACE_FILE)
+        print(f"Trace des frames ({count} événements) : {PROFILER_TRACE_FILE}")
+    autosaver.flush()
+    history.close()
+    if leaderboard:
+        leaderboard.close()
 
-        pygame.display.flip()
-        clock.tick(FPS)
 
-    # Nettoyage
+def main():
+    """Fonction principale du jeu"""
+    asyncio.run(run_game())
     pygame.quit()
     sys.exit()
 
@@ -0,0 +1,288 @@
+"""
+Module de suivi des allocations par frame - Surfaces et objets créés au rendu
+
+Opt-in (RPG_ALLOC=1 ou python -m tools.alloc_check) : tracemalloc mesure les
+octets alloués pendant chaque frame, regroupés par ligne d'appel, et un hook
+sys.setprofile compte les surfaces créées (Font.render, Surface.copy,
+pygame.transform, pygame.Surface), les rendus de texte et les blits (y compris
+les textures dessinées par le backend "texture"). Une frame au repos ne
+devrait créer aucune surface : assert_steady le vérifie.
+"""
+import gc
+import os
+import sys
+import tracemalloc
+from collections import deque, namedtuple
+import pygame
+from .render import TextureBackend
+
+ALLOC_ENV = "RPG_ALLOC"
+
+# Méthodes et fonctions pygame qui renvoient une nouvelle surface
+SURFACE_METHODS = {"copy", "convert", "convert_alpha", "subsurface"}
+BLIT_METHODS = {"blit", "blits", "fblits"}
+TRANSFORM_FUNCTIONS = {
+    "scale", "scale_by", "smoothscale", "smoothscale_by", "rotate", "rotozoom",
+    "flip", "scale2x", "chop", "laplacian", "grayscale",
+}
+# Texture.draw (pygame._sdl2, compilé avec Cython) n'est pas vu par le hook :
+# les blits du backend "texture" sont comptés à l'appel de sa méthode Python
+TEXTURE_BLIT_CODES = {TextureBackend.blit.__code__}
+
+# Bilan d'une frame
+#   surfaces : surfaces créées ; surface_sites : {ligne d'appel: nombre}
+#   renders : textes rendus (Font.render) ; blits : appels de blit
+#   net_bytes : mémoire conservée en fin de frame ; peak_bytes : pic pendant la frame
+#   collections : passages du ramasse-miettes ; sites : {ligne d'appel: (octets, blocs)}
+FrameAllocations = namedtuple(
+    "FrameAllocations",
+    "surfaces surface_sites renders blits net_bytes peak_bytes collections sites")
+
+
+class SteadyStateError(AssertionError):
+    """Erreur levée quand des frames au repos allouent des surfaces"""
+
+
+def _call_site(frame):
+    """
+    Ligne d'appel lisible (chemin relatif au dossier courant)
+
+    Args:
+        frame: Frame Python de l'appelant
+
+    Returns:
+        str: "fichier:ligne"
+    """
+    filename = frame.f_code.co_filename
+    try:
+        filename = os.path.relpath(filename)
+    except ValueError:
+        pass  # Autre lecteur (Windows)
+    return f"{filename}:{frame.f_lineno}"
+
+
+class AllocationTracker:
+    """Mesure les allocations et les créations de surfaces frame par frame"""
+
+    def __init__(self, frames=600, by_site=True):
+        """
+        Initialise le suivi (inactif tant que start() n'est pas appelé)
+
+        Args:
+            frames (int): Nombre de bilans de frame conservés
+            by_site (bool): Regroupe les octets par ligne d'appel (un instantané
+                tracemalloc par frame, plus lent) - optionnel
+        """
+        self.by_site = by_site
+        self.frames = deque(maxlen=frames)
+        self.active = False
+        self._surface_sites = {}
+        self._renders = 0
+        self._blits = 0
+        self._start_bytes = 0
+        self._start_collections = 0
+        self._snapshot = None
+        self._original_surface = None
+        self._started_tracemalloc = False
+
+    def start(self):
+        """Démarre tracemalloc et le comptage des surfaces"""
+        if self.active:
+            return
+        self.active = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(1)
+            self._started_tracemalloc = True
+
+        # pygame.Surface(...) n'est pas visible par le hook : classe comptée à la place
+        tracker = self
+        self._original_surface = pygame.Surface
+
+        class CountedSurface(self._original_surface):
+            """Surface dont la création est comptée"""
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                tracker._count_surface(sys._getframe(1))
+
+        pygame.Surface = CountedSurface
+        if self.by_site:
+            self._take_snapshot()  # Compile les filtres hors des frames mesurées
+        sys.setprofile(self._profile)
+
+    def stop(self):
+        """Arrête le suivi et restaure pygame.Surface"""
+        if not self.active:
+            return
+        self.active = False
+        sys.setprofile(None)
+        pygame.Surface = self._original_surface
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _profile(self, frame, event, arg):
+        """
+        Hook sys.setprofile : compte les appels C qui créent une surface ou la blittent
+
+        Args:
+            frame: Frame Python appelante (appelée pour 'call')
+            event (str): Type d'événement
+            arg: Fonction C appelée (pour 'c_call')
+        """
+        if event == "call":
+            if frame.f_code in TEXTURE_BLIT_CODES:
+                self._blits += 1
+            return
+        if event != "c_call":
+            return
+        owner = getattr(arg, "__self__", None)
+        name = arg.__name__
+        if isinstance(owner, pygame.font.Font):
+            if name == "render":
+                self._renders += 1
+                self._count_surface(frame)
+        elif isinstance(owner, self._original_surface):
+            if name in BLIT_METHODS:
+                self._blits += 1
+            elif name in SURFACE_METHODS:
+                self._count_surface(frame)
+        elif owner is pygame.transform and name in TRANSFORM_FUNCTIONS:
+            self._count_surface(frame)
+
+    def _count_surface(self, frame):
+        """
+        Compte une surface créée depuis une ligne d'appel
+
+        Args:
+            frame: Frame Python appelante
+        """
+        site = _call_site(frame)
+        self._surface_sites[site] = self._surface_sites.get(site, 0) + 1
+
+    def begin_frame(self):
+        """Début d'une frame mesurée"""
+        if not self.active:
+            return
+        self._surface_sites = {}
+        self._renders = 0
+        self._blits = 0
+        self._start_collections = sum(stat["collections"] for stat in gc.get_stats())
+        if self.by_site:
+            self._snapshot = self._take_snapshot()
+        tracemalloc.reset_peak()
+        self._start_bytes = tracemalloc.get_traced_memory()[0]
+
+    def end_frame(self):
+        """
+        Fin d'une frame mesurée
+
+        Returns:
+            FrameAllocations: Bilan de la frame (None si inactif)
+        """
+        if not self.active:
+            return None
+        current, peak = tracemalloc.get_traced_memory()
+        collections = sum(stat["collections"] for stat in gc.get_stats()) - self._start_collections
+
+        sites = {}
+        if self.by_site and self._snapshot is not None:
+            for stat in self._take_snapshot().compare_to(self._snapshot, "lineno"):
+                if stat.size_diff > 0:
+                    frame = stat.traceback[0]
+                    sites[f"{os.path.relpath(frame.filename)}:{frame.lineno}"] = \
+                        (stat.size_diff, stat.count_diff)
+
+        result = FrameAllocations(
+            sum(self._surface_sites.values()), self._surface_sites, self._renders, self._blits,
+            current - self._start_bytes, peak - self._start_bytes, collections, sites)
+        self.frames.append(result)
+        return result
+
+    def _take_snapshot(self):
+        """
+        Instantané tracemalloc sans les allocations du suivi lui-même
+
+        Returns:
+            tracemalloc.Snapshot: Instantané filtré
+        """
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+
+    def summary(self):
+        """
+        Moyennes par frame sur les frames conservées
+
+        Returns:
+            dict: surfaces, renders, blits, net_bytes, peak_bytes, collections (par frame),
+                surface_sites et sites triés du plus coûteux au moins coûteux
+        """
+        count = max(1, len(self.frames))
+        surface_sites = {}
+        sites = {}
+        for frame in self.frames:
+            for site, n in frame.surface_sites.items():
+                surface_sites[site] = surface_sites.get(site, 0) + n
+            for site, (size, blocks) in frame.sites.items():
+                total_size, total_blocks = sites.get(site, (0, 0))
+                sites[site] = (total_size + size, total_blocks + blocks)
+        return {
+            "frames": len(self.frames),
+            "surfaces": sum(frame.surfaces for frame in self.frames) / count,
+            "renders": sum(frame.renders for frame in self.frames) / count,
+            "blits": sum(frame.blits for frame in self.frames) / count,
+            "net_bytes": sum(frame.net_bytes for frame in self.frames) / count,
+            "peak_bytes": sum(frame.peak_bytes for frame in self.frames) / count,
+            "collections": sum(frame.collections for frame in self.frames) / count,
+            "surface_sites": sorted(((site, n / count) for site, n in surface_sites.items()),
+                                    key=lambda item: -item[1]),
+            "sites": sorted(((site, size / count, blocks / count)
+                             for site, (size, blocks) in sites.items()),
+                            key=lambda item: -item[1]),
+        }
+
+    def report(self, limit=10):
+        """
+        Rapport lisible des allocations par frame
+
+        Args:
+            limit (int): Nombre de lignes d'appel affichées par section
+
+        Returns:
+            str: Rapport
+        """
+        summary = self.summary()
+        lines = [
+            f"Allocations sur {summary['frames']} frames (moyennes par frame) :",
+            f"  surfaces créées : {summary['surfaces']:.2f}",
+            f"  textes rendus : {summary['renders']:.2f}   blits : {summary['blits']:.1f}",
+            f"  octets conservés : {summary['net_bytes']:.0f}   pic : {summary['peak_bytes']:.0f}",
+            f"  passages du GC : {summary['collections']:.3f}",
+        ]
+        if summary["surface_sites"]:
+            lines.append("  Surfaces par ligne d'appel :")
+            lines += [f"    {n:8.2f}  {site}" for site, n in summary["surface_sites"][:limit]]
+        if summary["sites"]:
+            lines.append("  Octets conservés par ligne d'appel :")
+            lines += [f"    {size:8.0f} o {blocks:6.1f} blocs  {site}"
+                      for site, size, blocks in summary["sites"][:limit]]
+        return "\n".join(lines)
+
+    def assert_steady(self, frames=None, max_surfaces=0):
+        """
+        Vérifie qu'aucune frame n'a créé plus de surfaces que permis
+
+        Args:
+            frames (list): Bilans à vérifier (par défaut tous ceux conservés)
+            max_surfaces (int): Surfaces autorisées par frame
+
+        Raises:
+            SteadyStateError: Si une frame dépasse la limite
+        """
+        for index, frame in enumerate(self.frames if frames is None else frames):
+            if frame.surfaces > max_surfaces:
+                sites = ", ".join(f"{site} x{n}" for site, n in frame.surface_sites.items())
+                raise SteadyStateError(
+                    f"Frame {index}: {frame.surfaces} surfaces créées (max {max_surfaces}) : {sites}")
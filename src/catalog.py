@@ -0,0 +1,296 @@
+"""
+Module du catalogue d'ennemis - Données chargées depuis data/enemies.json
+
+Le fichier est validé puis compilé une fois en tables plates indexées par
+(étage, identifiant d'ennemi) : apparition = tirage pondéré + lecture de table.
+
+Validation d'un fichier : python -m tools.check_catalog [chemin]
+"""
+import json
+import math
+import os
+from array import array
+from .constants import MAX_FLOOR, STATUS_EFFECTS, STAT_LIMIT
+
+CATALOG_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "data", "enemies.json")
+
+STATS = ("hp", "attack", "defense", "gold")
+
+# Taille maximale d'une clé d'ennemi (stockée telle quelle dans les sauvegardes)
+KEY_SIZE = 16
+
+
+class CatalogError(Exception):
+    """Erreur levée quand le fichier du catalogue est invalide"""
+
+
+def _require_number(value, where, minimum=0, integer=False):
+    """
+    Vérifie qu'une valeur est un nombre fini supérieur ou égal à un minimum
+
+    Args:
+        value: Valeur à vérifier
+        where (str): Emplacement dans le fichier (pour le message)
+        minimum (float): Valeur minimale
+        integer (bool): True si un entier (au plus STAT_LIMIT) est attendu - optionnel
+
+    Raises:
+        CatalogError: Si la valeur est invalide
+    """
+    if integer:
+        if isinstance(value, bool) or not isinstance(value, int) or not minimum <= value <= STAT_LIMIT:
+            raise CatalogError(f"{where}: entier de {minimum} à {STAT_LIMIT} attendu, reçu {value!r}")
+        return
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or \
+            not math.isfinite(value) or value < minimum:
+        raise CatalogError(f"{where}: nombre fini >= {minimum} attendu, reçu {value!r}")
+
+
+def _require_object(value, where):
+    """
+    Vérifie qu'une valeur est un objet JSON
+
+    Args:
+        value: Valeur à vérifier
+        where (str): Emplacement dans le fichier (pour le message)
+
+    Raises:
+        CatalogError: Si la valeur n'est pas un objet
+    """
+    if not isinstance(value, dict):
+        raise CatalogError(f"{where}: objet attendu, reçu {type(value).__name__}")
+
+
+def _validate_effect(effect, where, with_chance):
+    """
+    Vérifie la description d'un effet de statut
+
+    Args:
+        effect (dict): Description de l'effet
+        where (str): Emplacement dans le fichier
+        with_chance (bool): True si une probabilité est attendue
+
+    Raises:
+        CatalogError: Si l'effet est invalide
+    """
+    _require_object(effect, where)
+    if not isinstance(effect.get("effect"), str) or effect["effect"] not in STATUS_EFFECTS:
+        raise CatalogError(f"{where}: effet inconnu")
+    # Entiers : la puissance s'ajoute aux HP, la durée se compte en tours
+    _require_number(effect.get("power"), f"{where}.power", 1, integer=True)
+    _require_number(effect.get("duration"), f"{where}.duration", 1, integer=True)
+    if with_chance:
+        chance = effect.get("chance")
+        _require_number(chance, f"{where}.chance")
+        if chance > 1:
+            raise CatalogError(f"{where}.chance: probabilité > 1")
+
+
+def validate(data, max_floor=MAX_FLOOR):
+    """
+    Valide le contenu du fichier du catalogue
+
+    Args:
+        data (dict): Contenu JSON décodé
+        max_floor (int): Dernier étage qui doit être couvert par les tranches
+
+    Raises:
+        CatalogError: À la première erreur trouvée
+    """
+    if not isinstance(data, dict):
+        raise CatalogError("Le catalogue doit être un objet JSON")
+
+    scaling = data.get("scaling", {})
+    _require_object(scaling, "scaling")
+    for stat in STATS:
+        _require_number(scaling.get(stat, 0), f"scaling.{stat}")
+
+    enemies = data.get("enemies")
+    if not isinstance(enemies, dict) or not enemies:
+        raise CatalogError("enemies: au moins un ennemi attendu")
+    for key, enemy in enemies.items():
+        where = f"enemies.{key}"
+        if not key or len(key.encode("utf-8")) > KEY_SIZE:
+            raise CatalogError(f"{where}: clé de 1 à {KEY_SIZE} octets attendue")
+        _require_object(enemy, where)
+        if not isinstance(enemy.get("name"), str):
+            raise CatalogError(f"{where}.name: texte attendu")
+        _require_number(enemy.get("hp"), f"{where}.hp", 1)
+        for stat in ("attack", "defense", "gold"):
+            _require_number(enemy.get(stat), f"{where}.{stat}")
+        color = enemy.get("color")
+        if not isinstance(color, list) or len(color) != 3 or \
+                not all(isinstance(c, int) and 0 <= c <= 255 for c in color):
+            raise CatalogError(f"{where}.color: [R, G, B] attendu")
+        if "on_hit" in enemy:
+            _validate_effect(enemy["on_hit"], f"{where}.on_hit", True)
+        if "on_spawn" in enemy:
+            _validate_effect(enemy["on_spawn"], f"{where}.on_spawn", False)
+
+    bands = data.get("bands")
+    if not isinstance(bands, list) or not bands:
+        raise CatalogError("bands: au moins une tranche d'étages attendue")
+    previous = 0
+    for i, band in enumerate(bands):
+        where = f"bands[{i}]"
+        last = band.get("max_floor") if isinstance(band, dict) else None
+        if not isinstance(last, int) or last <= previous:
+            raise CatalogError(f"{where}.max_floor: entier croissant attendu")
+        spawns = band.get("spawns")
+        if not isinstance(spawns, dict) or not spawns:
+            raise CatalogError(f"{where}.spawns: au moins un ennemi attendu")
+        for key, weight in spawns.items():
+            if key not in enemies:
+                raise CatalogError(f"{where}.spawns: ennemi inconnu {key!r}")
+            _require_number(weight, f"{where}.spawns.{key}")
+        if not any(weight > 0 for weight in spawns.values()):
+            raise CatalogError(f"{where}.spawns: poids total nul")
+        previous = last
+    if previous < max_floor:
+        raise CatalogError(f"bands: les étages {previous + 1} à {max_floor} ne sont pas couverts")
+
+
+class EnemyCatalog:
+    """Catalogue compilé : tables plates de stats et de tirage par étage"""
+
+    def __init__(self, path=CATALOG_FILE):
+        """
+        Charge et compile le catalogue
+
+        Args:
+            path (str): Chemin du fichier JSON
+
+        Raises:
+            CatalogError: Si le fichier est illisible ou invalide
+        """
+        self.path = path
+        self.reload()
+
+    def reload(self):
+        """
+        Recharge le fichier (les anciennes tables sont conservées en cas d'erreur)
+
+        Raises:
+            CatalogError: Si le fichier est illisible ou invalide
+        """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise CatalogError(f"Impossible de lire {self.path}: {e}") from e
+        validate(data)
+        self._compile(data)
+
+    def _compile(self, data):
+        """
+        Construit les tables à partir de données validées
+
+        Args:
+            data (dict): Contenu JSON validé
+        """
+        enemies = data["enemies"]
+        scaling = data.get("scaling", {})
+        ids = list(enemies)
+        count = len(ids)
+        floors = data["bands"][-1]["max_floor"]
+
+        # Tables des stats : index = étage * nombre d'ennemis + identifiant
+        tables = {stat: array("i", bytes(4 * (floors + 1) * count)) for stat in STATS}
+        for floor in range(1, floors + 1):
+            for enemy_id, key in enumerate(ids):
+                for stat in STATS:
+                    tables[stat][floor * count + enemy_id] = _scaled(
+                        enemies[key][stat], scaling.get(stat, 0), floor)
+
+        # Tables de tirage : (identifiants, poids cumulés) par étage
+        spawn_tables = [None]
+        band_index = 0
+        for floor in range(1, floors + 1):
+            while data["bands"][band_index]["max_floor"] < floor:
+                band_index += 1
+            spawns = data["bands"][band_index]["spawns"]
+            choices = [ids.index(key) for key, weight in spawns.items() if weight > 0]
+            cumulative = []
+            total = 0
+            for key, weight in spawns.items():
+                if weight > 0:
+                    total += weight
+                    cumulative.append(total)
+            spawn_tables.append((tuple(choices), tuple(cumulative)))
+
+        def effect(enemy, field):
+            value = enemy.get(field)
+            if value is None:
+                return None
+            return (value["effect"], value["power"], value["duration"], value.get("chance", 1))
+
+        # Remplacement d'un bloc : les lecteurs ne voient jamais un état partiel
+        self.ids = ids
+        self.index = {key: i for i, key in enumerate(ids)}
+        self.names = [enemies[key]["name"] for key in ids]
+        self.colors = [tuple(enemies[key]["color"]) for key in ids]
+        self.on_hit = [effect(enemies[key], "on_hit") for key in ids]
+        self.on_spawn = [effect(enemies[key], "on_spawn") for key in ids]
+        self.base = {stat: [enemies[key][stat] for key in ids] for stat in STATS}
+        self.scaling = {stat: scaling.get(stat, 0) for stat in STATS}
+        self.floors = floors
+        self.hp_table = tables["hp"]
+        self.attack_table = tables["attack"]
+        self.defense_table = tables["defense"]
+        self.gold_table = tables["gold"]
+        self.spawn_tables = spawn_tables
+
+    def draw(self, floor, rng):
+        """
+        Tire un ennemi pour un étage (tirage pondéré)
+
+        Args:
+            floor (int): Étage
+            rng: Générateur aléatoire (random.Random)
+
+        Returns:
+            int: Identifiant de l'ennemi
+        """
+        choices, cumulative = self.spawn_tables[min(floor, self.floors)]
+        return rng.choices(choices, cum_weights=cumulative)[0]
+
+    def stats(self, floor, enemy_id):
+        """
+        Stats d'un ennemi à un étage (lecture de table)
+
+        Args:
+            floor (int): Étage
+            enemy_id (int): Identifiant de l'ennemi
+
+        Returns:
+            tuple: (hp, attaque, défense, or)
+        """
+        if floor <= self.floors:
+            i = floor * len(self.ids) + enemy_id
+            return (self.hp_table[i], self.attack_table[i],
+                    self.defense_table[i], self.gold_table[i])
+        return tuple(_scaled(self.base[stat][enemy_id], self.scaling[stat], floor)
+                     for stat in STATS)
+
+
+def _scaled(base, per_floor, floor):
+    """
+    Stat d'un ennemi à un étage (progression linéaire, forme close)
+
+    Le coût ne dépend pas de l'étage : le mode infini s'appuie dessus au-delà
+    des tables précalculées.
+
+    Args:
+        base (int): Valeur à l'étage 1
+        per_floor (float): Augmentation relative par étage
+        floor (int): Étage
+
+    Returns:
+        int: Valeur à l'étage (plafonnée à STAT_LIMIT)
+    """
+    return min(STAT_LIMIT, int(base * (1 + (floor - 1) * per_floor)))
+
+
+# Catalogue partagé, compilé au démarrage
+ENEMY_CATALOG = EnemyCatalog()
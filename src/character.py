@@ -4,16 +4,49 @@ Module pour les personnages du jeu
 import pygame
 import random
 import os
+import weakref
+from .status import StatusEffects, NO_EFFECTS
+from .entities import DEFAULT_STORE
+from .ui import render_text, load_image
 from .constants import (
     WHITE, GREEN, RED, GRAY, DARK_GRAY, GOLD, LIGHT_BLUE,
-    DEFENSE_REDUCTION, ATTACK_VARIANCE
+    DEFENSE_REDUCTION, ATTACK_VARIANCE, STATUS_EFFECTS
 )
 
 
+def _stat(column, doc):
+    """
+    Crée une propriété lue et écrite dans une colonne du magasin d'entités
+
+    Args:
+        column (str): Nom de la colonne de EntityStore
+        doc (str): Description de la stat
+
+    Returns:
+        property: Propriété de Character
+    """
+    def fget(self):
+        return getattr(self.store, column)[self.row]
+
+    def fset(self, value):
+        getattr(self.store, column)[self.row] = value
+
+    return property(fget, fset, doc=doc)
+
+
 class Character:
-    """Classe de base pour les personnages"""
+    """Classe de base pour les personnages (vue sur une ligne d'un EntityStore)"""
 
-    def __init__(self, name, hp, max_hp, attack, defense, x, y, color=None):
+    __slots__ = ("store", "row", "name", "x", "y", "base_color", "effects", "nameplate",
+                 "_release", "__weakref__")
+
+    hp = _stat("hp", "Points de vie actuels")
+    max_hp = _stat("max_hp", "Points de vie maximum")
+    attack = _stat("attack", "Puissance d'attaque")
+    defense = _stat("defense", "Défense")
+    gold_reward = _stat("gold_reward", "Or gagné en battant ce personnage")
+
+    def __init__(self, name, hp, max_hp, attack, defense, x, y, color=None, store=DEFAULT_STORE):
         """
         Initialise un personnage
 
@@ -26,16 +59,54 @@ class Character:
             x (int): Position X à l'écran
             y (int): Position Y à l'écran
             color (tuple): Couleur du personnage (R, G, B) - optionnel
+            store (EntityStore): Magasin des stats - optionnel
         """
+        self.store = store
+        self.row = store.allocate(hp, max_hp, attack, defense)
+        # Libération unique de la ligne : explicite (release), sinon à la disparition du personnage
+        self._release = weakref.finalize(self, store.release, self.row)
+        self._release.atexit = False
         self.name = name
-        self.hp = hp
-        self.max_hp = max_hp
-        self.attack = attack
-        self.defense = defense
         self.x = x
         self.y = y
-        self.is_defending = False
         self.base_color = color  # Couleur personnalisée pour les ennemis
+        self.effects = NO_EFFECTS  # Poison, bonus, bouclier... (alloués au premier effet)
+        self.nameplate = None  # Nom rendu (voir render_nameplate)
+
+    def release(self):
+        """
+        Libère la ligne du personnage dans le magasin (sans effet la deuxième fois)
+
+        À appeler quand le personnage est remplacé : ses stats ne doivent plus être lues,
+        la ligne peut être réattribuée au prochain personnage créé.
+        """
+        self._release()
+
+    @property
+    def is_defending(self):
+        """True si le personnage est en posture défensive"""
+        return self.store.defending[self.row] != 0
+
+    @is_defending.setter
+    def is_defending(self, value):
+        self.store.defending[self.row] = 1 if value else 0
+
+    def add_effect(self, kind, power, duration):
+        """
+        Applique un effet de statut
+
+        Args:
+            kind (str): Type d'effet (clé de STATUS_EFFECTS)
+            power (int): Puissance de l'effet
+            duration (int): Durée en tours
+        """
+        if self.effects is NO_EFFECTS:
+            self.effects = StatusEffects()
+        self.effects.add(kind, power, duration)
+
+    def clear_effects(self):
+        """Retire tous les effets de statut"""
+        self.effects = NO_EFFECTS
 
     def take_damage(self, damage):
         """
@@ -47,24 +118,27 @@ class Character:
         Returns:
             int: Dégâts réellement subis après défense
         """
-        actual_damage = max(1, damage - self.defense)
+        actual_damage = max(1, damage - self.defense - self.effects.defense_bonus)
         if self.is_defending:
             actual_damage = int(actual_damage * DEFENSE_REDUCTION)
-        self.hp -= actual_damage
-        self.hp = max(0, self.hp)
+        actual_damage = self.effects.absorb(actual_damage)
+        hp = self.store.hp
+        hp[self.row] = max(0, hp[self.row] - actual_damage)
         return actual_damage
 
-    def attack_target(self, target):
+    def attack_target(self, target, rng=random):
         """
         Attaque une cible
 
         Args:
             target (Character): La cible à attaquer
+            rng: Générateur aléatoire (random.Random) - optionnel
 
         Returns:
             int: Dégâts infligés
         """
-        damage = self.attack + random.randint(-ATTACK_VARIANCE, ATTACK_VARIANCE)
+        damage = self.attack + self.effects.attack_bonus
+        damage += rng.randint(-ATTACK_VARIANCE, ATTACK_VARIANCE)
         actual_damage = target.take_damage(damage)
         return actual_damage
 
@@ -82,6 +156,36 @@ class Character:
         self.hp = min(self.max_hp, self.hp + amount)
         return self.hp - old_hp
 
+    def start_turn(self):
+        """
+        Début du tour du personnage : effets périodiques et expirations
+
+        Returns:
+            tuple: (variation de HP appliquée, True si le personnage est étourdi)
+        """
+        hp_delta, stunned = self.effects.tick()
+        if hp_delta > 0:
+            hp_delta = self.heal(hp_delta)
+        elif hp_delta < 0:
+            old_hp = self.hp
+            self.hp = max(0, self.hp + hp_delta)
+            hp_delta = self.hp - old_hp
+        return hp_delta, stunned
+
+    def render_nameplate(self, font_small):
+        """
+        Rend le nom du personnage une seule fois (préparable à l'avance)
+
+        Args:
+            font_small: Police pour le texte
+
+        Returns:
+            pygame.Surface: Nom rendu
+        """
+        if self.nameplate is None:
+            self.nameplate = font_small.render(self.name, True, WHITE)
+        return self.nameplate
+
     def is_alive(self):
         """
         Vérifie si le personnage est vivant
@@ -96,7 +200,7 @@ class Character:
         Dessine le personnage à l'écran
 
         Args:
-            surface: Surface pygame où dessiner
+            surface: Backend de rendu où dessiner (voir src.render)
             font_small: Police pour le texte
         """
         # Corps (cercle coloré selon HP)
@@ -106,10 +210,10 @@ class Character:
         else:
             # Couleur dynamique basée sur les HP pour le joueur
             color = GREEN if self.hp > self.max_hp // 2 else RED if self.hp > 0 else GRAY
-        pygame.draw.circle(surface, color, (self.x, self.y), 40)
+        surface.circle(color, (self.x, self.y), 40)
 
         # Nom
-        name_text = font_small.render(self.name, True, WHITE)
+        name_text = self.render_nameplate(font_small)
         name_rect = name_text.get_rect(center=(self.x, self.y - 60))
         surface.blit(name_text, name_rect)
 
@@ -120,31 +224,57 @@ class Character:
         bar_y = self.y + 50
 
         # Fond de la barre
-        pygame.draw.rect(surface, DARK_GRAY, (bar_x, bar_y, bar_width, bar_height))
+        surface.rect(DARK_GRAY, (bar_x, bar_y, bar_width, bar_height))
 
         # Barre de vie actuelle
         hp_ratio = self.hp / self.max_hp
         current_bar_width = int(bar_width * hp_ratio)
         hp_color = GREEN if hp_ratio > 0.5 else GOLD if hp_ratio > 0.25 else RED
-        pygame.draw.rect(surface, hp_color, (bar_x, bar_y, current_bar_width, bar_height))
+        surface.rect(hp_color, (bar_x, bar_y, current_bar_width, bar_height))
 
         # Bordure
-        pygame.draw.rect(surface, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
+        surface.rect(WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
 
         # Texte HP
-        hp_text = font_small.render(f"{self.hp}/{self.max_hp}", True, WHITE)
+        hp_text = render_text(font_small, f"{self.hp}/{self.max_hp}", WHITE)
         hp_rect = hp_text.get_rect(center=(self.x, bar_y + bar_height + 15))
         surface.blit(hp_text, hp_rect)
 
         # Indicateur de défense
         if self.is_defending:
-            shield_text = font_small.render("🛡️", True, LIGHT_BLUE)
+            shield_text = render_text(font_small, "🛡️", LIGHT_BLUE)
             surface.blit(shield_text, (self.x + 30, self.y - 30))
 
+        self._draw_effects(surface, font_small, bar_y + bar_height + 35)
+
+    def _draw_effects(self, surface, font_small, y):
+        """
+        Dessine les effets de statut actifs sous la barre de vie
+
+        Args:
+            surface: Backend de rendu où dessiner (voir src.render)
+            font_small: Police pour le texte
+            y (int): Position Y de la ligne d'effets
+        """
+        if not self.effects:
+            return
+        texts = []
+        for kind, power in self.effects.power.items():
+            effect = STATUS_EFFECTS[kind]
+            texts.append(render_text(font_small, f"{effect['name']} {power}", effect["color"]))
+
+        spacing = 10
+        x = self.x - (sum(text.get_width() for text in texts) + spacing * (len(texts) - 1)) // 2
+        for text in texts:
+            surface.blit(text, (x, y))
+            x += text.get_width() + spacing
+
 
 class ImageCharacter(Character):
     """Classe pour les personnages avec des images (sprites)"""
 
+    __slots__ = ("original_image", "image", "rect", "gray_image")
+
     def __init__(self, name, hp, max_hp, attack, defense, x, y, image_path, scale=2):
         """
         Initialise un personnage avec image
@@ -161,14 +291,12 @@ class ImageCharacter(Character):
             scale (int): Facteur d'échelle pour l'image (default: 2)
         """
         super().__init__(name, hp, max_hp, attack, defense, x, y)
+        self.gray_image = None  # Version grisée (personnage mort), créée au besoin
 
-        # Charger l'image
+        # Charger l'image (chargée et mise à l'échelle une seule fois, partagée entre les parties)
         try:
-            self.original_image = pygame.image.load(image_path).convert_alpha()
-            # Mettre à l'échelle l'image
-            width = self.original_image.get_width() * scale
-            height = self.original_image.get_height() * scale
-            self.image = pygame.transform.scale(self.original_image, (int(width), int(height)))
+            self.original_image = load_image(image_path)
+            self.image = load_image(image_path, scale)
             self.rect = self.image.get_rect(center=(x, y))
         except pygame.error as e:
             print(f"Erreur lors du chargement de l'image {image_path}: {e}")
@@ -180,17 +308,18 @@ class ImageCharacter(Character):
         Dessine le personnage avec son image à l'écran
 
         Args:
-            surface: Surface pygame où dessiner
+            surface: Backend de rendu où dessiner (voir src.render)
             font_small: Police pour le texte
         """
         # Dessiner l'image si elle existe
         if self.image and self.rect:
             # Appliquer un effet si mort
             if self.hp <= 0:
-                # Image en gris si mort
-                gray_image = self.image.copy()
-                gray_image.fill((128, 128, 128, 128), special_flags=pygame.BLEND_RGBA_MULT)
-                surface.blit(gray_image, self.rect)
+                # Image en gris si mort (calculée une seule fois)
+                if self.gray_image is None:
+                    self.gray_image = self.image.copy()
+                    self.gray_image.fill((128, 128, 128, 128), special_flags=pygame.BLEND_RGBA_MULT)
+                surface.blit(self.gray_image, self.rect)
             else:
                 surface.blit(self.image, self.rect)
         else:
@@ -199,7 +328,7 @@ class ImageCharacter(Character):
             return
 
         # Nom
-        name_text = font_small.render(self.name, True, WHITE)
+        name_text = self.render_nameplate(font_small)
         name_rect = name_text.get_rect(center=(self.x, self.y - self.rect.height // 2 - 20))
         surface.blit(name_text, name_rect)
 
@@ -210,23 +339,25 @@ class ImageCharacter(Character):
         bar_y = self.y + self.rect.height // 2 + 10
 
         # Fond de la barre
-        pygame.draw.rect(surface, DARK_GRAY, (bar_x, bar_y, bar_width, bar_height))
+        surface.rect(DARK_GRAY, (bar_x, bar_y, bar_width, bar_height))
 
         # Barre de vie actuelle
         hp_ratio = self.hp / self.max_hp
         current_bar_width = int(bar_width * hp_ratio)
         hp_color = GREEN if hp_ratio > 0.5 else GOLD if hp_ratio > 0.25 else RED
-        pygame.draw.rect(surface, hp_color, (bar_x, bar_y, current_bar_width, bar_height))
+        surface.rect(hp_color, (bar_x, bar_y, current_bar_width, bar_height))
 
         # Bordure
-        pygame.draw.rect(surface, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
+        surface.rect(WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
 
         # Texte HP
-        hp_text = font_small.render(f"{self.hp}/{self.max_hp}", True, WHITE)
+        hp_text = render_text(font_small, f"{self.hp}/{self.max_hp}", WHITE)
         hp_rect = hp_text.get_rect(center=(self.x, bar_y + bar_height + 15))
         surface.blit(hp_text, hp_rect)
 
         # Indicateur de défense
         if self.is_defending:
-            shield_text = font_small.render("🛡️", True, LIGHT_BLUE)
+            shield_text = render_text(font_small, "🛡️", LIGHT_BLUE)
             surface.blit(shield_text, (self.x + self.rect.width // 2, self.y - self.rect.height // 2))
+
+        self._draw_effects(surface, font_small, bar_y + bar_height + 35)
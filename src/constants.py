@@ -33,48 +33,21 @@ PLAYER_Y = 300
 ENEMY_X = 600
 ENEMY_Y = 300
 
-# Types d'ennemis - Structure : (nom, hp, attaque, défense, couleur, récompense_or)
-ENEMY_TYPES = {
-    "goblin": {
-        "name": "Goblin",
-        "hp": 40,
-        "attack": 12,
-        "defense": 2,
-        "color": GREEN,
-        "gold": 10
-    },
-    "orc": {
-        "name": "Orc",
-        "hp": 70,
-        "attack": 18,
-        "defense": 5,
-        "color": ORANGE,
-        "gold": 25
-    },
-    "troll": {
-        "name": "Troll",
-        "hp": 100,
-        "attack": 22,
-        "defense": 8,
-        "color": PURPLE,
-        "gold": 40
-    },
-    "demon": {
-        "name": "Démon",
-        "hp": 140,
-        "attack": 28,
-        "defense": 10,
-        "color": DARK_RED,
-        "gold": 60
-    },
-    "dragon": {
-        "name": "Dragon",
-        "hp": 200,
-        "attack": 35,
-        "defense": 15,
-        "color": GOLD,
-        "gold": 100
-    }
+# Types d'ennemis : voir data/enemies.json (chargé par src/catalog.py)
+
+# Récompenses proposées après chaque victoire (l'ordre sert de code de sérialisation)
+REWARD_TYPES = ["hp", "attack", "defense", "potions"]
+
+# Effets de statut - Règles de cumul :
+#   stack   : chaque application s'ajoute avec sa propre durée
+#   refresh : une seule instance, puissance maximale et durée réinitialisée
+STATUS_EFFECTS = {
+    "poison": {"name": "Poison", "stacking": "stack", "color": GREEN},
+    "regen": {"name": "Régén", "stacking": "refresh", "color": LIGHT_BLUE},
+    "attack_up": {"name": "Atk+", "stacking": "refresh", "color": ORANGE},
+    "defense_up": {"name": "Déf+", "stacking": "refresh", "color": BLUE},
+    "shield": {"name": "Bouclier", "stacking": "refresh", "color": WHITE},
+    "stun": {"name": "Étourdi", "stacking": "refresh", "color": GOLD},
 }
 
 # Objets
@@ -85,8 +58,64 @@ POTION_HEAL_AMOUNT = 30
 DEFENSE_REDUCTION = 0.5  # Réduction de 50% des dégâts en défense
 ATTACK_VARIANCE = 3  # Variance aléatoire de l'attaque (+/- X)
 ENEMY_ACTION_DELAY = 1500  # Délai en ms avant l'action de l'ennemi
-MESSAGE_DURATION = 120  # Durée d'affichage des messages (frames)
+MESSAGE_DURATION = 2000  # Durée d'affichage des messages (ms)
+TEXT_CACHE_SIZE = 256  # Textes rendus conservés (voir ui.render_text)
+LATENCY_SAMPLES = 1000  # Latences entrée -> écran conservées
+LOW_LATENCY_POLL_MS = 1  # Intervalle de lecture des entrées en mode faible latence (ms)
 
 # Roguelike
 MAX_FLOOR = 20  # Nombre d'étages maximum
 FLOOR_HEAL_PERCENT = 0.3  # Pourcentage de HP restaurés entre les étages
+MESSAGE_LOG_SIZE = 64  # Messages conservés dans le journal (tampon circulaire)
+STAT_LIMIT = 2 ** 31 - 1  # Plafond des stats (colonnes int32, mode infini)
+
+# Profilage des frames (RPG_PROFILE=1 ou F3)
+PROFILER_FRAMES = 600  # Frames conservées dans le tampon circulaire
+PROFILER_EVENTS_PER_FRAME = 32  # Phases conservées par frame
+PROFILER_TRACE_FILE = "frame_trace.json"  # Trace Chrome écrite en quittant
+
+# Ramasse-miettes (voir src/gcpolicy.py, RPG_GC=0 pour le comportement par défaut de Python)
+GC_FRAMES = 600  # Pauses par frame conservées
+GC_DEFERRAL_LIMIT = 20  # Collecte de génération 0 forcée au-delà de N fois son seuil (longue animation)
+
+# Travaux d'arrière-plan (voir src/jobs.py)
+JOB_BUDGET_MS = 2.0  # Temps accordé aux travaux par frame
+
+# Tâches asyncio à côté de la boucle de frames (voir src/runtime.py)
+RUNTIME_WORKERS = 2  # Processus du pool de calcul (simulations, IA)
+RUNTIME_SHUTDOWN_TIMEOUT = 5.0  # Attente maximale des écritures en cours à la fermeture (s)
+
+# Effets visuels (voir src/effects.py)
+EFFECT_POOL_SIZE = 512  # Effets simultanés au maximum (nombres flottants, éclairs)
+EFFECT_NUMBER_MS = 900  # Durée d'un nombre flottant
+EFFECT_RISE = 40  # Montée d'un nombre flottant en pixels
+EFFECT_FLASH_MS = 200  # Durée d'un éclair d'impact
+EFFECT_FLASH_RADIUS = 50  # Rayon final d'un éclair d'impact
+
+# Mode Horde
+HORDE_ARENA = (330, 100, 460, 360)  # Zone de l'arène (x, y, largeur, hauteur)
+HORDE_BASE_SIZE = 8  # Ennemis au premier étage
+HORDE_SIZE_PER_FLOOR = 6  # Ennemis supplémentaires par étage
+HORDE_MAX_SIZE = 500  # Taille maximum d'une horde
+HORDE_HP_SCALE = 0.3  # HP des ennemis de horde par rapport à un ennemi d'étage
+HORDE_ATTACKERS = 3  # Nombre d'ennemis qui attaquent à chaque tour
+
+# Sauvegarde
+SAVE_FILE = "savegame.dat"  # Fichier de sauvegarde automatique de la run
+HISTORY_DIR = "run_history"  # Historique colonnaire des runs terminées
+LEADERBOARD_DB = "leaderboard.db"  # Classement et statistiques cumulées (SQLite)
+LEADERBOARD_SIZE = 10  # Nombre d'entrées affichées dans le classement
+
+# Options (écran Options, conservées entre les lancements)
+SETTINGS_FILE = "settings.json"
+IDLE_FPS = 10  # FPS au repos quand le ralenti est activé
+IDLE_TIMEOUT = 5000  # Délai en ms sans entrée avant le ralenti
+
+# Serveur headless
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
+SERVER_BACKLOG = 4096  # Connexions en attente (milliers de clients simultanés)
+
+# Métriques Prometheus (voir src/metrics.py, RPG_METRICS)
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = 9108
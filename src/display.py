@@ -0,0 +1,270 @@
+"""
+Module d'affichage - Fenêtre, image interne et présentation
+
+La mise en page est toujours celle d'un écran de SCREEN_WIDTH x
+SCREEN_HEIGHT (elle ne dépend jamais de la fenêtre). Le jeu dessine dans une
+image interne de cette taille multipliée par la résolution interne (option
+render_scale : 50 % divise par quatre les pixels dessinés, sur les machines
+modestes ; l'image réduite est agrandie sans lissage). L'image est mise à
+l'échelle une seule fois par frame modifiée vers la fenêtre, quelle que soit
+sa taille : fenêtre redimensionnable, plein écran, lissage ou facteur entier
+(pixel art net), avec des bandes noires pour garder les proportions. La zone
+cible est calculée au redimensionnement, pas à chaque frame.
+
+La résolution interne, le mode de la fenêtre ou la synchro verticale peuvent
+changer en cours de partie : le menu et les parties gardent le même backend
+de dessin, seule sa surface est remplacée.
+
+Avec le backend "texture" (option Rendu ou RPG_RENDERER=texture), la fenêtre
+est ouverte par pygame._sdl2.video : le menu et les parties composent des
+textures avec un renderer SDL (accéléré si possible, sinon le renderer
+logiciel), qui met l'image 800x600 à l'échelle et ramène lui-même la souris
+dans ses coordonnées. Le pixel art n'y a pas de facteur entier : le lissage
+suit SDL_RENDER_SCALE_QUALITY. La résolution interne n'y change rien (le
+renderer compose directement à la taille de la fenêtre).
+"""
+import pygame
+from .render import SurfaceBackend, TextureBackend
+from .constants import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK
+
+RENDERER_ENV = "RPG_RENDERER"
+RENDERER_BACKENDS = ("surface", "texture")
+
+# Événements dont la position est exprimée en pixels de la fenêtre
+MOUSE_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+
+def fit_rect(window_size, pixel_art=False, image_size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+    """
+    Zone de la fenêtre où présenter l'image interne (proportions conservées)
+
+    Args:
+        window_size (tuple): Taille de la fenêtre
+        pixel_art (bool): Facteur d'échelle entier (si la fenêtre le permet)
+        image_size (tuple): Taille de l'image interne - optionnel
+
+    Returns:
+        pygame.Rect: Zone centrée dans la fenêtre
+    """
+    window_width, window_height = window_size
+    image_width, image_height = image_size
+    factor = min(window_width / image_width, window_height / image_height)
+    if pixel_art and factor >= 1:
+        factor = int(factor)
+    width = max(1, round(image_width * factor))
+    height = max(1, round(image_height * factor))
+    return pygame.Rect((window_width - width) // 2, (window_height - height) // 2, width, height)
+
+
+class Display:
+    """Fenêtre du jeu et image interne présentée à l'échelle de la fenêtre"""
+
+    def __init__(self, caption="RPG Roguelike", backend="surface"):
+        """
+        Initialise l'image interne (la fenêtre est ouverte par configure)
+
+        Args:
+            caption (str): Titre de la fenêtre
+            backend (str): "surface" (image interne pygame) ou "texture" (renderer SDL)
+        """
+        self.caption = caption
+        self.texture_mode = backend == "texture"
+        if self.texture_mode:
+            try:
+                from pygame._sdl2 import video  # noqa: F401  (module expérimental de pygame 2)
+            except ImportError as e:
+                print(f"Backend texture indisponible, rendu sur surface: {e}")
+                self.texture_mode = False
+        self.canvas = None if self.texture_mode else pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.backend = None if self.texture_mode else SurfaceBackend(self.canvas)
+        self.render_scale = 1.0  # Taille de l'image interne par rapport à la mise en page
+        self.renderer = None  # Renderer SDL (backend "texture")
+        self.window = None
+        self.mode = None  # (synchro verticale, plein écran) de la fenêtre ouverte
+        self.vsync = False
+        self.pixel_art = False
+        self.target_rect = None  # Zone de la fenêtre où l'image est présentée
+        self._target = None  # Sous-surface de la fenêtre correspondante
+        self.dirty = True  # Image interne modifiée (ou fenêtre à repeindre) depuis la présentation
+
+    def configure(self, render_scale=1.0, vsync=False, fullscreen=False, pixel_art=False):
+        """
+        Ouvre ou reconfigure la fenêtre et l'image interne (sans effet si rien ne change)
+
+        Args:
+            render_scale (float): Taille de l'image interne par rapport à la mise en page
+            vsync (bool): Synchro verticale demandée
+            fullscreen (bool): Plein écran à la résolution du bureau
+            pixel_art (bool): Mise à l'échelle par facteur entier, sans lissage
+
+        Returns:
+            bool: True si la synchro verticale est active
+        """
+        if self.texture_mode:
+            return self._configure_renderer((vsync, fullscreen))
+        if render_scale != self.render_scale or pixel_art != self.pixel_art:
+            self._resize_canvas(render_scale, pixel_art)
+        mode = (vsync, fullscreen)
+        if self.window is not None and mode == self.mode:
+            return self.vsync
+        if fullscreen:
+            size, flags = (0, 0), pygame.FULLSCREEN
+        else:
+            size, flags = (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE
+
+        self.window = None
+        if vsync:
+            # La synchro verticale passe par le renderer SDL (drapeau SCALED)
+            try:
+                self.window = pygame.display.set_mode(size, flags | pygame.SCALED, vsync=1)
+            except pygame.error as e:
+                print(f"Synchro verticale indisponible: {e}")
+                vsync = False
+        if self.window is None:
+            self.window = pygame.display.set_mode(size, flags)
+        pygame.display.set_caption(self.caption)
+        self.mode = mode
+        self.vsync = vsync
+        self._layout()
+        return vsync
+
+    def _resize_canvas(self, render_scale, pixel_art):
+        """
+        Recrée l'image interne à la résolution demandée (même backend de dessin)
+
+        Args:
+            render_scale (float): Taille de l'image interne par rapport à la mise en page
+            pixel_art (bool): Images réduites sans lissage
+        """
+        size = (round(SCREEN_WIDTH * render_scale), round(SCREEN_HEIGHT * render_scale))
+        if self.canvas.get_size() != size:
+            self.canvas = pygame.Surface(size)
+        self.backend.set_surface(self.canvas, (SCREEN_WIDTH, SCREEN_HEIGHT), render_scale,
+                                 smooth=not pixel_art)
+        self.render_scale = render_scale
+        self.pixel_art = pixel_art
+        if self.window is not None:
+            self._layout()
+
+    def _configure_renderer(self, mode):
+        """
+        Ouvre ou reconfigure la fenêtre du backend "texture"
+
+        Args:
+            mode (tuple): (synchro verticale, plein écran)
+
+        Returns:
+            bool: True si la synchro verticale est active
+        """
+        from pygame._sdl2.video import Window
+        if self.window is not None and mode == self.mode:
+            return self.vsync
+        vsync, fullscreen = mode
+        size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        if self.window is not None and vsync != self.vsync:
+            # La synchro est fixée à la création du renderer, lié à sa fenêtre : les deux sont recréés
+            self.backend.reset(None)  # Libère les textures de l'ancien renderer
+            self.renderer = None
+            self.window = None
+        if self.window is None:
+            self.window = Window(self.caption, size, resizable=True)
+            self.renderer, vsync = self._create_renderer(vsync)
+            self.renderer.logical_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+            if self.backend is None:
+                self.backend = TextureBackend(self.renderer, (SCREEN_WIDTH, SCREEN_HEIGHT))
+            else:
+                self.backend.reset(self.renderer)
+        elif not fullscreen:
+            self.window.set_windowed()
+            self.window.size = size
+        if fullscreen:
+            self.window.set_fullscreen(desktop=True)
+        self.mode = mode
+        self.vsync = vsync
+        self.dirty = True
+        return vsync
+
+    def _create_renderer(self, vsync):
+        """
+        Crée le renderer de la fenêtre (accéléré, sinon logiciel)
+
+        Args:
+            vsync (bool): Synchro verticale demandée
+
+        Returns:
+            tuple: (renderer, synchro verticale active)
+        """
+        from pygame._sdl2.video import Renderer
+        from pygame._sdl2.sdl2 import error as SDLError
+        try:
+            return Renderer(self.window, accelerated=1, vsync=vsync), vsync
+        except (pygame.error, SDLError) as e:
+            print(f"Renderer accéléré indisponible, renderer logiciel: {e}")
+        try:
+            return Renderer(self.window, accelerated=0, vsync=vsync), vsync
+        except (pygame.error, SDLError) as e:
+            if not vsync:
+                raise
+            print(f"Synchro verticale indisponible: {e}")
+        return Renderer(self.window, accelerated=0), False
+
+    def _layout(self):
+        """Calcule la zone de présentation pour la taille actuelle de la fenêtre"""
+        self.target_rect = fit_rect(self.window.get_size(), self.pixel_art, self.canvas.get_size())
+        self.window.fill(BLACK)  # Bandes autour de l'image
+        self._target = self.window.subsurface(self.target_rect)
+        self.dirty = True
+
+    def handle_event(self, event):
+        """
+        Suit les changements de la fenêtre (redimensionnement, fenêtre réaffichée)
+
+        Args:
+            event: Événement pygame
+        """
+        if event.type == pygame.VIDEORESIZE:
+            if not self.texture_mode:
+                self._layout()
+        elif event.type == pygame.WINDOWEXPOSED:
+            self.dirty = True
+
+    def map_events(self, events):
+        """
+        Suit la fenêtre et ramène la position des événements souris dans l'image interne
+
+        Args:
+            events (list): Événements lus (modifiés sur place)
+
+        Returns:
+            list: Les mêmes événements
+        """
+        for event in events:
+            if event.type in MOUSE_EVENTS:
+                if self.texture_mode:
+                    continue  # Le renderer SDL ramène la souris dans sa taille logique
+                rect = self.target_rect
+                if rect.size != (SCREEN_WIDTH, SCREEN_HEIGHT) or rect.topleft != (0, 0):
+                    x, y = event.pos
+                    event.pos = ((x - rect.x) * SCREEN_WIDTH // rect.width,
+                                 (y - rect.y) * SCREEN_HEIGHT // rect.height)
+            else:
+                self.handle_event(event)
+        return events
+
+    def present(self):
+        """Présente l'image interne (mise à l'échelle seulement si elle a changé)"""
+        if self.texture_mode:
+            self.renderer.present()
+            self.dirty = False
+            return
+        if self.dirty:
+            size = self.target_rect.size
+            if size == self.canvas.get_size():
+                self._target.blit(self.canvas, (0, 0))
+            elif self.pixel_art or self.render_scale < 1:
+                # Image réduite : agrandissement au plus proche (le lissage coûterait plus que le gain)
+                pygame.transform.scale(self.canvas, size, self._target)
+            else:
+                pygame.transform.smoothscale(self.canvas, size, self._target)
+            self.dirty = False
+        pygame.display.flip()
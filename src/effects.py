@@ -0,0 +1,237 @@
+"""
+Module des effets visuels - Nombres flottants et éclairs d'impact
+
+Les dégâts et les soins apparaissent au-dessus du personnage touché et
+montent avant de disparaître ; un coup fait aussi un éclair (anneau qui
+s'élargit et s'affine). Rien n'est alloué une fois la partie lancée :
+
+- les chiffres sont rendus une seule fois dans un atlas par couleur
+  (DigitAtlas) et dessinés glyphe par glyphe (sous-surfaces de l'atlas) ;
+- les effets sont des objets à __slots__ préalloués (EFFECT_POOL_SIZE) ; un
+  effet terminé est échangé avec le dernier effet actif, sans liste recréée ;
+- le mouvement dépend du temps écoulé (pygame.time.get_ticks), pas du nombre
+  de frames : la vitesse ne change pas avec les FPS.
+
+Quand le pool est plein, les nouveaux effets sont ignorés (compteur dropped).
+"""
+import pygame
+from .constants import (
+    RED, GREEN, WHITE,
+    EFFECT_POOL_SIZE, EFFECT_NUMBER_MS, EFFECT_RISE, EFFECT_FLASH_MS, EFFECT_FLASH_RADIUS
+)
+
+# Glyphes de l'atlas : chiffres 0 à 9, puis signes
+GLYPHS = "0123456789+-"
+PLUS = 10
+MINUS = 11
+
+# Couleurs de l'atlas (index utilisés par les effets)
+DAMAGE = 0
+HEAL = 1
+ATLAS_COLORS = (RED, GREEN)
+
+# Types d'effets
+NUMBER = 0
+FLASH = 1
+
+
+class DigitAtlas:
+    """Chiffres et signes rendus une fois, par couleur"""
+
+    def __init__(self, font, colors=ATLAS_COLORS):
+        """
+        Rend l'atlas de chaque couleur
+
+        Args:
+            font: Police pygame des nombres
+            colors (tuple): Couleurs (R, G, B), dans l'ordre des index utilisés
+        """
+        self.atlases = []  # Une surface par couleur (tous les glyphes côte à côte)
+        self.glyphs = []  # Par couleur : sous-surface de chaque glyphe
+        self.widths = [font.size(char)[0] for char in GLYPHS]
+        self.height = font.get_height()
+        for color in colors:
+            atlas = pygame.Surface((sum(self.widths), self.height), pygame.SRCALPHA)
+            glyphs = []
+            x = 0
+            for char, width in zip(GLYPHS, self.widths):
+                atlas.blit(font.render(char, True, color), (x, 0))
+                glyphs.append(atlas.subsurface((x, 0, width, self.height)))
+                x += width
+            self.atlases.append(atlas)
+            self.glyphs.append(glyphs)
+
+    def number_width(self, value):
+        """
+        Largeur d'un nombre signé
+
+        Args:
+            value (int): Valeur absolue affichée
+
+        Returns:
+            int: Largeur en pixels (signe compris)
+        """
+        widths = self.widths
+        width = widths[PLUS]
+        while True:
+            value, digit = divmod(value, 10)
+            width += widths[digit]
+            if not value:
+                return width
+
+    def draw_number(self, surface, value, sign, color, right, y):
+        """
+        Dessine un nombre signé, chiffre par chiffre, de droite à gauche
+
+        Args:
+            surface: Backend de rendu où dessiner (voir src.render)
+            value (int): Valeur absolue affichée
+            sign (int): PLUS ou MINUS
+            color (int): Index de la couleur de l'atlas
+            right (int): Bord droit du nombre
+            y (int): Haut du nombre
+        """
+        glyphs = self.glyphs[color]
+        widths = self.widths
+        x = right
+        while True:
+            value, digit = divmod(value, 10)
+            x -= widths[digit]
+            surface.blit(glyphs[digit], (x, y))
+            if not value:
+                break
+        surface.blit(glyphs[sign], (x - widths[sign], y))
+
+
+class Effect:
+    """Effet du pool (nombre flottant ou éclair), réutilisé d'un effet à l'autre"""
+
+    __slots__ = ("kind", "x", "y", "value", "sign", "color", "right", "start", "duration")
+
+    def __init__(self):
+        """Initialise un effet inactif"""
+        self.kind = NUMBER
+        self.x = 0
+        self.y = 0
+        self.value = 0
+        self.sign = MINUS
+        self.color = DAMAGE
+        self.right = 0  # Bord droit d'un nombre (largeur calculée à la création)
+        self.start = 0
+        self.duration = 1
+
+
+class EffectLayer:
+    """Effets actifs, pris dans un pool préalloué"""
+
+    def __init__(self, font, capacity=EFFECT_POOL_SIZE, clock=pygame.time.get_ticks):
+        """
+        Initialise le pool et l'atlas des chiffres
+
+        Args:
+            font: Police des nombres
+            capacity (int): Effets simultanés au maximum - optionnel
+            clock: Fonction qui renvoie le temps en ms - optionnel
+        """
+        self.atlas = DigitAtlas(font)
+        self.pool = [Effect() for _ in range(capacity)]
+        self.count = 0  # Les count premiers effets du pool sont actifs
+        self.spawned = 0  # Effets créés (décalage horizontal des nombres)
+        self.dropped = 0  # Effets ignorés, pool plein
+        self.clock = clock
+
+    def _acquire(self, kind, x, y, duration):
+        """
+        Réserve un effet du pool
+
+        Args:
+            kind (int): NUMBER ou FLASH
+            x (int): Position X
+            y (int): Position Y
+            duration (int): Durée en ms
+
+        Returns:
+            Effect: Effet réservé, ou None si le pool est plein
+        """
+        if self.count == len(self.pool):
+            self.dropped += 1
+            return None
+        effect = self.pool[self.count]
+        self.count += 1
+        self.spawned += 1
+        effect.kind = kind
+        effect.x = x
+        effect.y = y
+        effect.start = self.clock()
+        effect.duration = duration
+        return effect
+
+    def spawn_number(self, x, y, delta):
+        """
+        Nombre flottant d'un changement de HP
+
+        Args:
+            x (int): Centre horizontal
+            y (int): Hauteur de départ
+            delta (int): Variation de HP (négative : dégâts, positive : soin)
+        """
+        # Décalage déterministe : des nombres successifs au même endroit ne se recouvrent pas
+        effect = self._acquire(NUMBER, x + (self.spawned % 5 - 2) * 14, y, EFFECT_NUMBER_MS)
+        if effect is not None:
+            if delta < 0:
+                effect.value, effect.sign, effect.color = -delta, MINUS, DAMAGE
+            else:
+                effect.value, effect.sign, effect.color = delta, PLUS, HEAL
+            effect.right = effect.x + self.atlas.number_width(effect.value) // 2
+
+    def spawn_flash(self, x, y):
+        """
+        Éclair d'impact (anneau qui s'élargit)
+
+        Args:
+            x (int): Centre X
+            y (int): Centre Y
+        """
+        self._acquire(FLASH, x, y, EFFECT_FLASH_MS)
+
+    def clear(self):
+        """Retire tous les effets (ils restent dans le pool)"""
+        self.count = 0
+
+    def update(self):
+        """Retire les effets terminés (échangés avec le dernier effet actif)"""
+        now = self.clock()
+        pool = self.pool
+        i = 0
+        while i < self.count:
+            effect = pool[i]
+            if now - effect.start >= effect.duration:
+                self.count -= 1
+                pool[i], pool[self.count] = pool[self.count], effect
+            else:
+                i += 1
+
+    def draw(self, surface):
+        """
+        Dessine les effets actifs à leur position du moment
+
+        Args:
+            surface: Backend de rendu où dessiner (voir src.render)
+        """
+        now = self.clock()
+        atlas = self.atlas
+        pool = self.pool
+        for i in range(self.count):
+            effect = pool[i]
+            progress = (now - effect.start) / effect.duration
+            if progress >= 1:
+                continue
+            if effect.kind == NUMBER:
+                # Montée rapide puis ralentie
+                rise = EFFECT_RISE * (1 - (1 - progress) ** 2)
+                atlas.draw_number(surface, effect.value, effect.sign, effect.color,
+                                  effect.right, int(effect.y - rise))
+            else:
+                radius = int(EFFECT_FLASH_RADIUS * (0.4 + 0.6 * progress))
+                surface.circle(WHITE, (effect.x, effect.y), radius,
+                               max(1, int(6 * (1 - progress))))
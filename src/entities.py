@@ -0,0 +1,140 @@
+"""
+Module de stockage des entités - Stats de tous les combattants en colonnes typées
+
+Les stats (HP, attaque, défense, défense active, récompense) vivent dans des
+array.array partagés ; un Character n'est qu'une vue sur une ligne. Les
+opérations groupées (effets périodiques de toute une horde, ennemis vivants)
+s'exécutent avec numpy, sinon avec une boucle Python équivalente.
+"""
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # numpy absent (voir requirements.txt) : boucles Python
+    np = None
+
+# Colonnes : nom -> typecode array
+COLUMNS = {
+    "hp": "i",
+    "max_hp": "i",
+    "attack": "i",
+    "defense": "i",
+    "defending": "b",
+    "gold_reward": "i",
+}
+
+
+class EntityStore:
+    """Tableau de stats des combattants, une ligne par entité"""
+
+    def __init__(self):
+        """Initialise un magasin vide"""
+        self.hp = array("i")
+        self.max_hp = array("i")
+        self.attack = array("i")
+        self.defense = array("i")
+        self.defending = array("b")
+        self.gold_reward = array("i")
+        self._free = []  # Lignes libérées, réutilisées en priorité
+
+    def __len__(self):
+        """Nombre de lignes allouées (libres comprises)"""
+        return len(self.hp)
+
+    def allocate(self, hp, max_hp, attack, defense):
+        """
+        Réserve une ligne pour une nouvelle entité
+
+        Args:
+            hp (int): Points de vie actuels
+            max_hp (int): Points de vie maximum
+            attack (int): Puissance d'attaque
+            defense (int): Défense
+
+        Returns:
+            int: Index de la ligne
+        """
+        if self._free:
+            row = self._free.pop()
+            self.hp[row] = hp
+            self.max_hp[row] = max_hp
+            self.attack[row] = attack
+            self.defense[row] = defense
+            self.defending[row] = 0
+            self.gold_reward[row] = 0
+            return row
+
+        self.hp.append(hp)
+        self.max_hp.append(max_hp)
+        self.attack.append(attack)
+        self.defense.append(defense)
+        self.defending.append(0)
+        self.gold_reward.append(0)
+        return len(self.hp) - 1
+
+    def release(self, row):
+        """
+        Libère une ligne (l'entité n'existe plus)
+
+        Args:
+            row (int): Index de la ligne
+        """
+        self.hp[row] = 0
+        self._free.append(row)
+
+    def change_hp_many(self, rows, deltas):
+        """
+        Applique une variation de HP à plusieurs entités (effets périodiques)
+
+        Les HP restent entre 0 et les HP maximum de chaque entité ; la
+        défense ne s'applique pas (poison et régénération, voir Character.start_turn).
+
+        Args:
+            rows (list): Index des lignes ciblées
+            deltas (list): Variation de HP de chaque cible (négative : dégâts)
+
+        Returns:
+            list: Variation réellement appliquée à chaque cible
+        """
+        if np is not None and len(rows) > 16:
+            index = np.asarray(rows, dtype=np.intp)
+            # Vue temporaire sans copie (relâchée avant tout redimensionnement)
+            hp = np.frombuffer(self.hp, dtype=np.int32)
+            old = hp[index]
+            new = np.clip(old + np.asarray(deltas, dtype=np.int32), 0,
+                          np.frombuffer(self.max_hp, dtype=np.int32)[index])
+            hp[index] = new
+            result = (new - old).tolist()
+            del hp
+            return result
+
+        hp = self.hp
+        max_hp = self.max_hp
+        result = []
+        for row, delta in zip(rows, deltas):
+            old = hp[row]
+            hp[row] = min(max_hp[row], max(0, old + delta))
+            result.append(hp[row] - old)
+        return result
+
+    def count_alive(self, rows):
+        """
+        Compte les entités vivantes
+
+        Args:
+            rows (list): Index des lignes
+
+        Returns:
+            int: Nombre d'entités avec des HP > 0
+        """
+        if np is not None and len(rows) > 16:
+            hp = np.frombuffer(self.hp, dtype=np.int32)
+            count = int(np.count_nonzero(hp[np.asarray(rows, dtype=np.intp)] > 0))
+            del hp
+            return count
+        hp = self.hp
+        return sum(1 for row in rows if hp[row] > 0)
+
+
+# Magasin partagé par défaut de tous les personnages
+DEFAULT_STORE = EntityStore()
@@ -4,40 +4,65 @@ Module principal du jeu - Gestion de la logique de jeu (Roguelike)
 import pygame
 import random
 import os
+import time
+from collections import deque
+from itertools import islice
 from .character import Character, ImageCharacter
-from .ui import Button
+from .entities import DEFAULT_STORE
+from .catalog import ENEMY_CATALOG
+from .ui import Button, render_text
+from .effects import EffectLayer
+from .profiler import PROFILER
+from .render import as_backend
+from . import save
 from .constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, RED, GREEN, BLUE,
     GOLD, GRAY, PURPLE, PLAYER_HP, PLAYER_ATTACK, PLAYER_DEFENSE, PLAYER_X, PLAYER_Y,
     ENEMY_X, ENEMY_Y, STARTING_POTIONS, POTION_HEAL_AMOUNT,
-    ENEMY_ACTION_DELAY, MESSAGE_DURATION, ENEMY_TYPES, MAX_FLOOR, FLOOR_HEAL_PERCENT, DARK_GRAY
+    ENEMY_ACTION_DELAY, MESSAGE_DURATION, MAX_FLOOR, FLOOR_HEAL_PERCENT, DARK_GRAY,
+    REWARD_TYPES, STATUS_EFFECTS, MESSAGE_LOG_SIZE
 )
 
 
 class Game:
     """Classe principale du jeu - Version Roguelike"""
 
-    def __init__(self, screen, font_large, font_medium, font_small):
+    # Magasin des stats des ennemis (colonnes typées, voir entities.py)
+    entity_store = DEFAULT_STORE
+    # Catalogue d'ennemis compilé (voir catalog.py)
+    catalog = ENEMY_CATALOG
+    # Délai en ms avant l'action de l'ennemi (option « Tour ennemi »)
+    enemy_action_delay = ENEMY_ACTION_DELAY
+    # Ordonnanceur des travaux d'arrière-plan (voir jobs.py ; None = travaux exécutés aussitôt)
+    jobs = None
+
+    def __init__(self, screen, font_large, font_medium, font_small, autosaver=None, seed=None,
+                 endless=False):
         """
         Initialise le jeu
 
         Args:
-            screen: Surface pygame principale
+            screen: Backend de rendu ou surface pygame principale (voir src.render)
             font_large: Grande police
             font_medium: Police moyenne
             font_small: Petite police
+            autosaver (Autosaver): Sauvegarde automatique après chaque récompense - optionnel
+            seed (int): Graine de la run (aléatoire si None) - optionnel
+            endless (bool): Mode infini, sans étage final - optionnel
         """
-        self.screen = screen
+        self.screen = as_backend(screen)
         self.font_large = font_large
         self.font_medium = font_medium
         self.font_small = font_small
+        self.autosaver = autosaver
+        self.endless = endless
+        self.run_listeners = []  # Fonctions appelées avec run_summary() en fin de run
+        self.start_listeners = []  # Fonctions appelées avec la partie au début de chaque run
 
-        # Statistiques de la run
-        self.floor = 1
-        self.gold = 0
-        self.enemies_killed = 0
-        self.total_damage_dealt = 0
-        self.total_damage_taken = 0
+        # Récompenses des derniers étages (toute la run hors mode infini)
+        self.reward_history = deque(maxlen=MAX_FLOOR)
+        # Journal des derniers messages : taille fixe, même après des heures de jeu
+        self.message_log = deque(maxlen=MESSAGE_LOG_SIZE)
 
         # Stats de base du joueur (pour reset)
         self.base_hp = PLAYER_HP
@@ -47,24 +72,27 @@ class Game:
         # Personnages
         self.player = None
         self.enemy = None
-        self._init_player()
-        self._spawn_enemy()
-
-        # Inventaire
+        self.enemy_type = None  # Clé de l'ennemi dans le catalogue
+        self.enemy_id = None  # Identifiant de l'ennemi (index des tables du catalogue)
+        self._title = (None, None)  # Titre de l'étage rendu : (étage, surface)
+        self.last_transition_ms = 0.0  # Durée du dernier changement d'étage (clic inclus)
+        self.rng = random.Random()
+        self.state = None
+        self._prefetch_job = None  # Préparation de l'étage suivant en cours (voir Game.jobs)
+        self._prefetched = None  # Étage suivant préparé : (étage, ennemi, identifiant, titre)
+        # Nombres flottants et éclairs d'impact (pool préalloué ; aucun effet sans police)
+        self.effects = EffectLayer(font_medium) if font_medium is not None else None
+
+        # Boutons : créés une seule fois, réutilisés d'une run à l'autre
         self.potions = STARTING_POTIONS
-
-        # État du jeu
-        self.state = "player_turn"  # player_turn, enemy_turn, victory, rewards, game_over, pause
-        self.message = f"Étage {self.floor} - À l'attaque !"
-        self.message_timer = MESSAGE_DURATION
-        self.return_to_menu = False  # Flag pour signaler le retour au menu
-
-        # Boutons
         self.action_buttons = []
-        self.reward_buttons = []
+        self.reward_buttons = []  # Boutons affichés, pris dans _reward_pool
         self.pause_buttons = []
         self._create_action_buttons()
         self._create_pause_buttons()
+        self._reward_pool = self._build_reward_buttons()
+
+        self.reset_game(seed)
 
     def _init_player(self):
         """Initialise ou réinitialise le joueur"""
@@ -85,41 +113,110 @@ class Game:
                 scale=3  # Ajustez la taille selon vos besoins
             )
         else:
-            # Conserve les stats actuelles pour la progression
-            self.player.x = PLAYER_X
-            self.player.y = PLAYER_Y
-            self.player.is_defending = False
-
-    def _spawn_enemy(self):
-        """Génère un ennemi basé sur l'étage actuel"""
-        # Détermine le type d'ennemi selon l'étage
-        if self.floor <= 3:
-            enemy_type = "goblin"
-        elif self.floor <= 6:
-            enemy_type = random.choice(["goblin", "orc"])
-        elif self.floor <= 10:
-            enemy_type = random.choice(["orc", "troll"])
-        elif self.floor <= 15:
-            enemy_type = random.choice(["troll", "demon"])
-        else:
-            enemy_type = random.choice(["demon", "dragon"])
+            # Nouvelle run : stats de base, sprite conservé
+            player = self.player
+            player.hp = player.max_hp = self.base_hp
+            player.attack = self.base_attack
+            player.defense = self.base_defense
+            player.clear_effects()
+            player.x = PLAYER_X
+            player.y = PLAYER_Y
+            player.is_defending = False
+
+    def _create_enemy(self, floor, enemy_type=None):
+        """
+        Crée un ennemi pour un étage (tirage pondéré + tables du catalogue)
+
+        Args:
+            floor (int): Étage de l'ennemi
+            enemy_type (str): Type d'ennemi imposé (chargement) - optionnel
 
-        # Récupère les stats de l'ennemi
-        enemy_data = ENEMY_TYPES[enemy_type]
+        Returns:
+            tuple: (Character, identifiant de l'ennemi dans le catalogue)
+        """
+        catalog = self.catalog
+        if enemy_type is None:
+            enemy_id = catalog.draw(floor, self.rng)
+        else:
+            enemy_id = catalog.index[enemy_type]
 
-        # Scaling basé sur l'étage (augmente légèrement les stats)
-        floor_multiplier = 1 + (self.floor - 1) * 0.1
-        hp = int(enemy_data["hp"] * floor_multiplier)
-        attack = int(enemy_data["attack"] * floor_multiplier)
-        defense = int(enemy_data["defense"] * floor_multiplier)
+        # Stats précalculées pour l'étage
+        hp, attack, defense, gold = catalog.stats(floor, enemy_id)
 
-        self.enemy = Character(
-            enemy_data["name"],
+        enemy = Character(
+            catalog.names[enemy_id],
             hp, hp, attack, defense,
             ENEMY_X, ENEMY_Y,
-            enemy_data["color"]
+            catalog.colors[enemy_id],
+            self.entity_store
         )
-        self.enemy.gold_reward = int(enemy_data["gold"] * floor_multiplier)
+        enemy.gold_reward = gold
+
+        # Effet permanent de l'ennemi (ex: régénération du Troll)
+        on_spawn = catalog.on_spawn[enemy_id]
+        if on_spawn:
+            kind, power, duration, _ = on_spawn
+            enemy.add_effect(kind, power, duration)
+        return enemy, enemy_id
+
+    def _spawn_enemy(self, enemy_type=None):
+        """
+        Génère un ennemi basé sur l'étage actuel
+
+        Args:
+            enemy_type (str): Type d'ennemi imposé (chargement) - optionnel
+        """
+        if self.enemy is not None:
+            self.enemy.release()
+        self.enemy, self.enemy_id = self._create_enemy(self.floor, enemy_type)
+        self.enemy_type = self.catalog.ids[self.enemy_id]
+
+    def _prefetch_next_floor(self):
+        """
+        Prépare l'étage suivant pendant l'écran des récompenses
+
+        L'ennemi est tiré et créé, son nom et le titre de l'étage sont rendus :
+        au choix de la récompense, le changement d'étage n'est plus qu'un échange
+        de références. Avec un ordonnanceur (Game.jobs), la préparation s'étale
+        sur les frames suivantes au lieu d'allonger celle de la victoire.
+        """
+        floor = self.floor + 1
+        if floor > MAX_FLOOR and not self.endless:
+            return
+        # L'ennemi est tiré tout de suite : l'ordre des tirages ne dépend pas des frames
+        enemy, enemy_id = self._create_enemy(floor)
+        steps = self._prefetch_steps(floor, enemy, enemy_id)
+        if self.jobs is None:
+            for _ in steps:
+                pass
+        else:
+            self._cancel_prefetch()
+            self._prefetch_job = self.jobs.submit(steps, name="prefetch")
+
+    def _prefetch_steps(self, floor, enemy, enemy_id):
+        """
+        Rendus de l'étage suivant (générateur)
+
+        Args:
+            floor (int): Étage préparé
+            enemy (Character): Ennemi déjà tiré pour cet étage
+            enemy_id (int): Identifiant de l'ennemi dans le catalogue
+
+        Yields:
+            None: Après chaque rendu (nom, titre)
+        """
+        title = None
+        if self.font_small is not None:
+            enemy.render_nameplate(self.font_small)
+            yield
+            title = self._render_title(floor)
+        self._prefetched = (floor, enemy, enemy_id, title)
+
+    def _cancel_prefetch(self):
+        """Abandonne une préparation de l'étage suivant encore en cours"""
+        if self._prefetch_job is not None:
+            self._prefetch_job.cancel()
+            self._prefetch_job = None
 
     def _create_action_buttons(self):
         """Crée les boutons d'action"""
@@ -134,27 +231,35 @@ class Game:
                   f"Potion ({self.potions})", GREEN, (100, 255, 100), self.font_medium),
         ]
 
-    def _create_reward_buttons(self):
-        """Crée les boutons de récompense après victoire"""
+    def _build_reward_buttons(self):
+        """
+        Crée les boutons de récompense (une seule fois, voir _create_reward_buttons)
+
+        Returns:
+            list: Boutons dans l'ordre de REWARD_TYPES
+        """
         center_x = SCREEN_WIDTH // 2
         button_y = 300
         button_spacing = 120
 
-        self.reward_buttons = [
+        return [
             Button(center_x - 260, button_y, 160, 70, "+15 HP Max", RED,
                   (255, 100, 100), self.font_medium),
             Button(center_x - 85, button_y, 160, 70, "+3 Attaque", PURPLE,
                   (180, 100, 234), self.font_medium),
             Button(center_x + 90, button_y, 160, 70, "+2 Défense", BLUE,
                   (100, 100, 255), self.font_medium),
+            Button(center_x - 85, button_y + button_spacing, 160, 70,
+                  "+2 Potions", GREEN, (100, 255, 100), self.font_medium),
         ]
 
-        # Ajoute un bouton potion si le joueur en a moins de 5
-        if self.potions < 5:
-            self.reward_buttons.append(
-                Button(center_x - 85, button_y + button_spacing, 160, 70,
-                      "+2 Potions", GREEN, (100, 255, 100), self.font_medium)
-            )
+    def _create_reward_buttons(self):
+        """Affiche les boutons de récompense après victoire (pris dans le pool)"""
+        # Le bouton potion n'est proposé que si le joueur en a moins de 5
+        count = len(self._reward_pool) if self.potions < 5 else len(self._reward_pool) - 1
+        self.reward_buttons = self._reward_pool[:count]
+        for button in self.reward_buttons:
+            button.is_hovered = False
 
     def _create_pause_buttons(self):
         """Crée les boutons du menu pause"""
@@ -169,6 +274,15 @@ class Game:
                   "Retour au Menu", RED, (255, 100, 100), self.font_medium),
         ]
 
+    def widgets(self):
+        """
+        Boutons de la partie, tous états confondus (créés une seule fois)
+
+        Returns:
+            list: Boutons
+        """
+        return self.action_buttons + self.pause_buttons + self._reward_pool
+
     def update_potion_button(self):
         """Met à jour le texte du bouton potion"""
         if len(self.action_buttons) > 2:
@@ -180,10 +294,11 @@ class Game:
 
         Args:
             message (str): Message à afficher
-            duration (int): Durée en frames
+            duration (int): Durée en ms
         """
         self.message = message
-        self.message_timer = duration
+        self.message_until = pygame.time.get_ticks() + duration
+        self.message_log.append((self.floor, message))
 
     def player_action(self, action):
         """
@@ -198,16 +313,13 @@ class Game:
         self.player.is_defending = False
 
         if action == "attack":
-            damage = self.player.attack_target(self.enemy)
+            damage = self.player.attack_target(self.enemy, self.rng)
             self.total_damage_dealt += damage
             self.show_message(f"Tu infliges {damage} dégâts !")
+            self._show_hp_change(self.enemy, -damage, hit=True)
 
             if not self.enemy.is_alive():
-                self.enemies_killed += 1
-                self.gold += self.enemy.gold_reward
-                self.state = "rewards"
-                self.show_message(f"Victoire ! +{self.enemy.gold_reward} Or", 300)
-                self._create_reward_buttons()
+                self._enemy_defeated()
                 return
 
         elif action == "defend":
@@ -220,13 +332,53 @@ class Game:
                 self.potions -= 1
                 self.update_potion_button()
                 self.show_message(f"Tu te soignes de {healed} HP !")
+                self._show_hp_change(self.player, healed)
             else:
                 self.show_message("Plus de potions !")
                 return
 
         # Passer au tour de l'ennemi
         self.state = "enemy_turn"
-        pygame.time.set_timer(pygame.USEREVENT, ENEMY_ACTION_DELAY)
+        self._schedule_enemy_turn()
+
+    def _show_hp_change(self, character, delta, hit=False):
+        """
+        Effet visuel d'un changement de HP : nombre flottant, éclair si c'est un coup
+
+        Args:
+            character (Character): Personnage touché ou soigné
+            delta (int): Variation de HP (négative : dégâts)
+            hit (bool): Coup porté (éclair d'impact) - optionnel
+        """
+        if self.effects is None:
+            return
+        if delta:
+            self.effects.spawn_number(character.x, character.y - 40, delta)
+        if hit:
+            self.effects.spawn_flash(character.x, character.y)
+
+    def _schedule_enemy_turn(self):
+        """Programme l'action de l'ennemi après un délai"""
+        pygame.time.set_timer(pygame.USEREVENT, self.enemy_action_delay)
+
+    def _cancel_enemy_turn(self):
+        """Annule le timer de l'action de l'ennemi"""
+        pygame.time.set_timer(pygame.USEREVENT, 0)
+
+    def _enemy_defeated(self):
+        """L'ennemi est vaincu : or, puis choix de la récompense"""
+        self.enemies_killed += 1
+        self.gold += self.enemy.gold_reward
+        self.state = "rewards"
+        self.show_message(f"Victoire ! +{self.enemy.gold_reward} Or", 5000)
+        self._create_reward_buttons()
+        self._prefetch_next_floor()
+
+    def _player_defeated(self):
+        """Le joueur est vaincu : fin de la run"""
+        self.state = "game_over"
+        self.show_message("Défaite... Game Over !", 5000)
+        self._end_run()
 
     def enemy_action(self):
         """L'ennemi effectue son action"""
@@ -235,18 +387,55 @@ class Game:
 
         self.enemy.is_defending = False
 
-        # L'ennemi attaque toujours (IA simple)
-        damage = self.enemy.attack_target(self.player)
-        self.total_damage_taken += damage
-        self.show_message(f"{self.enemy.name} t'inflige {damage} dégâts !")
+        # Effets de statut de l'ennemi (poison, régénération, étourdissement)
+        hp_delta, stunned = self.enemy.start_turn()
+        if hp_delta < 0:
+            self.total_damage_dealt -= hp_delta
+        self._show_hp_change(self.enemy, hp_delta)
+        if not self.enemy.is_alive():
+            self._enemy_defeated()
+            return
+
+        if stunned:
+            self.show_message(f"{self.enemy.name} est étourdi !")
+        else:
+            # L'ennemi attaque toujours (IA simple)
+            damage = self.enemy.attack_target(self.player, self.rng)
+            self.total_damage_taken += damage
+            self._show_hp_change(self.player, -damage, hit=True)
+            message = f"{self.enemy.name} t'inflige {damage} dégâts !"
+
+            # Effet infligé par l'attaque (ex: poison du Démon)
+            on_hit = self.catalog.on_hit[self.enemy_id]
+            if on_hit and self.rng.random() < on_hit[3]:
+                kind, power, duration, _ = on_hit
+                self.player.add_effect(kind, power, duration)
+                message += f" ({STATUS_EFFECTS[kind]['name']} !)"
+            self.show_message(message)
 
         if not self.player.is_alive():
-            self.state = "game_over"
-            self.show_message("Défaite... Game Over !", 300)
+            self._player_defeated()
             return
 
         # Retour au tour du joueur
+        self._start_player_turn()
+
+    def _start_player_turn(self):
+        """Début du tour du joueur : effets de statut, puis action ou tour passé"""
         self.state = "player_turn"
+        hp_delta, stunned = self.player.start_turn()
+        if hp_delta < 0:
+            self.total_damage_taken -= hp_delta
+        if hp_delta:
+            self.show_message(f"{self.message} ({hp_delta:+d} HP)")
+            self._show_hp_change(self.player, hp_delta)
+
+        if not self.player.is_alive():
+            self._player_defeated()
+        elif stunned:
+            self.show_message("Tu es étourdi ! Tu passes ton tour.")
+            self.state = "enemy_turn"
+            self._schedule_enemy_turn()
 
     def apply_reward(self, reward_type):
         """
@@ -255,6 +444,7 @@ class Game:
         Args:
             reward_type (str): Type de récompense
         """
+        start = time.perf_counter()
         if reward_type == "hp":
             self.player.max_hp += 15
             heal = self.player.heal(15)
@@ -269,152 +459,276 @@ class Game:
             self.potions += 2
             self.update_potion_button()
             self.show_message("+2 Potions ! Garde-les précieusement !")
+        else:
+            return
+
+        self.reward_history.append(reward_type)
 
         # Passe à l'étage suivant
         self._next_floor()
 
+        # Sauvegarde automatique : instantané ici, écriture en arrière-plan
+        if self.autosaver and self.state == "player_turn":
+            self.autosaver.submit(save.dump_game(self))
+
+        self.last_transition_ms = (time.perf_counter() - start) * 1000
+
     def _next_floor(self):
         """Passe à l'étage suivant"""
         self.floor += 1
 
-        # Vérifier si le joueur a gagné
-        if self.floor > MAX_FLOOR:
+        # Vérifier si le joueur a gagné (jamais en mode infini)
+        if self.floor > MAX_FLOOR and not self.endless:
             self.state = "victory_final"
-            self.show_message(f"Tu as conquis la tour ! Score: {self.gold}", 500)
+            self.show_message(f"Tu as conquis la tour ! Score: {self.gold}", 8000)
+            self._end_run()
             return
 
+        # Les effets de statut ne survivent pas à l'étage
+        self.player.clear_effects()
+
         # Soigne légèrement le joueur entre les étages
         heal_amount = int(self.player.max_hp * FLOOR_HEAL_PERCENT)
         healed = self.player.heal(heal_amount)
 
-        # Génère un nouvel ennemi
-        self._spawn_enemy()
+        # Nouvel ennemi : celui préparé pendant les récompenses, sinon généré maintenant
+        # (une préparation entamée est terminée tout de suite)
+        if self._prefetch_job is not None:
+            self._prefetch_job.finish()
+            self._prefetch_job = None
+        prefetched, self._prefetched = self._prefetched, None
+        if prefetched is not None and prefetched[0] == self.floor:
+            self.enemy.release()
+            _, self.enemy, self.enemy_id, title = prefetched
+            self.enemy_type = self.catalog.ids[self.enemy_id]
+            if title is not None:
+                self._title = (self.floor, title)
+        else:
+            if prefetched is not None:
+                prefetched[1].release()
+            self._spawn_enemy()
 
         # Réinitialise l'état
         self.state = "player_turn"
         self.show_message(f"Étage {self.floor} - {self.enemy.name} apparaît ! (+{healed} HP)", MESSAGE_DURATION * 2)
         self.reward_buttons = []
 
-    def reset_game(self):
-        """Réinitialise le jeu complètement"""
+    def _end_run(self):
+        """Termine la run (permadeath : la sauvegarde est supprimée)"""
+        if self.autosaver:
+            self.autosaver.clear()
+
+        summary = self.run_summary()
+        for listener in self.run_listeners:
+            listener(summary)
+
+    def run_summary(self):
+        """
+        Résume la run en cours
+
+        Returns:
+            dict: Graine, étage où la run s'arrête, victoire, or, statistiques et
+                récompenses (les MAX_FLOOR dernières en mode infini)
+        """
+        victory = self.state == "victory_final"
+        return {
+            "seed": self.seed,
+            # Une victoire a déjà incrémenté floor (MAX_FLOOR + 1) : dernier étage joué
+            "floor": min(self.floor, MAX_FLOOR) if victory else self.floor,
+            "victory": victory,
+            "gold": self.gold,
+            "enemies_killed": self.enemies_killed,
+            "total_damage_dealt": self.total_damage_dealt,
+            "total_damage_taken": self.total_damage_taken,
+            "rewards": list(self.reward_history),
+        }
+
+    def reset_game(self, seed=None):
+        """
+        Commence une nouvelle run sur place (joueur, boutons et sprite réutilisés)
+
+        Args:
+            seed (int): Graine de la run (aléatoire si None) - optionnel
+        """
+        if self.state in ("enemy_turn", "pause"):
+            self._cancel_enemy_turn()
+
+        # Aléatoire de la run (reproductible à partir de la graine)
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng.seed(self.seed)
+
+        # Statistiques de la run
         self.floor = 1
         self.gold = 0
         self.enemies_killed = 0
         self.total_damage_dealt = 0
         self.total_damage_taken = 0
+        self.reward_history.clear()
+        self.message_log.clear()
+        self._cancel_prefetch()
+        if self.effects:
+            self.effects.clear()
+        if self._prefetched is not None:
+            self._prefetched[1].release()
+        self._prefetched = None
+
+        # Personnages (le joueur revient aux stats de base)
+        self._init_player()
+        self._spawn_enemy()
+
+        # Inventaire
         self.potions = STARTING_POTIONS
 
-        # Réinitialise le joueur aux stats de base
-        self.player = Character("Héros", self.base_hp, self.base_hp,
-                               self.base_attack, self.base_defense, PLAYER_X, PLAYER_Y)
+        # État du jeu
+        self.state = "player_turn"  # player_turn, enemy_turn, victory, rewards, game_over, pause
+        self.previous_state = None
+        self.message = f"Étage {self.floor} - À l'attaque !"
+        self.message_until = pygame.time.get_ticks() + MESSAGE_DURATION  # Instant (ms) où le message disparaît
+        self.return_to_menu = False  # Flag pour signaler le retour au menu
 
-        self._spawn_enemy()
-        self.state = "player_turn"
-        self.message = f"Nouvelle aventure ! Étage {self.floor}"
         self.update_potion_button()
         self.reward_buttons = []
+        for button in self.action_buttons + self.pause_buttons:
+            button.is_hovered = False
 
-    def handle_events(self):
+        for listener in self.start_listeners:
+            listener(self)
+
+    def handle_events(self, events=None):
         """
         Gère les événements du jeu
 
+        Args:
+            events (list): Événements déjà lus (sinon lus dans la file) - optionnel
+
         Returns:
             bool: False si on doit quitter, True sinon
         """
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        for event in pygame.event.get() if events is None else events:
+            if not self.handle_event(event):
                 return False
+        return True
 
-            if event.type == pygame.USEREVENT:
-                # Timer pour l'action de l'ennemi
-                pygame.time.set_timer(pygame.USEREVENT, 0)
-                self.enemy_action()
+    def handle_event(self, event):
+        """
+        Gère un événement du jeu
+
+        Args:
+            event: Événement pygame
 
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    # Basculer entre pause et jeu
-                    if self.state == "pause":
+        Returns:
+            bool: False si on doit quitter, True sinon
+        """
+        if event.type == pygame.QUIT:
+            return False
+
+        if event.type == pygame.USEREVENT and self.state == "enemy_turn":
+            # Timer pour l'action de l'ennemi (pendant la pause, il continue de sonner)
+            self._cancel_enemy_turn()
+            self.enemy_action()
+
+        if event.type == pygame.KEYDOWN:
+            # Profileur de frames et overlay de performances
+            if event.key == pygame.K_F3:
+                PROFILER.toggle()
+
+            if event.key == pygame.K_ESCAPE:
+                # Basculer entre pause et jeu
+                if self.state == "pause":
+                    self.state = self.previous_state
+                elif self.state in ["player_turn", "enemy_turn", "victory", "rewards"]:
+                    self.previous_state = self.state
+                    self.state = "pause"
+
+            # Redémarrer avec ESPACE
+            if event.key == pygame.K_SPACE and (self.state == "game_over" or self.state == "victory_final"):
+                self.reset_game()
+
+        # Gestion du menu pause
+        if self.state == "pause":
+            for i, button in enumerate(self.pause_buttons):
+                if button.handle_event(event):
+                    if i == 0:  # Reprendre
                         self.state = self.previous_state
-                    elif self.state in ["player_turn", "enemy_turn", "victory", "rewards"]:
-                        self.previous_state = self.state
-                        self.state = "pause"
-
-                # Redémarrer avec ESPACE
-                if event.key == pygame.K_SPACE and (self.state == "game_over" or self.state == "victory_final"):
-                    self.reset_game()
-
-            # Gestion du menu pause
-            if self.state == "pause":
-                for i, button in enumerate(self.pause_buttons):
-                    if button.handle_event(event):
-                        if i == 0:  # Reprendre
-                            self.state = self.previous_state
-                        elif i == 1:  # Retour au menu
-                            self.return_to_menu = True
-                        break
-
-            # Gestion des boutons d'action
-            elif self.state == "player_turn":
-                for i, button in enumerate(self.action_buttons):
-                    if button.handle_event(event):
-                        actions = ["attack", "defend", "potion"]
-                        if i < len(actions):
-                            self.player_action(actions[i])
-
-            # Gestion des boutons de récompense
-            elif self.state == "rewards":
-                for i, button in enumerate(self.reward_buttons):
-                    if button.handle_event(event):
-                        rewards = ["hp", "attack", "defense", "potions"]
-                        if i < len(rewards):
-                            self.apply_reward(rewards[i])
-                        break
-
-            # Mettre à jour l'état de survol des boutons
-            for button in self.action_buttons + self.reward_buttons:
-                button.handle_event(event)
+                    elif i == 1:  # Retour au menu
+                        if self.autosaver:
+                            self.autosaver.submit(save.dump_game(self))
+                        self.return_to_menu = True
+                    break
+
+        # Gestion des boutons d'action
+        elif self.state == "player_turn":
+            for i, button in enumerate(self.action_buttons):
+                if button.handle_event(event):
+                    actions = ["attack", "defend", "potion"]
+                    if i < len(actions):
+                        self.player_action(actions[i])
+
+        # Gestion des boutons de récompense
+        elif self.state == "rewards":
+            for i, button in enumerate(self.reward_buttons):
+                if button.handle_event(event):
+                    if i < len(REWARD_TYPES):
+                        self.apply_reward(REWARD_TYPES[i])
+                    break
+
+        # Mettre à jour l'état de survol des boutons
+        for button in self.action_buttons:
+            button.handle_event(event)
+        for button in self.reward_buttons:
+            button.handle_event(event)
 
         return True
 
+    def is_idle(self):
+        """
+        Indique si la partie attend le joueur (frame propice à une collecte, voir GCPolicy)
+
+        Returns:
+            bool: False pendant le tour de l'ennemi ou tant que des effets sont animés
+        """
+        return self.state != "enemy_turn" and not (self.effects and self.effects.count)
+
     def update(self):
         """Met à jour la logique du jeu"""
-        if self.message_timer > 0:
-            self.message_timer -= 1
+        if self.effects:
+            self.effects.update()
 
     def draw(self):
         """Dessine le jeu"""
         # Fond
         self.screen.fill(DARK_GRAY)
 
-        # Titre et informations d'étage
-        title = self.font_large.render(f"Etage {self.floor}/{MAX_FLOOR}", True, GOLD)
+        # Titre et informations d'étage (rendu une fois par étage)
+        if self._title[0] != self.floor:
+            self._title = (self.floor, self._render_title(self.floor))
+        title = self._title[1]
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 40))
         self.screen.blit(title, title_rect)
 
         # Statistiques (or, ennemis tués)
         stats_y = 80
-        gold_text = self.font_small.render(f"Or: {self.gold}", True, GOLD)
-        kills_text = self.font_small.render(f"Ennemis: {self.enemies_killed}", True, WHITE)
+        gold_text = render_text(self.font_small, f"Or: {self.gold}", GOLD)
+        kills_text = render_text(self.font_small, f"Ennemis: {self.enemies_killed}", WHITE)
         self.screen.blit(gold_text, (20, stats_y))
         self.screen.blit(kills_text, (150, stats_y))
 
-        # Dessiner les personnages
-        if self.player:
-            self.player.draw(self.screen, self.font_small)
-        if self.enemy and self.state not in ["rewards", "game_over", "victory_final"]:
-            self.enemy.draw(self.screen, self.font_small)
+        # Dessiner les personnages, puis les nombres flottants et éclairs par-dessus
+        self._draw_characters()
+        if self.effects:
+            self.effects.draw(self.screen)
 
         # Message
-        if self.message_timer > 0 or self.state in ["game_over", "victory_final"]:
+        if pygame.time.get_ticks() < self.message_until or self.state in ["game_over", "victory_final"]:
             message_color = GREEN if self.state == "victory_final" else RED if self.state == "game_over" else WHITE
-            message_surface = self.font_medium.render(self.message, True, message_color)
+            message_surface = render_text(self.font_medium, self.message, message_color)
             message_rect = message_surface.get_rect(center=(SCREEN_WIDTH // 2, 150))
 
             # Fond du message
             padding = 20
             bg_rect = message_rect.inflate(padding * 2, padding)
-            pygame.draw.rect(self.screen, BLACK, bg_rect)
-            pygame.draw.rect(self.screen, message_color, bg_rect, 3)
+            self.screen.rect(BLACK, bg_rect)
+            self.screen.rect(message_color, bg_rect, 3)
 
             self.screen.blit(message_surface, message_rect)
 
@@ -426,7 +740,7 @@ class Game:
         # Boutons de récompense
         elif self.state == "rewards":
             # Titre des récompenses
-            reward_title = self.font_large.render("Choisis ta recompense !", True, GOLD)
+            reward_title = render_text(self.font_large, "Choisis ta recompense !", GOLD)
             reward_rect = reward_title.get_rect(center=(SCREEN_WIDTH // 2, 200))
             self.screen.blit(reward_title, reward_rect)
 
@@ -444,7 +758,7 @@ class Game:
             turn_color = RED
 
         if turn_text:
-            turn_surface = self.font_medium.render(turn_text, True, turn_color)
+            turn_surface = render_text(self.font_medium, turn_text, turn_color)
             turn_rect = turn_surface.get_rect(center=(SCREEN_WIDTH // 2, 420))
             self.screen.blit(turn_surface, turn_rect)
 
@@ -462,14 +776,33 @@ class Game:
 
         # Instructions
         if self.state in ["game_over", "victory_final"]:
-            restart_text = self.font_small.render("Appuie sur ESPACE pour recommencer", True, WHITE)
+            restart_text = render_text(self.font_small, "Appuie sur ESPACE pour recommencer", WHITE)
             restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
             self.screen.blit(restart_text, restart_rect)
         elif self.state != "pause":
-            help_text = self.font_small.render("ESC pour menu pause", True, GRAY)
+            help_text = render_text(self.font_small, "ESC pour menu pause", GRAY)
             self.screen.blit(help_text, (10, SCREEN_HEIGHT - 30))
 
-        pygame.display.flip()
+    def _render_title(self, floor):
+        """
+        Rend le titre d'un étage
+
+        Args:
+            floor (int): Étage
+
+        Returns:
+            pygame.Surface: Titre rendu
+        """
+        if self.endless:
+            return self.font_large.render(f"Etage {floor} - Infini", True, GOLD)
+        return self.font_large.render(f"Etage {floor}/{MAX_FLOOR}", True, GOLD)
+
+    def _draw_characters(self):
+        """Dessine le joueur et l'ennemi"""
+        if self.player:
+            self.player.draw(self.screen, self.font_small)
+        if self.enemy and self.state not in ["rewards", "game_over", "victory_final"]:
+            self.enemy.draw(self.screen, self.font_small)
 
     def _draw_game_over(self):
         """Dessine l'écran de game over avec statistiques"""
@@ -486,7 +819,7 @@ class Game:
         ]
 
         for i, stat in enumerate(stats):
-            stat_surface = self.font_medium.render(stat, True, WHITE)
+            stat_surface = render_text(self.font_medium, stat, WHITE)
             stat_rect = stat_surface.get_rect(center=(center_x, start_y + i * spacing))
             self.screen.blit(stat_surface, stat_rect)
 
@@ -497,7 +830,7 @@ class Game:
         spacing = 35
 
         # Message de félicitations
-        congrats = self.font_large.render("VICTOIRE TOTALE !", True, GOLD)
+        congrats = render_text(self.font_large, "VICTOIRE TOTALE !", GOLD)
         congrats_rect = congrats.get_rect(center=(center_x, 200))
         self.screen.blit(congrats, congrats_rect)
 
@@ -508,20 +841,17 @@ class Game:
         ]
 
         for i, stat in enumerate(stats):
-            stat_surface = self.font_medium.render(stat, True, WHITE)
+            stat_surface = render_text(self.font_medium, stat, WHITE)
             stat_rect = stat_surface.get_rect(center=(center_x, start_y + i * spacing))
             self.screen.blit(stat_surface, stat_rect)
 
     def _draw_pause_menu(self):
         """Dessine le menu pause"""
         # Overlay semi-transparent
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.overlay(BLACK, 180)
 
         # Titre
-        title = self.font_large.render("PAUSE", True, GOLD)
+        title = render_text(self.font_large, "PAUSE", GOLD)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 150))
         self.screen.blit(title, title_rect)
 
@@ -529,7 +859,13 @@ class Game:
         for button in self.pause_buttons:
             button.draw(self.screen)
 
+        # Derniers événements du journal
+        recent = islice(self.message_log, max(0, len(self.message_log) - 4), None)
+        for i, (floor, message) in enumerate(recent):
+            log_text = render_text(self.font_small, f"[{floor}] {message}", GRAY)
+            self.screen.blit(log_text, log_text.get_rect(center=(SCREEN_WIDTH // 2, 440 + i * 22)))
+
         # Instruction
-        help_text = self.font_small.render("ESC pour reprendre", True, WHITE)
+        help_text = render_text(self.font_small, "ESC pour reprendre", WHITE)
         help_rect = help_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
         self.screen.blit(help_text, help_rect)
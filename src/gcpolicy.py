@@ -0,0 +1,151 @@
+"""
+Module du ramasse-miettes - Collectes placées dans les frames au repos
+
+Par défaut, Python lance une collecte dès qu'assez d'objets ont été alloués,
+n'importe où dans la frame : une collecte de génération 2 au milieu d'un tour
+ennemi fait un pic de temps de frame. GCPolicy :
+
+- fige (gc.freeze) les objets créés au démarrage (polices, scènes, images,
+  catalogue) : les collectes ne les parcourent plus ;
+- désactive les collectes automatiques ;
+- lance la collecte due (la plus ancienne génération dont le compteur dépasse
+  son seuil, une seule par frame) après la présentation d'une frame au repos,
+  quand le jeu attend le joueur ;
+- pendant une longue animation, force seulement une collecte de génération 0
+  quand les allocations dépassent GC_DEFERRAL_LIMIT fois son seuil.
+
+Chaque collecte est mesurée (gc.callbacks) : pause par frame, phase « gc »
+du profileur (overlay F3 et trace Chrome) et résumé affiché en quittant.
+Avec RPG_GC=0, les collectes automatiques de Python sont seulement mesurées
+(comparaison).
+"""
+import gc
+import time
+from collections import deque
+from .constants import GC_FRAMES, GC_DEFERRAL_LIMIT
+from .profiler import PROFILER, percentile
+from .metrics import GC_PAUSE
+
+GC_ENV = "RPG_GC"
+
+
+class GCPolicy:
+    """Collectes du ramasse-miettes différées aux frames au repos"""
+
+    def __init__(self, frames=GC_FRAMES, profiler=PROFILER):
+        """
+        Initialise la politique (inactive jusqu'à start)
+
+        Args:
+            frames (int): Nombre de frames dont la pause est conservée
+            profiler (FrameProfiler): Profileur où enregistrer les collectes - optionnel
+        """
+        self.profiler = profiler
+        self.started = False  # Collectes mesurées
+        self.active = False  # Collectes différées aux frames au repos
+        self.frozen = 0  # Objets figés au démarrage
+        self.pauses = deque(maxlen=frames)  # Pause du ramasse-miettes par frame (ms)
+        self.collections = [0, 0, 0]  # Collectes par génération
+        self.forced = 0  # Collectes forcées pendant une animation
+        self._frame_ns = 0  # Pause cumulée de la frame en cours
+        self._start = 0  # Début de la collecte en cours (ns)
+
+    def start(self, defer=True):
+        """
+        Mesure les collectes et, si demandé, applique la politique
+
+        Args:
+            defer (bool): Fige les objets du démarrage et diffère les collectes
+                (False : collectes automatiques de Python, seulement mesurées)
+        """
+        if self.started:
+            return
+        if defer:
+            gc.collect()  # Les objets figés ne doivent pas contenir de cycles morts
+            gc.freeze()
+            self.frozen = gc.get_freeze_count()
+            gc.disable()
+            self.active = True
+        gc.callbacks.append(self._measure)  # Après la collecte du démarrage
+        self.started = True
+
+    def stop(self):
+        """Arrête la mesure et rétablit les collectes automatiques de Python"""
+        if not self.started:
+            return
+        gc.callbacks.remove(self._measure)
+        self.started = False
+        if self.active:
+            gc.enable()
+            gc.unfreeze()
+            self.active = False
+
+    def _measure(self, phase, info):
+        """
+        Mesure une collecte (rappel de gc.callbacks)
+
+        Args:
+            phase (str): "start" ou "stop"
+            info (dict): Informations de gc (génération collectée)
+        """
+        if phase == "start":
+            self._start = time.perf_counter_ns()
+            return
+        duration = time.perf_counter_ns() - self._start
+        self._frame_ns += duration
+        self.collections[info["generation"]] += 1
+        if self.profiler.enabled:
+            self.profiler.events.append(("gc", self._start, duration))
+
+    @staticmethod
+    def due_generation():
+        """
+        Génération à collecter (comme la collecte automatique de Python)
+
+        Returns:
+            int: Plus ancienne génération dont le compteur dépasse le seuil, ou None
+        """
+        counts = gc.get_count()
+        thresholds = gc.get_threshold()
+        for generation in (2, 1, 0):
+            if thresholds[generation] and counts[generation] > thresholds[generation]:
+                return generation
+        return None
+
+    def end_frame(self, idle):
+        """
+        Fin de frame (après la présentation) : collecte éventuelle et pause de la frame
+
+        Args:
+            idle (bool): Le jeu attend une entrée du joueur (rien n'est animé)
+        """
+        if self.active:
+            if idle:
+                generation = self.due_generation()
+                if generation is not None:
+                    gc.collect(generation)
+            elif gc.get_count()[0] > gc.get_threshold()[0] * GC_DEFERRAL_LIMIT:
+                self.forced += 1
+                gc.collect(0)
+        self.pauses.append(self._frame_ns / 1e6)
+        if self._frame_ns:
+            GC_PAUSE.observe(self._frame_ns / 1e9)
+            self._frame_ns = 0
+
+    def report(self):
+        """
+        Résumé lisible des pauses
+
+        Returns:
+            str: Résumé
+        """
+        pauses = sorted(self.pauses)
+        paused = sum(1 for pause in pauses if pause > 0)
+        gen0, gen1, gen2 = self.collections
+        return (f"Ramasse-miettes ({gen0}/{gen1}/{gen2} collectes gen 0/1/2, {self.forced} forcées, "
+                f"{self.frozen} objets figés) : pause par frame p99 {percentile(pauses, 0.99):.2f} "
+                f"max {pauses[-1] if pauses else 0.0:.2f} ms, {paused}/{len(pauses)} frames avec collecte")
+
+
+# Politique partagée (démarrée par main)
+GC_POLICY = GCPolicy()
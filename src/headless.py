@@ -0,0 +1,94 @@
+"""
+Module headless - Parties sans affichage pour les simulations et les bots
+"""
+from .game import Game
+from .character import Character
+from .constants import POTION_HEAL_AMOUNT, REWARD_TYPES
+
+
+class HeadlessGame(Game):
+    """Partie sans écran ni polices : les règles de Game, sans rendu ni timers"""
+
+    def __init__(self, seed=None, endless=False):
+        """
+        Initialise une partie headless
+
+        Args:
+            seed (int): Graine de la run (aléatoire si None) - optionnel
+            endless (bool): Mode infini, sans étage final - optionnel
+        """
+        super().__init__(None, None, None, None, seed=seed, endless=endless)
+
+    def _init_player(self):
+        """Initialise le joueur sans charger de sprite"""
+        if self.player is None:
+            self.player = Character(
+                "Rogue Mage",
+                self.base_hp,
+                self.base_hp,
+                self.base_attack,
+                self.base_defense,
+                0, 0
+            )
+        else:
+            super()._init_player()
+
+    def _schedule_enemy_turn(self):
+        """L'ennemi joue immédiatement (pas de timer pygame)"""
+        self.enemy_action()
+
+    def draw(self):
+        """Aucun rendu en mode headless"""
+
+
+def choose_action(game):
+    """
+    Politique par défaut : potion quand les HP sont bas, sinon attaque
+
+    Args:
+        game (Game): Partie en cours
+
+    Returns:
+        str: Action ('attack', 'defend', 'potion')
+    """
+    player = game.player
+    if game.potions > 0 and player.max_hp - player.hp >= POTION_HEAL_AMOUNT \
+            and player.hp < player.max_hp * 0.35:
+        return "potion"
+    return "attack"
+
+
+def choose_reward(game):
+    """
+    Politique par défaut : récompense tirée au hasard
+
+    Args:
+        game (Game): Partie en cours
+
+    Returns:
+        str: Type de récompense
+    """
+    choices = REWARD_TYPES if game.potions < 5 else REWARD_TYPES[:-1]
+    return game.rng.choice(choices)
+
+
+def play_run(game, action_policy=choose_action, reward_policy=choose_reward):
+    """
+    Joue une run complète jusqu'à la défaite ou la victoire finale
+
+    Args:
+        game (HeadlessGame): Partie à jouer
+        action_policy: Fonction (game) -> action
+        reward_policy: Fonction (game) -> récompense
+
+    Returns:
+        dict: Résumé de la run (voir Game.run_summary)
+    """
+    while game.state not in ("game_over", "victory_final"):
+        if game.state == "player_turn":
+            game.player_action(action_policy(game))
+        elif game.state == "rewards":
+            game.apply_reward(reward_policy(game))
+        else:
+            game.enemy_action()
+    return game.run_summary()
@@ -0,0 +1,245 @@
+"""
+Module d'historique des runs - Stockage colonnaire mappable en mémoire
+
+Chaque colonne est un fichier binaire de largeur fixe (little-endian, sans
+en-tête) dans un segment ``seg-XXXXX``. Le schéma est décrit dans
+``schema.json`` pour pouvoir ouvrir les colonnes avec numpy.memmap.
+"""
+import json
+import mmap
+import os
+import sys
+from array import array
+from .constants import HISTORY_DIR, MAX_FLOOR, REWARD_TYPES
+
+try:
+    import numpy as np
+except ImportError:  # numpy est optionnel : lecture via mmap + memoryview
+    np = None
+
+# Colonnes : (nom, typecode array, dtype numpy, nombre de valeurs par ligne)
+COLUMNS = [
+    ("seed", "I", "<u4", 1),
+    ("death_floor", "H", "<u2", 1),
+    ("victory", "B", "u1", 1),
+    ("gold", "I", "<u4", 1),
+    ("enemies_killed", "I", "<u4", 1),
+    ("total_damage_dealt", "I", "<u4", 1),
+    ("total_damage_taken", "I", "<u4", 1),
+    # Récompense par étage : code REWARD_TYPES + 1, 0 = aucune
+    ("rewards", "B", "u1", MAX_FLOOR),
+]
+
+SCHEMA_VERSION = 1
+SEGMENT_PREFIX = "seg-"
+
+
+def _row_values(summary):
+    """
+    Convertit un résumé de run en valeurs de colonnes
+
+    Args:
+        summary (dict): Résumé produit par Game.run_summary()
+
+    Returns:
+        list: Valeurs dans l'ordre de COLUMNS (liste d'entiers pour 'rewards')
+    """
+    rewards = [REWARD_TYPES.index(r) + 1 for r in summary["rewards"][:MAX_FLOOR]]
+    rewards += [0] * (MAX_FLOOR - len(rewards))
+    return [
+        summary["seed"],
+        summary["floor"],
+        1 if summary["victory"] else 0,
+        summary["gold"],
+        summary["enemies_killed"],
+        summary["total_damage_dealt"],
+        summary["total_damage_taken"],
+        rewards,
+    ]
+
+
+class RunHistory:
+    """Magasin colonnaire append-only des runs terminées"""
+
+    def __init__(self, path=HISTORY_DIR, batch_size=4096, segment_rows=1 << 20):
+        """
+        Ouvre (ou crée) un historique
+
+        Args:
+            path (str): Dossier de l'historique
+            batch_size (int): Nombre de lignes bufferisées avant écriture
+            segment_rows (int): Nombre de lignes maximum par segment
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.segment_rows = segment_rows
+        os.makedirs(path, exist_ok=True)
+        self._write_schema()
+
+        self._buffers = {name: array(code) for name, code, _, _ in COLUMNS}
+        self._pending = 0
+
+        segments = list_segments(path)
+        self._segment = segments[-1] if segments else 0
+        self._segment_count = segment_length(path, self._segment) if segments else 0
+
+    def _write_schema(self):
+        """Écrit la description des colonnes (une seule fois)"""
+        schema_path = os.path.join(self.path, "schema.json")
+        if os.path.exists(schema_path):
+            return
+        schema = {
+            "version": SCHEMA_VERSION,
+            "columns": [{"name": name, "dtype": dtype, "width": width}
+                        for name, _, dtype, width in COLUMNS],
+            "rewards": REWARD_TYPES,
+        }
+        with open(schema_path, "w") as f:
+            json.dump(schema, f, indent=2)
+
+    def append(self, summary):
+        """
+        Ajoute une run au buffer (écrit sur disque par lots)
+
+        Args:
+            summary (dict): Résumé produit par Game.run_summary()
+        """
+        for (name, _, _, width), value in zip(COLUMNS, _row_values(summary)):
+            if width == 1:
+                self._buffers[name].append(value)
+            else:
+                self._buffers[name].extend(value)
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Écrit les lignes bufferisées, en changeant de segment si nécessaire"""
+        start = 0
+        while start < self._pending:
+            if self._segment_count >= self.segment_rows:
+                self._segment += 1
+                self._segment_count = 0
+            count = min(self._pending - start, self.segment_rows - self._segment_count)
+            self._write_rows(start, count)
+            self._segment_count += count
+            start += count
+
+        for buffer in self._buffers.values():
+            del buffer[:]
+        self._pending = 0
+
+    def _write_rows(self, start, count):
+        """
+        Ajoute une tranche du buffer aux fichiers du segment courant
+
+        Args:
+            start (int): Première ligne du buffer
+            count (int): Nombre de lignes
+        """
+        segment_dir = segment_path(self.path, self._segment)
+        os.makedirs(segment_dir, exist_ok=True)
+        for name, _, _, width in COLUMNS:
+            chunk = self._buffers[name][start * width:(start + count) * width]
+            if sys.byteorder == "big":
+                chunk.byteswap()
+            with open(os.path.join(segment_dir, name + ".bin"), "ab") as f:
+                chunk.tofile(f)
+
+    def close(self):
+        """Écrit les lignes restantes"""
+        self.flush()
+
+
+def segment_path(path, segment):
+    """
+    Chemin du dossier d'un segment
+
+    Args:
+        path (str): Dossier de l'historique
+        segment (int): Numéro du segment
+
+    Returns:
+        str: Chemin du segment
+    """
+    return os.path.join(path, f"{SEGMENT_PREFIX}{segment:05d}")
+
+
+def list_segments(path=HISTORY_DIR):
+    """
+    Liste les segments d'un historique
+
+    Args:
+        path (str): Dossier de l'historique
+
+    Returns:
+        list: Numéros des segments, triés
+    """
+    if not os.path.isdir(path):
+        return []
+    return sorted(int(name[len(SEGMENT_PREFIX):]) for name in os.listdir(path)
+                  if name.startswith(SEGMENT_PREFIX))
+
+
+def segment_length(path, segment):
+    """
+    Nombre de lignes d'un segment (déduit de la taille de la première colonne)
+
+    Args:
+        path (str): Dossier de l'historique
+        segment (int): Numéro du segment
+
+    Returns:
+        int: Nombre de lignes
+    """
+    name, code, _, width = COLUMNS[0]
+    column_file = os.path.join(segment_path(path, segment), name + ".bin")
+    if not os.path.exists(column_file):
+        return 0
+    return os.path.getsize(column_file) // (array(code).itemsize * width)
+
+
+def open_segment(path, segment):
+    """
+    Mappe en mémoire les colonnes d'un segment, sans copie
+
+    Avec numpy, chaque colonne est un numpy.memmap en lecture seule
+    (forme (n,) ou (n, MAX_FLOOR) pour 'rewards'). Sans numpy, chaque colonne
+    est une memoryview typée sur un mmap.
+
+    Args:
+        path (str): Dossier de l'historique
+        segment (int): Numéro du segment
+
+    Returns:
+        dict: Nom de colonne -> vue sur les données
+    """
+    rows = segment_length(path, segment)
+    segment_dir = segment_path(path, segment)
+    columns = {}
+    for name, code, dtype, width in COLUMNS:
+        column_file = os.path.join(segment_dir, name + ".bin")
+        shape = (rows,) if width == 1 else (rows, width)
+        if rows == 0:
+            columns[name] = np.zeros(shape, dtype=dtype) if np else memoryview(array(code))
+        elif np is not None:
+            columns[name] = np.memmap(column_file, dtype=dtype, mode="r", shape=shape)
+        else:
+            with open(column_file, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            columns[name] = memoryview(mapped).cast(code)
+    return columns
+
+
+def iter_segments(path=HISTORY_DIR):
+    """
+    Parcourt tous les segments d'un historique
+
+    Args:
+        path (str): Dossier de l'historique
+
+    Yields:
+        dict: Colonnes de chaque segment (voir open_segment)
+    """
+    for segment in list_segments(path):
+        yield open_segment(path, segment)
@@ -0,0 +1,352 @@
+"""
+Module du mode Horde - Des centaines d'ennemis par étage
+
+Les ennemis sont rendus par un groupe pygame.sprite.LayeredDirty dans une
+surface d'arène persistante : seuls les sprites modifiés (HP, cible, mort)
+sont redessinés, puis l'arène est copiée en un seul blit par frame.
+"""
+import math
+import pygame
+from .game import Game
+from .entities import EntityStore
+from .ui import render_text
+from .constants import (
+    WHITE, GRAY, DARK_GRAY, GREEN, GOLD, RED, STATUS_EFFECTS,
+    HORDE_ARENA, HORDE_BASE_SIZE, HORDE_SIZE_PER_FLOOR, HORDE_MAX_SIZE,
+    HORDE_HP_SCALE, HORDE_ATTACKERS
+)
+
+
+def layout_grid(count, rect):
+    """
+    Répartit des cellules carrées dans un rectangle
+
+    Args:
+        count (int): Nombre de cellules
+        rect (pygame.Rect): Zone à remplir
+
+    Returns:
+        tuple: (colonnes, taille d'une cellule en pixels)
+    """
+    columns = max(1, math.ceil(math.sqrt(count * rect.width / rect.height)))
+    rows = max(1, math.ceil(count / columns))
+    cell = min(rect.width // columns, rect.height // rows, 80)
+    return columns, cell
+
+
+class EnemySprite(pygame.sprite.DirtySprite):
+    """Sprite d'un ennemi de la horde, re-rendu uniquement quand il change"""
+
+    def __init__(self, enemy, center, cell):
+        """
+        Initialise le sprite
+
+        Args:
+            enemy (Character): Ennemi représenté
+            center (tuple): Centre dans l'arène
+            cell (int): Taille de la cellule en pixels
+        """
+        super().__init__()
+        self.enemy = enemy
+        self.cell = cell
+        self.image = pygame.Surface((cell, cell), pygame.SRCALPHA)
+        self.rect = self.image.get_rect(center=center)
+        self.is_target = False
+        self._drawn_hp = None
+        self._drawn_target = None
+        self.sync()
+
+    def sync(self):
+        """Re-rend l'image si les HP ou le ciblage ont changé (marque le sprite sale)"""
+        enemy = self.enemy
+        if enemy.hp == self._drawn_hp and self.is_target == self._drawn_target:
+            return
+        self._drawn_hp = enemy.hp
+        self._drawn_target = self.is_target
+
+        if enemy.hp <= 0:
+            self.visible = 0
+            self.dirty = 1
+            return
+
+        cell = self.cell
+        image = self.image
+        image.fill((0, 0, 0, 0))
+        radius = max(3, int(cell * 0.35))
+        center = (cell // 2, cell // 2 - max(1, cell // 10))
+        pygame.draw.circle(image, enemy.base_color or GRAY, center, radius)
+        if self.is_target:
+            pygame.draw.circle(image, WHITE, center, radius, max(1, cell // 16))
+
+        # Barre de vie
+        bar_height = max(2, cell // 10)
+        bar_y = cell - bar_height - 1
+        ratio = enemy.hp / enemy.max_hp
+        pygame.draw.rect(image, DARK_GRAY, (1, bar_y, cell - 2, bar_height))
+        hp_color = GREEN if ratio > 0.5 else GOLD if ratio > 0.25 else RED
+        pygame.draw.rect(image, hp_color, (1, bar_y, max(1, int((cell - 2) * ratio)), bar_height))
+        self.dirty = 1
+
+
+class HordeGame(Game):
+    """Partie en mode Horde : N ennemis par étage, ciblage à la souris"""
+
+    def __init__(self, screen, font_large, font_medium, font_small, seed=None, horde_size=None):
+        """
+        Initialise une partie en mode Horde
+
+        Args:
+            screen: Backend de rendu ou surface pygame principale (voir src.render)
+            font_large: Grande police
+            font_medium: Police moyenne
+            font_small: Petite police
+            seed (int): Graine de la run (aléatoire si None) - optionnel
+            horde_size (int): Taille fixe de la horde (sinon selon l'étage) - optionnel
+        """
+        # L'arène doit exister avant le premier _spawn_enemy de Game.__init__
+        self.horde_size = horde_size
+        self.arena_rect = pygame.Rect(HORDE_ARENA)
+        self.arena = pygame.Surface(self.arena_rect.size)
+        self.arena_background = pygame.Surface(self.arena_rect.size)
+        self.arena_background.fill(DARK_GRAY)
+        self.arena.blit(self.arena_background, (0, 0))
+        self.enemies = []
+        self.enemy_ids = []
+        self.enemy_rows = []  # Lignes des ennemis dans entity_store (opérations groupées)
+        self.sprites = []
+        self.horde_group = pygame.sprite.LayeredDirty()
+        # Magasin propre à la horde : les stats des ennemis restent contiguës
+        self.entity_store = EntityStore()
+        self.alive_count = 0
+        self._columns = 1
+        self._cell = 1
+        self._attack_cursor = 0
+
+        super().__init__(screen, font_large, font_medium, font_small, seed=seed)
+
+    def _horde_size_for_floor(self):
+        """
+        Taille de la horde pour l'étage actuel
+
+        Returns:
+            int: Nombre d'ennemis
+        """
+        if self.horde_size is not None:
+            return self.horde_size
+        return min(HORDE_MAX_SIZE, HORDE_BASE_SIZE + (self.floor - 1) * HORDE_SIZE_PER_FLOOR)
+
+    def _spawn_enemy(self, enemy_type=None):
+        """
+        Génère la horde de l'étage actuel
+
+        Args:
+            enemy_type (str): Type imposé pour toute la horde - optionnel
+        """
+        count = self._horde_size_for_floor()
+        # La horde précédente libère ses lignes avant que la nouvelle ne les réutilise
+        for enemy in self.enemies:
+            enemy.release()
+        self.enemies = []
+        self.enemy_ids = []
+        for _ in range(count):
+            enemy, enemy_id = self._create_enemy(self.floor, enemy_type)
+            # Ennemis de horde plus fragiles que les ennemis d'étage classiques
+            enemy.max_hp = enemy.hp = max(1, int(enemy.hp * HORDE_HP_SCALE))
+            self.enemies.append(enemy)
+            self.enemy_ids.append(enemy_id)
+        self.enemy_rows = [enemy.row for enemy in self.enemies]
+        self.alive_count = count
+        self._attack_cursor = 0
+        self._layout()
+        self._set_target(0)
+
+    def _layout(self):
+        """Place les sprites de la horde en grille dans l'arène"""
+        self.horde_group.empty()
+        self.arena.blit(self.arena_background, (0, 0))
+        self._columns, self._cell = layout_grid(len(self.enemies), self.arena_rect)
+        cell = self._cell
+        self.sprites = []
+        for i, enemy in enumerate(self.enemies):
+            row, column = divmod(i, self._columns)
+            center = (column * cell + cell // 2, row * cell + cell // 2)
+            enemy.x = self.arena_rect.x + center[0]
+            enemy.y = self.arena_rect.y + center[1]
+            self.sprites.append(EnemySprite(enemy, center, cell))
+        self.horde_group.add(*self.sprites)
+        self.horde_group.clear(self.arena, self.arena_background)
+
+    def _set_target(self, index):
+        """
+        Change la cible du joueur
+
+        Args:
+            index (int): Index de l'ennemi ciblé
+        """
+        for sprite in self.sprites:
+            if sprite.is_target:
+                sprite.is_target = False
+        self.enemy = self.enemies[index]
+        self.enemy_id = self.enemy_ids[index]
+        self.enemy_type = self.catalog.ids[self.enemy_id]
+        self.sprites[index].is_target = True
+
+    def _next_alive_index(self):
+        """
+        Index du premier ennemi vivant
+
+        Returns:
+            int: Index, ou None si la horde est vaincue
+        """
+        for i, enemy in enumerate(self.enemies):
+            if enemy.hp > 0:
+                return i
+        return None
+
+    def target_at(self, pos):
+        """
+        Ennemi vivant sous une position écran (calcul direct de la cellule)
+
+        Args:
+            pos (tuple): Position (x, y) à l'écran
+
+        Returns:
+            int: Index de l'ennemi, ou None
+        """
+        if not self.arena_rect.collidepoint(pos):
+            return None
+        column = (pos[0] - self.arena_rect.x) // self._cell
+        row = (pos[1] - self.arena_rect.y) // self._cell
+        if column >= self._columns:
+            return None
+        index = row * self._columns + column
+        if index < len(self.enemies) and self.enemies[index].hp > 0:
+            return index
+        return None
+
+    def _enemy_defeated(self):
+        """Un ennemi de la horde tombe : la run continue tant qu'il en reste"""
+        self._count_kill(self.enemy)
+        self.alive_count = self.entity_store.count_alive(self.enemy_rows)
+        if self.alive_count > 0:
+            self._set_target(self._next_alive_index())
+            self.state = "enemy_turn"
+            self._schedule_enemy_turn()
+        else:
+            self._horde_cleared()
+
+    def _count_kill(self, enemy):
+        """
+        Comptabilise un ennemi vaincu (alive_count est recompté par l'appelant)
+
+        Args:
+            enemy (Character): Ennemi vaincu
+        """
+        self.enemies_killed += 1
+        self.gold += enemy.gold_reward
+
+    def _horde_cleared(self):
+        """Toute la horde est vaincue : choix de la récompense"""
+        self.state = "rewards"
+        self.show_message(f"Horde vaincue ! Or: {self.gold}", 5000)
+        self._create_reward_buttons()
+
+    def enemy_action(self):
+        """Les ennemis de la horde agissent (quelques attaquants par tour)"""
+        if self.state != "enemy_turn":
+            return
+
+        # Effets de statut de chaque ennemi vivant (régénération, poison...) :
+        # variations calculées par ennemi, appliquées aux HP en une opération groupée
+        ticked = []
+        rows = []
+        deltas = []
+        for enemy in self.enemies:
+            if enemy.hp > 0 and enemy.effects:
+                hp_delta, _ = enemy.effects.tick()
+                if hp_delta:
+                    ticked.append(enemy)
+                    rows.append(enemy.row)
+                    deltas.append(hp_delta)
+        applied = self.entity_store.change_hp_many(rows, deltas)
+        for enemy, hp_delta in zip(ticked, applied):
+            self._show_hp_change(enemy, hp_delta)
+            if hp_delta < 0:
+                self.total_damage_dealt -= hp_delta
+                if enemy.hp <= 0:
+                    self._count_kill(enemy)
+        self.alive_count = self.entity_store.count_alive(self.enemy_rows)
+        if self.alive_count <= 0:
+            self._horde_cleared()
+            return
+        if self.enemy.hp <= 0:
+            self._set_target(self._next_alive_index())
+
+        # Attaquants choisis à tour de rôle parmi les ennemis vivants
+        total = 0
+        attackers = 0
+        count = len(self.enemies)
+        for _ in range(count):
+            if attackers >= HORDE_ATTACKERS:
+                break
+            index = self._attack_cursor
+            self._attack_cursor = (self._attack_cursor + 1) % count
+            enemy = self.enemies[index]
+            if enemy.hp <= 0:
+                continue
+            enemy.is_defending = False
+            total += enemy.attack_target(self.player, self.rng)
+            attackers += 1
+            self._show_hp_change(enemy, 0, hit=True)  # Éclair sur chaque attaquant
+
+            on_hit = self.catalog.on_hit[self.enemy_ids[index]]
+            if on_hit and self.rng.random() < on_hit[3]:
+                kind, power, duration, _ = on_hit
+                self.player.add_effect(kind, power, duration)
+
+        self.total_damage_taken += total
+        self.show_message(f"{attackers} ennemis t'infligent {total} dégâts !")
+        self._show_hp_change(self.player, -total)
+
+        if not self.player.is_alive():
+            self._player_defeated()
+            return
+
+        self._start_player_turn()
+
+    def handle_event(self, event):
+        """
+        Gère un événement (clic dans l'arène = changement de cible)
+
+        Args:
+            event: Événement pygame
+
+        Returns:
+            bool: False si on doit quitter, True sinon
+        """
+        if self.state == "player_turn" and event.type == pygame.MOUSEBUTTONDOWN:
+            index = self.target_at(event.pos)
+            if index is not None:
+                self._set_target(index)
+        return super().handle_event(event)
+
+    def _draw_characters(self):
+        """Dessine le joueur et l'arène de la horde"""
+        if self.player:
+            self.player.draw(self.screen, self.font_small)
+        if self.state in ["rewards", "game_over", "victory_final"]:
+            return
+
+        for sprite in self.sprites:
+            sprite.sync()
+        # L'arène est redessinée sur place : sa texture n'est renvoyée que si elle a changé
+        changed = self.horde_group.draw(self.arena)
+        self.screen.blit(self.arena, self.arena_rect, changed=bool(changed))
+
+        # Informations sur la cible
+        enemy = self.enemy
+        effects = "  ".join(f"{STATUS_EFFECTS[kind]['name']} {power}"
+                            for kind, power in enemy.effects.power.items())
+        info = f"Cible: {enemy.name} {enemy.hp}/{enemy.max_hp}  {effects}  -  Restants: {self.alive_count}"
+        text = render_text(self.font_small, info, WHITE)
+        self.screen.blit(text, (self.arena_rect.x, self.arena_rect.bottom + 5))
@@ -0,0 +1,155 @@
+"""
+Module des travaux d'arrière-plan - Ordonnanceur coopératif sur le thread principal
+
+Certains travaux touchent aux surfaces pygame et ne peuvent pas partir dans un
+thread : textes rendus à l'avance, étage suivant préparé, caches de widgets.
+Ils sont soumis comme des générateurs (un yield entre deux étapes) et
+JobScheduler.run, appelé une fois par frame après update/draw, les avance
+jusqu'à épuisement du budget de la frame (JOB_BUDGET_MS) : un gros travail
+ponctuel s'étale sur plusieurs frames au lieu d'en bloquer une.
+
+Les travaux passent par priorité (la plus petite d'abord), puis dans l'ordre
+de soumission ; un travail annulé n'est plus avancé.
+"""
+import heapq
+import itertools
+import time
+from .constants import JOB_BUDGET_MS
+from .profiler import PROFILER
+
+# Priorités (la plus petite passe en premier)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+
+class Job:
+    """Travail soumis à l'ordonnanceur"""
+
+    __slots__ = ("name", "priority", "steps", "cancelled", "done")
+
+    def __init__(self, steps, priority, name):
+        """
+        Initialise le travail
+
+        Args:
+            steps: Générateur du travail (une étape par yield)
+            priority (int): Priorité (la plus petite passe en premier)
+            name (str): Nom du travail
+        """
+        self.steps = steps
+        self.priority = priority
+        self.name = name
+        self.cancelled = False
+        self.done = False
+
+    def cancel(self):
+        """Annule le travail (ses étapes restantes ne seront pas exécutées)"""
+        if not self.done:
+            self.cancelled = True
+            self.steps.close()
+
+    def finish(self):
+        """Exécute tout de suite les étapes restantes (résultat attendu maintenant)"""
+        if self.pending:
+            for _ in self.steps:
+                pass
+            self.done = True
+
+    @property
+    def pending(self):
+        """True tant que le travail n'est ni terminé ni annulé"""
+        return not (self.done or self.cancelled)
+
+
+class JobScheduler:
+    """Travaux coopératifs avancés dans un budget de temps par frame"""
+
+    def __init__(self, budget_ms=JOB_BUDGET_MS, profiler=PROFILER):
+        """
+        Initialise l'ordonnanceur
+
+        Args:
+            budget_ms (float): Temps accordé aux travaux par frame (ms)
+            profiler (FrameProfiler): Profileur où enregistrer les travaux - optionnel
+        """
+        self.budget_ms = budget_ms
+        self.profiler = profiler
+        self._queue = []  # Tas de (priorité, ordre de soumission, travail)
+        self._order = itertools.count()
+        self.steps = 0  # Étapes exécutées
+        self.overruns = 0  # Frames où une étape a dépassé le budget
+        self.last_ms = 0.0  # Temps passé dans les travaux à la dernière frame
+
+    def __len__(self):
+        """Nombre de travaux en attente (annulés compris tant qu'ils n'ont pas été retirés)"""
+        return len(self._queue)
+
+    def submit(self, steps, priority=PRIORITY_NORMAL, name=None):
+        """
+        Soumet un travail
+
+        Args:
+            steps: Générateur du travail (une étape par yield)
+            priority (int): Priorité (PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW) - optionnel
+            name (str): Nom du travail (phase du profileur) - optionnel
+
+        Returns:
+            Job: Travail soumis (annulable)
+        """
+        job = Job(steps, priority, name or getattr(steps, "__name__", "job"))
+        heapq.heappush(self._queue, (priority, next(self._order), job))
+        return job
+
+    def run(self, budget_ms=None):
+        """
+        Avance les travaux jusqu'à épuisement du budget (au moins une étape)
+
+        Args:
+            budget_ms (float): Budget de cette frame (sinon self.budget_ms) - optionnel
+
+        Returns:
+            int: Nombre d'étapes exécutées
+        """
+        queue = self._queue
+        if not queue:
+            self.last_ms = 0.0
+            return 0
+        budget_ns = (self.budget_ms if budget_ms is None else budget_ms) * 1e6
+        start = now = time.perf_counter_ns()
+        steps = 0
+        while queue and (steps == 0 or now - start < budget_ns):
+            job = queue[0][2]
+            if not job.pending:  # Annulé, ou terminé par Job.finish
+                heapq.heappop(queue)
+                continue
+            step_start = now
+            try:
+                next(job.steps)
+            except StopIteration:
+                job.done = True
+                heapq.heappop(queue)
+            steps += 1
+            now = time.perf_counter_ns()
+            if self.profiler.enabled:
+                self.profiler.events.append((f"job:{job.name}", step_start, now - step_start))
+        self.steps += steps
+        self.last_ms = (now - start) / 1e6
+        if now - start > budget_ns:
+            self.overruns += 1
+        return steps
+
+    def run_all(self):
+        """
+        Termine tous les travaux en attente, sans budget (sorties, outils)
+
+        Returns:
+            int: Nombre d'étapes exécutées
+        """
+        return self.run(float("inf"))
+
+    def cancel_all(self):
+        """Annule tous les travaux en attente"""
+        for _, _, job in self._queue:
+            job.cancel()
+        self._queue.clear()
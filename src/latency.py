@@ -0,0 +1,198 @@
+"""
+Module de latence d'entrée - Du clic (ou de la touche) à l'image affichée
+
+FramePacer cadence la boucle principale. En mode normal, les événements sont
+lus en début de frame et wait_async attend la fin du budget après le
+flip. En mode faible latence, la boucle guette les entrées elle-même (file
+relue toutes les LOW_LATENCY_POLL_MS) jusqu'à l'échéance de la frame : un
+clic ou une touche est traité et présenté aussitôt, sans attendre le reste du
+budget.
+
+Les FPS visés peuvent changer en cours de partie (écran Options) : 0 retire la
+limite, et le ralenti au repos (idle_fps) les abaisse quand aucune entrée
+n'est arrivée depuis IDLE_TIMEOUT.
+
+InputLatency mesure, pour chaque clic et touche, le temps entre sa lecture
+et le flip qui suit (exact), et borne l'attente dans la file d'événements par
+l'intervalle depuis la lecture précédente.
+
+La boucle principale est une tâche asyncio (voir src/runtime.py) : poll_async
+et wait_async n'attendent jamais en bloquant le thread (asyncio.sleep), la fin
+de frame tombe sur des échéances fixes (pas de dérive), et les autres tâches
+avancent pendant les deux attentes.
+"""
+import asyncio
+import time
+from collections import deque
+import pygame
+from .constants import LATENCY_SAMPLES, LOW_LATENCY_POLL_MS, IDLE_TIMEOUT
+from .profiler import percentile
+
+LOW_LATENCY_ENV = "RPG_LOW_LATENCY"
+
+# Entrées mesurées, qui déclenchent aussi une frame immédiate en mode faible latence
+INPUT_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.QUIT)
+
+
+class InputLatency:
+    """Latences entrée -> présentation des dernières entrées"""
+
+    def __init__(self, size=LATENCY_SAMPLES):
+        """
+        Initialise la mesure
+
+        Args:
+            size (int): Nombre de mesures conservées
+        """
+        # (lecture -> flip, attente maximale dans la file) en ms
+        self.samples = deque(maxlen=size)
+        self._pending = []  # (instant de lecture, attente maximale) en attente du flip
+
+    def received(self, events, now, queue_bound):
+        """
+        Note les entrées lues dans un lot d'événements
+
+        Args:
+            events (list): Événements lus
+            now (float): Instant de lecture (time.perf_counter)
+            queue_bound (float): Attente maximale dans la file (s)
+        """
+        for event in events:
+            if event.type in INPUT_EVENTS:
+                self._pending.append((now, queue_bound))
+
+    def presented(self, now):
+        """
+        Le flip vient d'afficher le résultat des entrées en attente
+
+        Args:
+            now (float): Instant de fin du flip (time.perf_counter)
+        """
+        for received, queue_bound in self._pending:
+            self.samples.append(((now - received) * 1000, queue_bound * 1000))
+        self._pending.clear()
+
+    def percentiles(self):
+        """
+        Percentiles des latences mesurées
+
+        Returns:
+            dict: p50/p95/p99 de la latence mesurée (lecture -> flip) et
+                p99 du pire cas (attente maximale dans la file incluse), en ms
+        """
+        measured = sorted(sample[0] for sample in self.samples)
+        worst = sorted(sample[0] + sample[1] for sample in self.samples)
+        return {
+            "count": len(measured),
+            "p50": percentile(measured, 0.5),
+            "p95": percentile(measured, 0.95),
+            "p99": percentile(measured, 0.99),
+            "worst_p99": percentile(worst, 0.99),
+        }
+
+    def report(self):
+        """
+        Résumé lisible des latences
+
+        Returns:
+            str: Résumé
+        """
+        stats = self.percentiles()
+        return (f"Latence entrée -> écran ({stats['count']} entrées) : "
+                f"p50 {stats['p50']:.1f}  p95 {stats['p95']:.1f}  p99 {stats['p99']:.1f} ms "
+                f"(pire cas p99 {stats['worst_p99']:.1f} ms)")
+
+
+class FramePacer:
+    """Cadence de la boucle principale : lecture des entrées et présentation"""
+
+    def __init__(self, clock, fps, low_latency=False, present=pygame.display.flip):
+        """
+        Initialise la cadence
+
+        Args:
+            clock (pygame.time.Clock): Horloge de la boucle
+            fps (int): Images par seconde visées (0 = illimité)
+            low_latency (bool): Mode faible latence - optionnel
+            present: Fonction qui affiche la frame - optionnel
+        """
+        self.clock = clock
+        self.fps = fps
+        self.idle_fps = None  # FPS au repos (None = pas de ralenti)
+        self.low_latency = low_latency
+        self.latency = InputLatency()
+        self._present = present
+        self._last_poll = time.perf_counter()
+        self._last_present = self._last_poll
+        self._last_input = self._last_poll
+        self._deadline = self._last_poll  # Échéance de la frame en cours (wait_async)
+
+    def frame_rate(self):
+        """
+        FPS visés pour la frame en cours
+
+        Returns:
+            int: FPS (0 = illimité), abaissés au repos si le ralenti est activé
+        """
+        if self.idle_fps and time.perf_counter() - self._last_input > IDLE_TIMEOUT / 1000:
+            return min(self.fps, self.idle_fps) if self.fps else self.idle_fps
+        return self.fps
+
+    async def poll_async(self):
+        """
+        Lit les événements de la frame sans bloquer la boucle asyncio
+
+        En mode faible latence, relit la file toutes les LOW_LATENCY_POLL_MS
+        jusqu'à l'échéance de la frame ou jusqu'à la première entrée (clic,
+        touche), selon ce qui arrive d'abord.
+
+        Returns:
+            list: Événements à traiter
+        """
+        previous_read = self._last_poll
+        events = pygame.event.get()
+        fps = self.frame_rate()
+        if self.low_latency and fps:
+            deadline = self._last_present + 1 / fps
+            batch = events
+            while not any(event.type in INPUT_EVENTS for event in batch):
+                read = time.perf_counter()
+                if read >= deadline:
+                    break
+                await asyncio.sleep(min(deadline - read, LOW_LATENCY_POLL_MS / 1000))
+                previous_read = read
+                batch = pygame.event.get()
+                events.extend(batch)
+
+        now = time.perf_counter()
+        if events:
+            self._last_input = now  # Toute activité (souris, timers) interrompt le ralenti
+        # Une entrée a pu attendre dans la file depuis la lecture précédente
+        self.latency.received(events, now, now - previous_read)
+        self._last_poll = now
+        return events
+
+    def present(self):
+        """Affiche la frame et note la latence des entrées qu'elle montre"""
+        self._present()
+        self._last_present = time.perf_counter()
+        self.latency.presented(self._last_present)
+
+    async def wait_async(self):
+        """
+        Fin de frame sans bloquer la boucle asyncio
+
+        Les échéances avancent d'un intervalle fixe (un réveil tardif ne décale
+        pas les frames suivantes) ; une frame en retard repart de maintenant au
+        lieu d'enchaîner des frames de rattrapage. En mode faible latence,
+        l'attente a lieu dans poll_async.
+        """
+        fps = 0 if self.low_latency else self.frame_rate()
+        now = time.perf_counter()
+        if fps:
+            self._deadline = max(self._deadline + 1 / fps, now)
+            await asyncio.sleep(self._deadline - now)
+        else:
+            self._deadline = now
+            await asyncio.sleep(0)
+        self.clock.tick()  # Mesure seulement (clock.get_fps)
@@ -0,0 +1,205 @@
+"""
+Module du classement - Meilleurs scores et statistiques cumulées (SQLite)
+
+Toutes les écritures passent par un thread dédié. Après chaque lot, ce
+thread publie les classements et les statistiques sous forme de tuples
+immuables : le menu les lit sans jamais interroger la base.
+"""
+import queue
+import sqlite3
+import threading
+import time
+from .constants import LEADERBOARD_DB, LEADERBOARD_SIZE
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created_at REAL NOT NULL,
+    seed INTEGER NOT NULL,
+    floor INTEGER NOT NULL,
+    victory INTEGER NOT NULL,
+    gold INTEGER NOT NULL,
+    enemies_killed INTEGER NOT NULL,
+    damage_dealt INTEGER NOT NULL,
+    damage_taken INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_gold ON runs (gold DESC, floor DESC);
+CREATE INDEX IF NOT EXISTS runs_by_floor ON runs (floor DESC, gold DESC);
+
+CREATE TABLE IF NOT EXISTS lifetime (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    runs INTEGER NOT NULL DEFAULT 0,
+    victories INTEGER NOT NULL DEFAULT 0,
+    gold INTEGER NOT NULL DEFAULT 0,
+    enemies_killed INTEGER NOT NULL DEFAULT 0,
+    damage_dealt INTEGER NOT NULL DEFAULT 0,
+    damage_taken INTEGER NOT NULL DEFAULT 0,
+    best_floor INTEGER NOT NULL DEFAULT 0,
+    best_gold INTEGER NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO lifetime (id) VALUES (1);
+
+-- Agrégats maintenus à chaque insertion : jamais de parcours complet de runs
+CREATE TRIGGER IF NOT EXISTS runs_lifetime AFTER INSERT ON runs
+BEGIN
+    UPDATE lifetime SET
+        runs = runs + 1,
+        victories = victories + NEW.victory,
+        gold = gold + NEW.gold,
+        enemies_killed = enemies_killed + NEW.enemies_killed,
+        damage_dealt = damage_dealt + NEW.damage_dealt,
+        damage_taken = damage_taken + NEW.damage_taken,
+        best_floor = MAX(best_floor, NEW.floor),
+        best_gold = MAX(best_gold, NEW.gold)
+    WHERE id = 1;
+END;
+"""
+
+_INSERT = """
+INSERT INTO runs (created_at, seed, floor, victory, gold, enemies_killed,
+                  damage_dealt, damage_taken)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_TOP_QUERIES = {
+    "gold": "SELECT floor, gold, enemies_killed, victory FROM runs "
+            "ORDER BY gold DESC, floor DESC LIMIT ?",
+    "floor": "SELECT floor, gold, enemies_killed, victory FROM runs "
+             "ORDER BY floor DESC, gold DESC LIMIT ?",
+}
+
+LIFETIME_FIELDS = ("runs", "victories", "gold", "enemies_killed",
+                   "damage_dealt", "damage_taken", "best_floor", "best_gold")
+
+_STOP = object()
+
+
+class LeaderboardError(Exception):
+    """Erreur levée quand la base du classement ne peut pas être ouverte"""
+
+
+def open_database(path=LEADERBOARD_DB):
+    """
+    Ouvre la base du classement en mode WAL et crée le schéma
+
+    Args:
+        path (str): Chemin de la base SQLite
+
+    Returns:
+        sqlite3.Connection: Connexion prête à l'emploi
+    """
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(_SCHEMA)
+    connection.commit()
+    return connection
+
+
+class Leaderboard:
+    """Classement persistant alimenté par un thread d'écriture"""
+
+    def __init__(self, path=LEADERBOARD_DB, size=LEADERBOARD_SIZE):
+        """
+        Ouvre le classement et démarre le thread d'écriture
+
+        Args:
+            path (str): Chemin de la base SQLite
+            size (int): Nombre d'entrées affichées par classement
+
+        Raises:
+            LeaderboardError: Si la base est illisible ou ne peut pas être créée
+        """
+        self.path = path
+        self.size = size
+
+        # Instantanés publiés par le thread d'écriture (lecture sans verrou)
+        self.top = {"gold": (), "floor": ()}
+        self.lifetime = dict.fromkeys(LIFETIME_FIELDS, 0)
+        self.version = 0
+
+        self._queue = queue.Queue()
+        self._ready = threading.Event()
+        self._error = None  # Erreur d'ouverture de la base (le thread s'arrête aussitôt)
+        self._thread = threading.Thread(target=self._run, name="leaderboard", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            self._thread.join()
+            raise LeaderboardError(f"Classement {path} inutilisable: {self._error}") from self._error
+
+    def record(self, summary):
+        """
+        Programme l'enregistrement d'une run (non bloquant)
+
+        Args:
+            summary (dict): Résumé produit par Game.run_summary()
+        """
+        self._queue.put((
+            time.time(), summary["seed"], summary["floor"], int(summary["victory"]),
+            summary["gold"], summary["enemies_killed"],
+            summary["total_damage_dealt"], summary["total_damage_taken"],
+        ))
+
+    def flush(self):
+        """Attend que toutes les écritures en attente soient terminées"""
+        self._queue.join()
+
+    def close(self):
+        """Écrit les runs restantes et arrête le thread d'écriture"""
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _run(self):
+        """Boucle du thread d'écriture"""
+        connection = None
+        try:
+            connection = open_database(self.path)
+            self._publish(connection)
+        except sqlite3.Error as e:
+            self._error = e
+            if connection is not None:
+                connection.close()
+            return
+        finally:
+            self._ready.set()
+
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            # Regroupe toutes les runs en attente dans une seule transaction
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            rows = [item for item in batch if item is not _STOP]
+            running = len(rows) == len(batch)
+            try:
+                if rows:
+                    with connection:
+                        connection.executemany(_INSERT, rows)
+                    self._publish(connection)
+            except sqlite3.Error as e:
+                print(f"Erreur lors de l'écriture du classement {self.path}: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+        connection.close()
+
+    def _publish(self, connection):
+        """
+        Relit les classements (requêtes indexées) et les publie
+
+        Args:
+            connection (sqlite3.Connection): Connexion du thread d'écriture
+        """
+        top = {key: tuple(connection.execute(sql, (self.size,)))
+               for key, sql in _TOP_QUERIES.items()}
+        row = connection.execute(
+            f"SELECT {', '.join(LIFETIME_FIELDS)} FROM lifetime WHERE id = 1").fetchone()
+        self.top = top
+        self.lifetime = dict(zip(LIFETIME_FIELDS, row))
+        self.version += 1
@@ -2,34 +2,47 @@
 Module pour le menu principal du jeu
 """
 import pygame
-from .ui import Button
+from .ui import Button, render_text
+from .profiler import PROFILER
+from .render import as_backend
+from .settings import SETTINGS_CHOICES
 from .constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK,
-    BLUE, GOLD, RED, PURPLE
+    BLUE, GOLD, RED, PURPLE, GRAY
 )
 
 
 class Menu:
     """Classe pour le menu principal"""
 
-    def __init__(self, screen, font_large, font_medium, font_small):
+    def __init__(self, screen, font_large, font_medium, font_small, leaderboard=None, settings=None):
         """
         Initialise le menu
 
         Args:
-            screen: Surface pygame principale
+            screen: Backend de rendu ou surface pygame principale (voir src.render)
             font_large: Grande police
             font_medium: Police moyenne
             font_small: Petite police
+            leaderboard (Leaderboard): Classement à afficher - optionnel
+            settings (Settings): Options modifiables depuis l'écran Options - optionnel
         """
-        self.screen = screen
+        self.screen = as_backend(screen)
         self.font_large = font_large
         self.font_medium = font_medium
         self.font_small = font_small
+        self.leaderboard = leaderboard
+        self.settings = settings
 
         # État du menu
-        self.state = "main"  # main, options, credits
+        self.state = "main"  # main, resume, options, leaderboard
         self.selected_action = None
+        self.dirty = True  # À redessiner (événement reçu depuis le dernier affichage)
+
+        # Classement : tri affiché et lignes pré-rendues (refaites si le classement change)
+        self.leaderboard_sort = "gold"
+        self._leaderboard_key = None
+        self._leaderboard_lines = []
 
         # Créer les boutons
         self._create_buttons()
@@ -37,9 +50,10 @@ class Menu:
     def _create_buttons(self):
         """Crée les boutons du menu"""
         button_width = 300
-        button_height = 60
+        button_height = 48
         button_x = SCREEN_WIDTH // 2 - button_width // 2
-        start_y = SCREEN_HEIGHT // 2 - 50
+        start_y = SCREEN_HEIGHT // 2 - 100
+        spacing = 56
 
         # Boutons du menu principal
         self.main_buttons = [
@@ -49,17 +63,58 @@ class Menu:
                 "Jouer", BLUE, PURPLE, self.font_medium
             ),
             Button(
-                button_x, start_y + 80,
+                button_x, start_y + spacing,
+                button_width, button_height,
+                "Mode Infini", BLUE, PURPLE, self.font_medium
+            ),
+            Button(
+                button_x, start_y + spacing * 2,
+                button_width, button_height,
+                "Mode Horde", BLUE, PURPLE, self.font_medium
+            ),
+            Button(
+                button_x, start_y + spacing * 3,
+                button_width, button_height,
+                "Classement", BLUE, PURPLE, self.font_medium
+            ),
+            Button(
+                button_x, start_y + spacing * 4,
                 button_width, button_height,
                 "Options", BLUE, PURPLE, self.font_medium
             ),
             Button(
-                button_x, start_y + 160,
+                button_x, start_y + spacing * 5,
                 button_width, button_height,
                 "Quitter", RED, GOLD, self.font_medium
             )
         ]
 
+        # Boutons des options : un par option, un clic passe à la valeur suivante
+        self.option_names = list(SETTINGS_CHOICES) if self.settings else []
+        option_width = 420
+        self.option_buttons = [
+            Button(
+                SCREEN_WIDTH // 2 - option_width // 2, 100 + i * 39,
+                option_width, 34,
+                self.settings.label(name), BLUE, PURPLE, self.font_small
+            )
+            for i, name in enumerate(self.option_names)
+        ]
+
+        # Run sauvegardée : continuer ou recommencer (voir offer_resume)
+        self.resume_buttons = [
+            Button(
+                button_x, start_y,
+                button_width, button_height,
+                "Continuer", BLUE, PURPLE, self.font_medium
+            ),
+            Button(
+                button_x, start_y + spacing,
+                button_width, button_height,
+                "Nouvelle partie", BLUE, PURPLE, self.font_medium
+            )
+        ]
+
         # Bouton retour pour les sous-menus
         self.back_button = Button(
             50, SCREEN_HEIGHT - 100,
@@ -67,6 +122,13 @@ class Menu:
             "Retour", BLUE, PURPLE, self.font_small
         )
 
+        # Bouton de tri du classement
+        self.sort_button = Button(
+            SCREEN_WIDTH - 250, SCREEN_HEIGHT - 100,
+            200, 50,
+            "Trier par étage", BLUE, PURPLE, self.font_small
+        )
+
     def handle_events(self, event):
         """
         Gère les événements du menu
@@ -75,26 +137,103 @@ class Menu:
             event: Événement pygame
 
         Returns:
-            str: Action sélectionnée ('play', 'quit', None)
+            str: Action sélectionnée ('play', 'continue', 'new_run', 'endless', 'horde',
+                'settings', 'quit', None)
         """
+        self.dirty = True
         if self.state == "main":
             # Gérer les clics sur les boutons principaux
             for i, button in enumerate(self.main_buttons):
                 if button.handle_event(event):
                     if i == 0:  # Jouer
                         return "play"
-                    elif i == 1:  # Options
+                    elif i == 1:  # Mode Infini
+                        return "endless"
+                    elif i == 2:  # Mode Horde
+                        return "horde"
+                    elif i == 3:  # Classement
+                        self.state = "leaderboard"
+                    elif i == 4:  # Options
                         self.state = "options"
-                    elif i == 2:  # Quitter
+                        if self.settings:
+                            # F3 bascule le profileur sans passer par les options
+                            self.settings.set("profiler", PROFILER.enabled)
+                            self.update_option_buttons()
+                    elif i == 5:  # Quitter
                         return "quit"
 
+        elif self.state == "resume":
+            if self.back_button.handle_event(event):
+                self.state = "main"
+            elif self.resume_buttons[0].handle_event(event):
+                self.state = "main"
+                return "continue"
+            elif self.resume_buttons[1].handle_event(event):
+                self.state = "main"
+                return "new_run"
+
         elif self.state == "options":
             # Gérer le bouton retour
             if self.back_button.handle_event(event):
                 self.state = "main"
+            for name, button in zip(self.option_names, self.option_buttons):
+                if button.handle_event(event):
+                    self.settings.cycle(name)
+                    button.update_text(self.settings.label(name))
+                    return "settings"
+
+        elif self.state == "leaderboard":
+            if self.back_button.handle_event(event):
+                self.state = "main"
+            elif self.sort_button.handle_event(event):
+                self.leaderboard_sort = "floor" if self.leaderboard_sort == "gold" else "gold"
+                self.sort_button.update_text(
+                    "Trier par or" if self.leaderboard_sort == "floor" else "Trier par étage")
 
         return None
 
+    def offer_resume(self, floor):
+        """
+        Propose de continuer la run sauvegardée ou d'en commencer une nouvelle
+
+        Args:
+            floor (int): Étage de la run sauvegardée
+        """
+        self.state = "resume"
+        self.resume_buttons[0].update_text(f"Continuer (étage {floor})")
+        self.dirty = True
+
+    def update_option_buttons(self):
+        """Met à jour le texte des boutons d'options (options modifiées ailleurs)"""
+        for name, button in zip(self.option_names, self.option_buttons):
+            button.update_text(self.settings.label(name))
+
+    def widgets(self):
+        """
+        Boutons du menu, tous écrans confondus
+
+        Returns:
+            list: Boutons
+        """
+        return (self.main_buttons + self.resume_buttons + self.option_buttons
+                + [self.back_button, self.sort_button])
+
+    def on_enter(self):
+        """Le menu redevient visible (voir SceneManager) : l'image est à redessiner"""
+        self.dirty = True
+
+    def needs_redraw(self):
+        """
+        Indique si l'écran a changé depuis le dernier affichage
+
+        Returns:
+            bool: True après un événement ou une mise à jour du classement
+        """
+        if self.dirty:
+            return True
+        return (self.state == "leaderboard" and self.leaderboard is not None
+                and (self.leaderboard.version, self.leaderboard_sort) != self._leaderboard_key)
+
     def draw(self):
         """Dessine le menu"""
         # Fond
@@ -102,19 +241,24 @@ class Menu:
 
         if self.state == "main":
             self._draw_main_menu()
+        elif self.state == "resume":
+            self._draw_resume()
         elif self.state == "options":
             self._draw_options()
+        elif self.state == "leaderboard":
+            self._draw_leaderboard()
+        self.dirty = False
 
     def _draw_main_menu(self):
         """Dessine le menu principal"""
         # Titre
-        title_text = self.font_large.render("RPG ROGUELIKE", True, GOLD)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
+        title_text = render_text(self.font_large, "RPG ROGUELIKE", GOLD)
+        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 110))
         self.screen.blit(title_text, title_rect)
 
         # Sous-titre
-        subtitle_text = self.font_small.render("Aventure Tour par Tour", True, WHITE)
-        subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
+        subtitle_text = render_text(self.font_small, "Aventure Tour par Tour", WHITE)
+        subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, 160))
         self.screen.blit(subtitle_text, subtitle_rect)
 
         # Dessiner les boutons
@@ -122,35 +266,100 @@ class Menu:
             button.draw(self.screen)
 
         # Instructions
-        info_text = self.font_small.render(
+        info_text = render_text(
+            self.font_small,
             "Traversez les étages et battez tous les ennemis !",
-            True, WHITE
+            WHITE
         )
         info_rect = info_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
         self.screen.blit(info_text, info_rect)
 
+    def _draw_resume(self):
+        """Dessine le choix entre la run sauvegardée et une nouvelle partie"""
+        title_text = render_text(self.font_large, "PARTIE EN COURS", GOLD)
+        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 110))
+        self.screen.blit(title_text, title_rect)
+
+        for button in self.resume_buttons:
+            button.draw(self.screen)
+
+        info_text = render_text(self.font_small, "Une nouvelle partie remplace la sauvegarde", GRAY)
+        info_rect = info_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 160))
+        self.screen.blit(info_text, info_rect)
+
+        self.back_button.draw(self.screen)
+
     def _draw_options(self):
         """Dessine le menu des options"""
         # Titre
-        title_text = self.font_large.render("OPTIONS", True, GOLD)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
+        title_text = render_text(self.font_large, "OPTIONS", GOLD)
+        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 60))
         self.screen.blit(title_text, title_rect)
 
-        # Info (pour l'instant juste un placeholder)
-        info_lines = [
-            "Volume: 100%",
-            "Difficulté: Normal",
-            "Résolution: 800x600",
-            "",
-            "(Options à venir...)"
-        ]
+        if not self.option_buttons:
+            text = render_text(self.font_small, "Options indisponibles", GRAY)
+            self.screen.blit(text, text.get_rect(center=(SCREEN_WIDTH // 2, 250)))
 
-        y = 250
-        for line in info_lines:
-            text = self.font_small.render(line, True, WHITE)
-            text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y))
-            self.screen.blit(text, text_rect)
-            y += 40
+        # Un clic sur une option passe à la valeur suivante (appliquée aussitôt)
+        for button in self.option_buttons:
+            button.draw(self.screen)
+
+        info_text = render_text(self.font_small, "Cliquez sur une option pour la changer", GRAY)
+        info_rect = info_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 75))
+        self.screen.blit(info_text, info_rect)
 
         # Bouton retour
         self.back_button.draw(self.screen)
+
+    def _draw_leaderboard(self):
+        """Dessine le classement et les statistiques cumulées"""
+        # Titre
+        title_text = render_text(self.font_large, "CLASSEMENT", GOLD)
+        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 60))
+        self.screen.blit(title_text, title_rect)
+
+        # Les lignes ne sont re-rendues que si le classement ou le tri a changé
+        version = self.leaderboard.version if self.leaderboard else 0
+        key = (version, self.leaderboard_sort)
+        if key != self._leaderboard_key:
+            self._leaderboard_lines = self._render_leaderboard_lines()
+            self._leaderboard_key = key
+
+        for surface, pos in self._leaderboard_lines:
+            self.screen.blit(surface, pos)
+
+        self.back_button.draw(self.screen)
+        self.sort_button.draw(self.screen)
+
+    def _render_leaderboard_lines(self):
+        """
+        Pré-rend les lignes du classement
+
+        Returns:
+            list: Couples (surface, position)
+        """
+        lines = []
+        if not self.leaderboard:
+            text = self.font_small.render("Classement indisponible", True, GRAY)
+            return [(text, text.get_rect(center=(SCREEN_WIDTH // 2, 250)))]
+
+        header = "Meilleurs scores (or)" if self.leaderboard_sort == "gold" \
+            else "Meilleurs scores (étage)"
+        text = self.font_medium.render(header, True, WHITE)
+        lines.append((text, text.get_rect(center=(SCREEN_WIDTH // 2, 115))))
+
+        y = 150
+        for rank, (floor, gold, kills, victory) in enumerate(
+                self.leaderboard.top[self.leaderboard_sort], 1):
+            label = "Victoire" if victory else f"Etage {floor}"
+            row = f"{rank:>2}. {gold:>6} Or   {label:<10}  {kills} ennemis"
+            color = GOLD if rank == 1 else WHITE
+            lines.append((self.font_small.render(row, True, color), (SCREEN_WIDTH // 2 - 170, y)))
+            y += 24
+
+        stats = self.leaderboard.lifetime
+        summary = (f"Runs: {stats['runs']}   Victoires: {stats['victories']}   "
+                   f"Or total: {stats['gold']}   Meilleur étage: {stats['best_floor']}")
+        text = self.font_small.render(summary, True, GRAY)
+        lines.append((text, text.get_rect(center=(SCREEN_WIDTH // 2, 410))))
+        return lines
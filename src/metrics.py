@@ -0,0 +1,347 @@
+"""
+Module des métriques - Compteurs, jauges et histogrammes au format Prometheus
+
+Les métriques sont mises à jour par le thread principal, dans la frame :
+une mise à jour est une addition sur un attribut ou une case d'une liste
+préallouée (ni verrou, ni dictionnaire, ni chaîne formatée). Un seul thread
+écrit ; le thread de MetricsServer se contente de lire les valeurs au moment
+d'une collecte, sans jamais bloquer la boucle de jeu.
+
+MetricsServer (opt-in, RPG_METRICS=port, hôte:port ou unix:chemin) sert le
+registre au format texte de Prometheus sur GET /metrics, depuis un thread
+d'arrière-plan.
+
+Les taux de succès des caches se déduisent des compteurs :
+hits / (hits + misses).
+"""
+import http.server
+import os
+import socketserver
+import threading
+from bisect import bisect_left
+from .constants import METRICS_HOST, METRICS_PORT, MAX_FLOOR
+
+METRICS_ENV = "RPG_METRICS"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format(value):
+    """
+    Valeur au format Prometheus
+
+    Args:
+        value (float): Valeur
+
+    Returns:
+        str: Entier sans décimale, sinon représentation flottante
+    """
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """Compteur monotone"""
+
+    __slots__ = ("name", "help", "value")
+    kind = "counter"
+
+    def __init__(self, name, help_text):
+        """
+        Initialise le compteur à 0
+
+        Args:
+            name (str): Nom Prometheus (suffixe _total)
+            help_text (str): Description
+        """
+        self.name = name
+        self.help = help_text
+        self.value = 0
+
+    def inc(self, amount=1):
+        """
+        Incrémente le compteur
+
+        Args:
+            amount (int | float): Incrément positif - optionnel
+        """
+        self.value += amount
+
+    def samples(self):
+        """
+        Échantillons exposés
+
+        Returns:
+            list: Couples (nom, valeur)
+        """
+        return [(self.name, self.value)]
+
+
+class Gauge:
+    """Valeur instantanée"""
+
+    __slots__ = ("name", "help", "value")
+    kind = "gauge"
+
+    def __init__(self, name, help_text):
+        """
+        Initialise la jauge à 0
+
+        Args:
+            name (str): Nom Prometheus
+            help_text (str): Description
+        """
+        self.name = name
+        self.help = help_text
+        self.value = 0
+
+    def set(self, value):
+        """
+        Fixe la valeur
+
+        Args:
+            value (int | float): Nouvelle valeur
+        """
+        self.value = value
+
+    def samples(self):
+        """
+        Échantillons exposés
+
+        Returns:
+            list: Couples (nom, valeur)
+        """
+        return [(self.name, self.value)]
+
+
+class Histogram:
+    """Répartition d'observations dans des intervalles fixes"""
+
+    __slots__ = ("name", "help", "bounds", "counts", "sum")
+    kind = "histogram"
+
+    def __init__(self, name, help_text, bounds):
+        """
+        Initialise un histogramme vide
+
+        Args:
+            name (str): Nom Prometheus
+            help_text (str): Description
+            bounds (tuple): Bornes supérieures croissantes des intervalles (+Inf ajouté)
+        """
+        self.name = name
+        self.help = help_text
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # Dernier intervalle : au-delà de la dernière borne
+        self.sum = 0
+
+    def observe(self, value):
+        """
+        Ajoute une observation
+
+        Args:
+            value (int | float): Valeur observée
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def samples(self):
+        """
+        Échantillons exposés (intervalles cumulés, somme et nombre)
+
+        Returns:
+            list: Couples (nom avec étiquettes, valeur)
+        """
+        counts = list(self.counts)  # Instantané : le thread principal peut écrire pendant la lecture
+        samples = []
+        total = 0
+        for bound, count in zip(self.bounds + (float("inf"),), counts):
+            total += count
+            label = "+Inf" if bound == float("inf") else _format(bound)
+            samples.append((f'{self.name}_bucket{{le="{label}"}}', total))
+        samples.append((f"{self.name}_sum", self.sum))
+        samples.append((f"{self.name}_count", total))
+        return samples
+
+
+class MetricsRegistry:
+    """Métriques exposées, par nom"""
+
+    def __init__(self):
+        """Initialise un registre vide"""
+        self.metrics = {}
+
+    def _register(self, metric):
+        """
+        Enregistre une métrique
+
+        Args:
+            metric: Counter, Gauge ou Histogram
+
+        Returns:
+            La métrique enregistrée
+
+        Raises:
+            ValueError: Si le nom est déjà pris
+        """
+        if metric.name in self.metrics:
+            raise ValueError(f"Métrique déjà enregistrée : {metric.name}")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, help_text):
+        """Crée et enregistre un compteur (voir Counter)"""
+        return self._register(Counter(name, help_text))
+
+    def gauge(self, name, help_text):
+        """Crée et enregistre une jauge (voir Gauge)"""
+        return self._register(Gauge(name, help_text))
+
+    def histogram(self, name, help_text, bounds):
+        """Crée et enregistre un histogramme (voir Histogram)"""
+        return self._register(Histogram(name, help_text, bounds))
+
+    def render(self):
+        """
+        Registre au format texte de Prometheus
+
+        Returns:
+            str: Exposition (HELP, TYPE puis échantillons de chaque métrique)
+        """
+        lines = []
+        for metric in list(self.metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, value in metric.samples():
+                lines.append(f"{name} {_format(value)}")
+        lines.append("")
+        return "\n".join(lines)
+
+
+# Registre partagé et métriques du jeu
+METRICS = MetricsRegistry()
+
+FRAME_TIME = METRICS.histogram(
+    "rpg_frame_seconds", "Temps de travail d'une frame, attente exclue",
+    (0.002, 0.004, 0.008, 0.0167, 0.0333, 0.05, 0.1, 0.25))
+FPS_GAUGE = METRICS.gauge("rpg_fps", "Images par seconde (moyenne de pygame.time.Clock)")
+TEXT_CACHE_HITS = METRICS.counter("rpg_text_cache_hits_total", "Textes trouvés dans le cache de render_text")
+TEXT_CACHE_MISSES = METRICS.counter("rpg_text_cache_misses_total", "Textes rendus par render_text")
+IMAGE_CACHE_HITS = METRICS.counter("rpg_image_cache_hits_total", "Sprites trouvés dans le cache de load_image")
+IMAGE_CACHE_MISSES = METRICS.counter("rpg_image_cache_misses_total", "Sprites chargés ou redimensionnés")
+GC_PAUSE = METRICS.histogram(
+    "rpg_gc_pause_seconds", "Pause du ramasse-miettes par frame avec collecte",
+    (0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05))
+RUNS_STARTED = METRICS.counter("rpg_runs_started_total", "Runs commencées")
+RUNS_FINISHED = METRICS.counter("rpg_runs_finished_total", "Runs terminées (défaite ou victoire)")
+VICTORIES = METRICS.counter("rpg_victories_total", "Runs gagnées")
+DEATH_FLOOR = METRICS.histogram("rpg_death_floor", "Étage atteint par les runs perdues",
+                                range(1, MAX_FLOOR + 1))
+DAMAGE_DEALT = METRICS.counter("rpg_damage_dealt_total", "Dégâts infligés (runs terminées)")
+DAMAGE_TAKEN = METRICS.counter("rpg_damage_taken_total", "Dégâts reçus (runs terminées)")
+
+
+def record_run_start(game):
+    """
+    Compte une run commencée (écouteur Game.start_listeners)
+
+    Args:
+        game (Game): Partie réinitialisée
+    """
+    RUNS_STARTED.inc()
+
+
+def record_run(summary):
+    """
+    Compte une run terminée (écouteur Game.run_listeners)
+
+    Args:
+        summary (dict): Résumé de la run (voir Game.run_summary)
+    """
+    RUNS_FINISHED.inc()
+    if summary["victory"]:
+        VICTORIES.inc()
+    else:
+        DEATH_FLOOR.observe(summary["floor"])
+    DAMAGE_DEALT.inc(summary["total_damage_dealt"])
+    DAMAGE_TAKEN.inc(summary["total_damage_taken"])
+
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    """Réponses HTTP du serveur de métriques (GET /metrics)"""
+
+    def do_GET(self):
+        """Sert le registre sur /metrics, 404 ailleurs"""
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Pas de journal par requête (collectes régulières)"""
+
+
+class _UnixHTTPServer(socketserver.UnixStreamServer):
+    """Serveur HTTP sur un socket Unix"""
+
+    def get_request(self):
+        """Connexion acceptée, avec une adresse de client factice (attendue par le handler)"""
+        request, _ = super().get_request()
+        return request, ("unix", 0)
+
+
+class MetricsServer:
+    """Exposition du registre dans un thread d'arrière-plan"""
+
+    def __init__(self, registry=METRICS, address=None):
+        """
+        Initialise le serveur (arrêté jusqu'à start)
+
+        Args:
+            registry (MetricsRegistry): Registre exposé - optionnel
+            address (str): "port", "hôte:port" ou "unix:chemin" (défaut METRICS_HOST:METRICS_PORT)
+        """
+        self.registry = registry
+        self.address = address or f"{METRICS_HOST}:{METRICS_PORT}"
+        self._server = None
+        self._thread = None
+
+    def start(self):
+        """
+        Ouvre le socket et sert les collectes dans un thread démon
+
+        Raises:
+            OSError: Si l'adresse est indisponible
+            ValueError: Si l'adresse est invalide
+        """
+        if self.address.startswith("unix:"):
+            path = self.address[len("unix:"):]
+            if os.path.exists(path):
+                os.remove(path)
+            server = _UnixHTTPServer(path, _MetricsHandler)
+        else:
+            host, _, port = self.address.rpartition(":")
+            server = http.server.HTTPServer((host or METRICS_HOST, int(port)), _MetricsHandler)
+        server.registry = self.registry
+        self._server = server
+        self._thread = threading.Thread(target=server.serve_forever, name="metrics", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Arrête le serveur et supprime le socket Unix éventuel"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self.address.startswith("unix:"):
+            path = self.address[len("unix:"):]
+            if os.path.exists(path):
+                os.remove(path)
+        self._server = None
+        self._thread.join()
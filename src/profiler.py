@@ -0,0 +1,319 @@
+"""
+Module de profilage par frame - Durée des phases de la boucle principale
+
+Désactivé, le profileur ne coûte qu'un appel par phase (PROFILER.phase renvoie
+un contexte vide) et les méthodes surveillées ne sont pas enveloppées. Activé
+(variable d'environnement RPG_PROFILE=1 ou touche F3), il enregistre chaque
+phase dans un tampon circulaire, affiche un overlay (FPS, courbe des temps de
+frame, p50/p99) et exporte une trace Chrome (chrome://tracing, Perfetto).
+"""
+import json
+import os
+import time
+from collections import deque
+import pygame
+from .render import as_backend
+from .constants import (
+    FPS, WHITE, GREEN, GOLD, RED, GRAY, PROFILER_FRAMES, PROFILER_EVENTS_PER_FRAME
+)
+
+PROFILE_ENV = "RPG_PROFILE"
+
+# Overlay : taille du panneau et rafraîchissement des textes (en frames)
+HUD_SIZE = (230, 120)
+HUD_REFRESH = 15
+
+
+class _NullPhase:
+    """Contexte vide renvoyé quand le profileur est désactivé"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        """Aucune mesure"""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Aucune mesure (les exceptions se propagent)"""
+        return False
+
+
+NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    """Mesure d'une phase (contexte with)"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        """
+        Prépare la mesure
+
+        Args:
+            profiler (FrameProfiler): Profileur qui enregistre la phase
+            name (str): Nom de la phase
+        """
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        """Début de la phase"""
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Fin de la phase : enregistrement (les exceptions se propagent)"""
+        self.profiler.events.append((self.name, self.start, time.perf_counter_ns() - self.start))
+        return False
+
+
+def percentile(sorted_values, ratio):
+    """
+    Percentile d'une liste triée (plus proche rang)
+
+    Args:
+        sorted_values (list): Valeurs triées
+        ratio (float): Percentile entre 0 et 1
+
+    Returns:
+        float: Valeur du percentile (0 si la liste est vide)
+    """
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(ratio * len(sorted_values)))]
+
+
+class FrameProfiler:
+    """Profileur des phases de frame avec tampon circulaire et overlay"""
+
+    def __init__(self, frames=PROFILER_FRAMES, enabled=False):
+        """
+        Initialise le profileur
+
+        Args:
+            frames (int): Nombre de frames conservées
+            enabled (bool): Active l'enregistrement dès le départ - optionnel
+        """
+        self.enabled = False
+        self.frame_times = deque(maxlen=frames)  # Durées des frames (ms)
+        # Phases enregistrées : (nom, début en ns, durée en ns)
+        self.events = deque(maxlen=frames * PROFILER_EVENTS_PER_FRAME)
+        self._frame_start = None
+        self._watched = []  # (classe, méthode, libellé, méthode d'origine ou None)
+
+        # Overlay : panneau et textes re-rendus tous les HUD_REFRESH frames
+        self._hud_panel = None
+        self._hud_lines = []
+        self._hud_age = HUD_REFRESH
+
+        if enabled:
+            self.enable()
+
+    def phase(self, name):
+        """
+        Contexte mesurant une phase
+
+        Args:
+            name (str): Nom de la phase
+
+        Returns:
+            Contexte à utiliser avec with (vide si désactivé)
+        """
+        if self.enabled:
+            return _Phase(self, name)
+        return NULL_PHASE
+
+    def begin_frame(self):
+        """Marque le début d'une frame (et la fin de la précédente)"""
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        if self._frame_start is not None:
+            duration = now - self._frame_start
+            self.frame_times.append(duration / 1e6)
+            self.events.append(("frame", self._frame_start, duration))
+        self._frame_start = now
+
+    def watch(self, cls, name, label=None):
+        """
+        Mesure une méthode comme une phase (enveloppée seulement si activé)
+
+        Args:
+            cls (type): Classe qui définit ou hérite de la méthode
+            name (str): Nom de la méthode
+            label (str): Nom de la phase (par défaut Classe.méthode) - optionnel
+        """
+        entry = [cls, name, label or f"{cls.__name__}.{name}", None]
+        self._watched.append(entry)
+        if self.enabled:
+            self._wrap(entry)
+
+    def _wrap(self, entry):
+        """
+        Remplace une méthode surveillée par une version mesurée
+
+        Args:
+            entry (list): Entrée de self._watched
+        """
+        cls, name, label, _ = entry
+        original = cls.__dict__.get(name)
+        method = getattr(cls, name)
+        events = self.events
+
+        def measured(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                events.append((label, start, time.perf_counter_ns() - start))
+
+        measured.__doc__ = method.__doc__
+        entry[3] = original
+        setattr(cls, name, measured)
+
+    def _unwrap(self, entry):
+        """
+        Restaure une méthode surveillée
+
+        Args:
+            entry (list): Entrée de self._watched
+        """
+        cls, name, _, original = entry
+        if original is None:
+            delattr(cls, name)  # Méthode héritée : on retire la surcharge
+        else:
+            setattr(cls, name, original)
+        entry[3] = None
+
+    def enable(self):
+        """Active l'enregistrement et enveloppe les méthodes surveillées"""
+        if self.enabled:
+            return
+        self.enabled = True
+        self._frame_start = None
+        for entry in self._watched:
+            self._wrap(entry)
+
+    def disable(self):
+        """Désactive l'enregistrement (les mesures restent exportables)"""
+        if not self.enabled:
+            return
+        self.enabled = False
+        for entry in reversed(self._watched):
+            self._unwrap(entry)
+
+    def toggle(self):
+        """Active ou désactive le profileur (touche F3)"""
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+
+    def frame_percentiles(self):
+        """
+        Percentiles des temps de frame enregistrés
+
+        Returns:
+            tuple: (p50, p99) en ms
+        """
+        times = sorted(self.frame_times)
+        return percentile(times, 0.5), percentile(times, 0.99)
+
+    def phase_averages(self):
+        """
+        Temps moyen par frame de chaque phase
+
+        Returns:
+            dict: Nom de la phase -> ms par frame
+        """
+        frames = max(1, len(self.frame_times))
+        totals = {}
+        for name, _, duration in self.events:
+            if name != "frame":
+                totals[name] = totals.get(name, 0) + duration
+        return {name: total / 1e6 / frames for name, total in totals.items()}
+
+    def export_chrome_trace(self, path):
+        """
+        Exporte les phases enregistrées au format Chrome trace-event (JSON)
+
+        Args:
+            path (str): Fichier de sortie
+
+        Returns:
+            int: Nombre d'événements exportés
+        """
+        events = list(self.events)
+        origin = min((start for _, start, _ in events), default=0)
+        pid = os.getpid()
+        trace = [
+            {"name": name, "ph": "X", "ts": (start - origin) / 1000, "dur": duration / 1000,
+             "pid": pid, "tid": 1, "cat": "frame" if name == "frame" else "phase"}
+            for name, start, duration in events
+        ]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+        return len(trace)
+
+    def draw_hud(self, surface, font_small, fps, target_fps=FPS):
+        """
+        Dessine l'overlay de performances (coin supérieur droit)
+
+        Args:
+            surface: Backend de rendu (ou surface pygame) où dessiner
+            font_small: Police pour le texte
+            fps (float): FPS mesurés (clock.get_fps())
+            target_fps (int): FPS visés, qui fixent le budget de frame (0 = illimité, sans budget) - optionnel
+        """
+        if not self.enabled:
+            return
+        surface = as_backend(surface)
+        if self._hud_panel is None:
+            self._hud_panel = pygame.Surface(HUD_SIZE)
+            self._hud_panel.set_alpha(200)
+
+        width, height = HUD_SIZE
+        x = surface.get_size()[0] - width - 10
+        y = 10
+        surface.blit(self._hud_panel, (x, y))
+
+        # Textes re-rendus quelques fois par seconde seulement
+        self._hud_age += 1
+        if self._hud_age >= HUD_REFRESH:
+            self._hud_age = 0
+            p50, p99 = self.frame_percentiles()
+            # Phases les plus coûteuses (hors attente de clock.tick)
+            phases = sorted((item for item in self.phase_averages().items() if item[0] != "tick"),
+                            key=lambda item: -item[1])[:2]
+            lines = [f"{fps:5.1f} FPS   p50 {p50:.1f}  p99 {p99:.1f} ms"]
+            lines += [f"{name} {ms:.2f} ms" for name, ms in phases]
+            self._hud_lines = [font_small.render(line, True, WHITE) for line in lines]
+        for i, text in enumerate(self._hud_lines):
+            surface.blit(text, (x + 6, y + 4 + i * 18))
+
+        # Courbe des temps de frame (échelle : deux budgets de frame, ou la pire frame sans limite de FPS)
+        budget = 1000 / target_fps if target_fps else None
+        graph_top = y + height - 50
+        graph_height = 44
+        if budget:
+            surface.lines(GRAY, [(x, graph_top + graph_height // 2), (x + width, graph_top + graph_height // 2)])
+        times = list(self.frame_times)[-width:]
+        if len(times) >= 2:
+            worst = max(times)
+            full_scale = 2 * budget if budget else max(worst, 0.1)
+            start_x = x + width - len(times)
+            points = [
+                (start_x + i, graph_top + graph_height - int(min(1.0, ms / full_scale) * graph_height))
+                for i, ms in enumerate(times)
+            ]
+            if budget is None:
+                color = WHITE
+            else:
+                color = GREEN if worst <= budget else GOLD if worst <= 2 * budget else RED
+            surface.lines(color, points)
+
+
+# Profileur partagé (RPG_PROFILE=1 l'active au démarrage)
+PROFILER = FrameProfiler(enabled=os.environ.get(PROFILE_ENV, "0") not in ("", "0"))
@@ -0,0 +1,356 @@
+"""
+Module des backends de rendu - Surface pygame ou textures SDL
+
+Game, Menu, Button, Character et l'overlay du profileur dessinent à travers
+une petite interface (fill, blit, rect, circle, lines, overlay) :
+
+- SurfaceBackend dessine sur une surface pygame (blits CPU, par défaut),
+  éventuellement plus petite que la taille logique (résolution interne
+  réduite : positions multipliées par l'échelle, images réduites une fois) ;
+- TextureBackend compose des textures avec pygame._sdl2.video.Renderer : les
+  images (sprites, textes du cache render_text, panneaux) sont envoyées une
+  seule fois par surface, et le mélange alpha des overlays plein écran et la
+  mise à l'échelle sont faits par le renderer SDL (GPU, ou renderer logiciel
+  SDL sur une machine sans GPU).
+
+Les surfaces blittées sont supposées immuables : une surface redessinée sur
+place (l'arène de la horde) est blittée avec changed=True pour renvoyer
+la texture (ou refaire sa copie réduite).
+"""
+import weakref
+import pygame
+from .constants import BLACK
+
+# Mode de mélange SDL des overlays translucides (SDL_BLENDMODE_BLEND)
+BLENDMODE_BLEND = 1
+
+
+def _rgba(color, alpha=255):
+    """Couleur (R, G, B, A) attendue par Renderer.draw_color"""
+    return (color[0], color[1], color[2], alpha)
+
+
+class RenderBackend:
+    """Interface de dessin commune aux backends"""
+
+    # True si l'image est conservée d'une frame à l'autre (sinon tout est redessiné)
+    retained = True
+
+    def get_size(self):
+        """
+        Taille de la zone de dessin
+
+        Returns:
+            tuple: (largeur, hauteur)
+        """
+        raise NotImplementedError
+
+    def fill(self, color):
+        """
+        Remplit toute la zone de dessin
+
+        Args:
+            color (tuple): Couleur (R, G, B)
+        """
+        raise NotImplementedError
+
+    def blit(self, image, dest, changed=False):
+        """
+        Dessine une image
+
+        Args:
+            image (pygame.Surface): Image à dessiner
+            dest: Position (x, y) ou Rect (seul le coin supérieur gauche compte)
+            changed (bool): L'image a été modifiée depuis son dernier blit - optionnel
+        """
+        raise NotImplementedError
+
+    def rect(self, color, rect, width=0):
+        """
+        Dessine un rectangle plein ou sa bordure
+
+        Args:
+            color (tuple): Couleur (R, G, B)
+            rect: Rectangle (x, y, largeur, hauteur)
+            width (int): Épaisseur de la bordure (0 = plein)
+        """
+        raise NotImplementedError
+
+    def circle(self, color, center, radius, width=0):
+        """
+        Dessine un cercle plein ou son contour
+
+        Args:
+            color (tuple): Couleur (R, G, B)
+            center (tuple): Centre (x, y)
+            radius (int): Rayon
+            width (int): Épaisseur du contour (0 = plein)
+        """
+        raise NotImplementedError
+
+    def lines(self, color, points):
+        """
+        Dessine une ligne brisée
+
+        Args:
+            color (tuple): Couleur (R, G, B)
+            points (list): Points (x, y) successifs
+        """
+        raise NotImplementedError
+
+    def overlay(self, color, alpha):
+        """
+        Recouvre toute la zone de dessin d'un voile translucide
+
+        Args:
+            color (tuple): Couleur (R, G, B)
+            alpha (int): Opacité (0 à 255)
+        """
+        raise NotImplementedError
+
+
+class SurfaceBackend(RenderBackend):
+    """Dessin sur une surface pygame (blits CPU), éventuellement à résolution réduite"""
+
+    def __init__(self, surface, size=None, scale=1.0, smooth=True):
+        """
+        Initialise le backend
+
+        Args:
+            surface (pygame.Surface): Surface où dessiner
+            size (tuple): Taille logique de la zone de dessin (défaut : celle de la surface)
+            scale (float): Rapport entre la surface et la taille logique - optionnel
+            smooth (bool): Lissage des images réduites (sinon pixels les plus proches) - optionnel
+        """
+        self.set_surface(surface, size, scale, smooth)
+
+    def set_surface(self, surface, size=None, scale=1.0, smooth=True):
+        """
+        Change de surface de dessin (les images réduites et les voiles sont recréés)
+
+        Avec une échelle différente de 1, les positions et tailles logiques sont
+        multipliées par l'échelle et chaque image blittée est réduite une seule
+        fois (copie conservée tant que l'image existe, refaite si changed=True).
+
+        Args:
+            surface (pygame.Surface): Surface où dessiner
+            size (tuple): Taille logique de la zone de dessin (défaut : celle de la surface)
+            scale (float): Rapport entre la surface et la taille logique - optionnel
+            smooth (bool): Lissage des images réduites - optionnel
+        """
+        self.surface = surface
+        self.size = tuple(size) if size is not None else surface.get_size()
+        self.scale = scale
+        self.smooth = smooth
+        self._overlays = {}  # (couleur, opacité) -> voile plein écran
+        # Copie réduite de chaque image blittée, libérée avec l'image
+        self._scaled = weakref.WeakKeyDictionary()
+
+    def get_size(self):
+        """Taille logique de la zone de dessin"""
+        return self.size
+
+    def _scaled_image(self, image, changed):
+        """
+        Copie d'une image à l'échelle de la surface (réduite au premier blit)
+
+        Args:
+            image (pygame.Surface): Image source
+            changed (bool): Refait la copie à partir de l'image
+
+        Returns:
+            pygame.Surface: Image à l'échelle
+        """
+        scaled = self._scaled.get(image)
+        if scaled is not None and not changed:
+            return scaled
+        width, height = image.get_size()
+        size = (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+        # smoothscale n'accepte que les images 24 ou 32 bits
+        smooth = self.smooth and image.get_bitsize() >= 24
+        transform = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        if scaled is None:
+            scaled = transform(image, size)
+            if image.get_alpha() is not None and not image.get_flags() & pygame.SRCALPHA:
+                scaled.set_alpha(image.get_alpha())
+            if image.get_colorkey() is not None:
+                scaled.set_colorkey(image.get_colorkey())
+            self._scaled[image] = scaled
+        else:
+            transform(image, size, scaled)
+        return scaled
+
+    def fill(self, color):
+        """Remplit la surface"""
+        self.surface.fill(color)
+
+    def blit(self, image, dest, changed=False):
+        """Blitte une image (réduite si l'échelle n'est pas 1)"""
+        scale = self.scale
+        if scale == 1:
+            self.surface.blit(image, dest)
+            return
+        self.surface.blit(self._scaled_image(image, changed),
+                          (round(dest[0] * scale), round(dest[1] * scale)))
+
+    def rect(self, color, rect, width=0):
+        """Dessine un rectangle avec pygame.draw"""
+        scale = self.scale
+        if scale != 1:
+            x, y, w, h = pygame.Rect(rect)
+            rect = (round(x * scale), round(y * scale), round(w * scale), round(h * scale))
+            if width > 0:
+                width = max(1, round(width * scale))
+        pygame.draw.rect(self.surface, color, rect, width)
+
+    def circle(self, color, center, radius, width=0):
+        """Dessine un cercle avec pygame.draw"""
+        scale = self.scale
+        if scale != 1:
+            center = (round(center[0] * scale), round(center[1] * scale))
+            radius = max(1, round(radius * scale))
+            if width > 0:
+                width = max(1, round(width * scale))
+        pygame.draw.circle(self.surface, color, center, radius, width)
+
+    def lines(self, color, points):
+        """Dessine une ligne brisée avec pygame.draw"""
+        scale = self.scale
+        if scale != 1:
+            points = [(round(x * scale), round(y * scale)) for x, y in points]
+        pygame.draw.lines(self.surface, color, False, points)
+
+    def overlay(self, color, alpha):
+        """Blitte un voile translucide (créé une seule fois par couleur et opacité)"""
+        key = (color, alpha)
+        veil = self._overlays.get(key)
+        if veil is None:
+            veil = pygame.Surface(self.surface.get_size())
+            veil.set_alpha(alpha)
+            veil.fill(color)
+            self._overlays[key] = veil
+        self.surface.blit(veil, (0, 0))
+
+
+class TextureBackend(RenderBackend):
+    """Composition de textures avec un renderer SDL (pygame._sdl2.video)"""
+
+    retained = False  # Le renderer ne garde pas l'image précédente
+
+    def __init__(self, renderer, size):
+        """
+        Initialise le backend
+
+        Args:
+            renderer (pygame._sdl2.video.Renderer): Renderer de la fenêtre
+            size (tuple): Taille logique de la zone de dessin
+        """
+        from pygame._sdl2.video import Texture
+        self._texture_class = Texture
+        self.renderer = renderer
+        self.size = size
+        # Une texture par surface blittée, libérée avec la surface
+        self._textures = weakref.WeakKeyDictionary()
+        self._circles = {}  # (couleur, rayon, épaisseur) -> texture du cercle
+
+    def reset(self, renderer):
+        """
+        Change de renderer (les textures de l'ancien sont abandonnées)
+
+        Args:
+            renderer (pygame._sdl2.video.Renderer): Nouveau renderer
+        """
+        self.renderer = renderer
+        self._textures = weakref.WeakKeyDictionary()
+        self._circles = {}
+
+    def texture(self, image, changed=False):
+        """
+        Texture d'une surface (envoyée au premier blit, puis réutilisée)
+
+        Args:
+            image (pygame.Surface): Surface source
+            changed (bool): Renvoie le contenu de la surface - optionnel
+
+        Returns:
+            pygame._sdl2.video.Texture: Texture correspondante
+        """
+        texture = self._textures.get(image)
+        if texture is None:
+            # L'opacité et la transparence de la surface passent à la texture
+            texture = self._texture_class.from_surface(self.renderer, image)
+            self._textures[image] = texture
+        elif changed:
+            texture.update(image)
+        return texture
+
+    def get_size(self):
+        """Taille logique du renderer"""
+        return self.size
+
+    def fill(self, color):
+        """Efface la fenêtre (bandes comprises) puis remplit la zone de dessin"""
+        renderer = self.renderer
+        renderer.draw_color = _rgba(BLACK)
+        renderer.clear()
+        renderer.draw_color = _rgba(color)
+        renderer.fill_rect((0, 0, *self.size))
+
+    def blit(self, image, dest, changed=False):
+        """Dessine la texture de l'image"""
+        texture = self.texture(image, changed)
+        texture.draw(dstrect=(dest[0], dest[1], texture.width, texture.height))
+
+    def rect(self, color, rect, width=0):
+        """Dessine un rectangle (bordure : quatre bandes, comme pygame.draw.rect)"""
+        renderer = self.renderer
+        renderer.draw_color = _rgba(color)
+        rect = pygame.Rect(rect)
+        if width <= 0:
+            renderer.fill_rect(rect)
+            return
+        renderer.fill_rect((rect.x, rect.y, rect.width, width))
+        renderer.fill_rect((rect.x, rect.bottom - width, rect.width, width))
+        renderer.fill_rect((rect.x, rect.y, width, rect.height))
+        renderer.fill_rect((rect.right - width, rect.y, width, rect.height))
+
+    def circle(self, color, center, radius, width=0):
+        """Dessine un cercle (rendu une fois par couleur, rayon et épaisseur)"""
+        key = (color, radius, width)
+        texture = self._circles.get(key)
+        if texture is None:
+            image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(image, color, (radius, radius), radius, width)
+            texture = self._texture_class.from_surface(self.renderer, image)
+            self._circles[key] = texture
+        texture.draw(dstrect=(center[0] - radius, center[1] - radius, radius * 2, radius * 2))
+
+    def lines(self, color, points):
+        """Dessine une ligne brisée"""
+        renderer = self.renderer
+        renderer.draw_color = _rgba(color)
+        for start, end in zip(points, points[1:]):
+            renderer.draw_line(start, end)
+
+    def overlay(self, color, alpha):
+        """Voile translucide mélangé par le renderer"""
+        renderer = self.renderer
+        renderer.draw_blend_mode = BLENDMODE_BLEND
+        renderer.draw_color = _rgba(color, alpha)
+        renderer.fill_rect((0, 0, *self.size))
+        renderer.draw_blend_mode = 0
+
+
+def as_backend(target):
+    """
+    Backend de dessin d'une cible (une surface est enveloppée dans un SurfaceBackend)
+
+    Args:
+        target: RenderBackend, pygame.Surface ou None (partie sans affichage)
+
+    Returns:
+        RenderBackend: Backend où dessiner (None si target est None)
+    """
+    if target is None or isinstance(target, RenderBackend):
+        return target
+    return SurfaceBackend(target)
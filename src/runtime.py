@@ -0,0 +1,161 @@
+"""
+Module d'exécution asynchrone - Boucle asyncio autour de la boucle de frames
+
+La boucle principale est une tâche asyncio parmi d'autres : au lieu de
+bloquer le thread dans clock.tick, elle attend l'échéance de la frame
+(FramePacer.wait_async) et laisse tourner pendant ce temps les autres tâches
+lancées par AsyncRuntime :
+
+- écritures de fichiers atomiques dans un thread (write_file), sérialisées
+  par chemin dans l'ordre de soumission ;
+- calculs lourds (simulations, IA) dans un pool de processus (compute) ;
+- IPC locale sans réseau : le serveur de jeu headless (src.server) sur un
+  socket Unix (serve_ipc, activé par RPG_IPC=chemin).
+
+À la fermeture (pygame.QUIT), shutdown attend les écritures en cours,
+annule les tâches de fond (serveur) et arrête le pool de processus.
+"""
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from .constants import RUNTIME_WORKERS, RUNTIME_SHUTDOWN_TIMEOUT
+
+IPC_ENV = "RPG_IPC"
+
+
+def _write_atomic(path, data):
+    """
+    Écrit un fichier de manière atomique (fichier temporaire + renommage)
+
+    Args:
+        path (str): Chemin du fichier
+        data (bytes | str): Contenu (texte encodé en UTF-8)
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class AsyncRuntime:
+    """Tâches asyncio lancées à côté de la boucle de frames"""
+
+    def __init__(self, workers=RUNTIME_WORKERS):
+        """
+        Initialise le runtime (à utiliser dans une boucle asyncio en cours)
+
+        Args:
+            workers (int): Processus du pool de calcul (créé au premier calcul)
+        """
+        self.workers = workers
+        self._pool = None
+        self._tasks = set()  # Tâches attendues à la fermeture
+        self._daemons = set()  # Tâches annulées à la fermeture
+        self._locks = {}  # Chemin -> asyncio.Lock (écritures dans l'ordre de soumission)
+        self._ipc_path = None  # Socket Unix servi (supprimé à la fermeture)
+        self.errors = 0  # Tâches terminées sur une exception
+
+    def __len__(self):
+        """Nombre de tâches en cours"""
+        return len(self._tasks) + len(self._daemons)
+
+    def spawn(self, coro, name=None, daemon=False):
+        """
+        Lance une tâche à côté de la boucle de frames
+
+        Args:
+            coro: Coroutine à exécuter
+            name (str): Nom de la tâche - optionnel
+            daemon (bool): Annulée à la fermeture au lieu d'être attendue - optionnel
+
+        Returns:
+            asyncio.Task: Tâche lancée
+        """
+        task = asyncio.get_running_loop().create_task(coro, name=name)
+        tasks = self._daemons if daemon else self._tasks
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        task.add_done_callback(self._report)
+        return task
+
+    def _report(self, task):
+        """
+        Affiche l'erreur d'une tâche terminée (rappel de fin de tâche)
+
+        Args:
+            task (asyncio.Task): Tâche terminée
+        """
+        if not task.cancelled() and task.exception() is not None:
+            self.errors += 1
+            print(f"Tâche {task.get_name()} en échec: {task.exception()!r}")
+
+    async def write_file(self, path, data):
+        """
+        Écrit un fichier dans un thread, sans bloquer les frames
+
+        Les écritures d'un même chemin se succèdent dans l'ordre de soumission :
+        la dernière soumise est celle qui reste sur le disque.
+
+        Args:
+            path (str): Chemin du fichier
+            data (bytes | str): Contenu (texte encodé en UTF-8)
+        """
+        lock = self._locks.setdefault(path, asyncio.Lock())
+        async with lock:
+            await asyncio.get_running_loop().run_in_executor(None, _write_atomic, path, data)
+
+    async def compute(self, function, *args):
+        """
+        Exécute un calcul lourd dans le pool de processus
+
+        Args:
+            function: Fonction de niveau module (transmise par pickle)
+            *args: Arguments (transmis par pickle)
+
+        Returns:
+            Résultat de function(*args)
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers)
+        return await asyncio.get_running_loop().run_in_executor(self._pool, function, *args)
+
+    def serve_ipc(self, unix_path):
+        """
+        Sert le protocole de src.server sur un socket Unix local, en tâche de fond
+
+        Args:
+            unix_path (str): Chemin du socket
+
+        Returns:
+            asyncio.Task: Tâche du serveur, ou None si les sockets Unix sont indisponibles
+        """
+        if not hasattr(asyncio, "start_unix_server"):
+            print("IPC locale indisponible sur ce système (sockets Unix)")
+            return None
+        from .server import GameServer  # Import différé : inutile sans RPG_IPC
+        self._ipc_path = unix_path
+        return self.spawn(GameServer().serve(unix_path=unix_path), "ipc", daemon=True)
+
+    async def shutdown(self, timeout=RUNTIME_SHUTDOWN_TIMEOUT):
+        """
+        Ferme proprement : écritures attendues, tâches de fond annulées, pool arrêté
+
+        Args:
+            timeout (float): Attente maximale des tâches en cours (s)
+        """
+        for task in list(self._daemons):
+            task.cancel()
+        pending = self._tasks | self._daemons
+        if pending:
+            _, late = await asyncio.wait(pending, timeout=timeout)
+            for task in late:
+                print(f"Tâche {task.get_name()} abandonnée à la fermeture")
+                task.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        if self._ipc_path and os.path.exists(self._ipc_path):
+            os.remove(self._ipc_path)
+            self._ipc_path = None
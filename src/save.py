@@ -0,0 +1,360 @@
+"""
+Module de sauvegarde - Format binaire compact et sauvegarde automatique
+"""
+import os
+import queue
+import struct
+import threading
+import zlib
+from .constants import SAVE_FILE, MAX_FLOOR, REWARD_TYPES, STATUS_EFFECTS
+from .catalog import ENEMY_CATALOG, KEY_SIZE
+from .status import StatusEffects
+
+# En-tête : signature + version du format
+SAVE_MAGIC = b"RPGS"
+SAVE_VERSION = 3
+_HEADER = struct.Struct("<4sB")
+
+# Corps v1 : run, joueur, ennemi, état
+#   floor, potions, gold, enemies_killed, total_damage_dealt, total_damage_taken
+#   joueur : hp, max_hp, attack, defense
+#   ennemi : type, hp, max_hp, attack, defense, gold_reward
+#   état du jeu
+_BODY_V1 = struct.Struct("<HHIIII iiii B iiiii B")
+# Extension v2 : graine + récompenses par étage (codes REWARD_TYPES + 1, 0 = vide)
+_BODY_V2_EXT = struct.Struct(f"<I B {MAX_FLOOR}s")
+# Extension v3 : clé de l'ennemi dans le catalogue (le code v1 vaut alors 0xFF),
+# puis le combat en cours du joueur et de l'ennemi (taille variable) :
+#   posture défensive, bouclier restant, nombre d'effets de statut
+#   chaque effet : type (code STATUS_CODES), tours restants, puissance
+_BODY_V3_EXT = struct.Struct(f"<{KEY_SIZE}s")
+_COMBATANT = struct.Struct("<B i I")
+_EFFECT = struct.Struct("<B I i")
+_CRC = struct.Struct("<I")
+
+# Codes des états sauvegardables (index = code)
+SAVE_STATES = ["player_turn", "enemy_turn", "rewards", "victory_final"]
+
+# Codes des effets de statut (index = code)
+STATUS_CODES = list(STATUS_EFFECTS)
+
+# Codes des types d'ennemis des versions 1 et 2 (index = code)
+LEGACY_ENEMY_CODES = ["goblin", "orc", "troll", "demon", "dragon"]
+
+
+class SaveError(Exception):
+    """Erreur levée quand une sauvegarde est invalide ou illisible"""
+
+
+def dump_game(game):
+    """
+    Sérialise l'état d'une partie en binaire
+
+    Args:
+        game (Game): Partie à sauvegarder
+
+    Returns:
+        bytes: Instantané binaire de la partie
+    """
+    player = game.player
+    enemy = game.enemy
+    state = game.state
+    if state == "pause":
+        state = game.previous_state
+
+    body = _BODY_V1.pack(
+        game.floor, game.potions, game.gold, game.enemies_killed,
+        game.total_damage_dealt, game.total_damage_taken,
+        player.hp, player.max_hp, player.attack, player.defense,
+        0xFF,
+        enemy.hp, enemy.max_hp, enemy.attack, enemy.defense, enemy.gold_reward,
+        SAVE_STATES.index(state),
+    )
+    rewards = bytes(REWARD_TYPES.index(r) + 1 for r in game.reward_history)
+    body += _BODY_V2_EXT.pack(game.seed, len(rewards), rewards)
+    body += _BODY_V3_EXT.pack(game.enemy_type.encode("utf-8"))
+    body += _dump_combatant(player) + _dump_combatant(enemy)
+    data = _HEADER.pack(SAVE_MAGIC, SAVE_VERSION) + body
+    return data + _CRC.pack(zlib.crc32(data))
+
+
+def _dump_combatant(character):
+    """
+    Sérialise la posture et les effets de statut d'un personnage (extension v3)
+
+    Args:
+        character (Character): Joueur ou ennemi
+
+    Returns:
+        bytes: Posture, bouclier et effets en cours
+    """
+    effects = character.effects.active()
+    data = _COMBATANT.pack(character.is_defending, character.effects.shield, len(effects))
+    return data + b"".join(_EFFECT.pack(STATUS_CODES.index(kind), remaining, power)
+                           for kind, power, remaining in effects)
+
+
+def _parse_combatant(payload, offset):
+    """
+    Décode la posture et les effets de statut d'un personnage (extension v3)
+
+    Args:
+        payload (bytes): Sauvegarde sans la somme de contrôle
+        offset (int): Position du personnage dans la sauvegarde
+
+    Returns:
+        tuple: ((défense, bouclier, effets), position suivante)
+
+    Raises:
+        SaveError: Si les données sont tronquées ou invalides
+    """
+    if offset + _COMBATANT.size > len(payload):
+        raise SaveError("Taille de sauvegarde invalide")
+    defending, shield, count = _COMBATANT.unpack_from(payload, offset)
+    offset += _COMBATANT.size
+    if defending > 1 or shield < 0:
+        raise SaveError("Sauvegarde invalide")
+    if offset + count * _EFFECT.size > len(payload):
+        raise SaveError("Taille de sauvegarde invalide")
+    effects = []
+    for code, remaining, power in _EFFECT.iter_unpack(payload[offset:offset + count * _EFFECT.size]):
+        if code >= len(STATUS_CODES) or remaining < 1 or power < 0:
+            raise SaveError("Sauvegarde invalide")
+        effects.append((STATUS_CODES[code], power, remaining))
+    return (bool(defending), shield, effects), offset + count * _EFFECT.size
+
+
+def parse_save(data):
+    """
+    Décode un instantané binaire
+
+    Args:
+        data (bytes): Contenu d'une sauvegarde
+
+    Returns:
+        dict: Champs de la sauvegarde
+
+    Raises:
+        SaveError: Si la signature, la version ou la somme de contrôle est invalide
+    """
+    if len(data) < _HEADER.size + _CRC.size:
+        raise SaveError("Sauvegarde tronquée")
+
+    payload, crc = data[:-_CRC.size], _CRC.unpack_from(data, len(data) - _CRC.size)[0]
+    if zlib.crc32(payload) != crc:
+        raise SaveError("Sauvegarde corrompue")
+
+    magic, version = _HEADER.unpack_from(payload)
+    if magic != SAVE_MAGIC:
+        raise SaveError("Ce fichier n'est pas une sauvegarde")
+    if not 1 <= version <= SAVE_VERSION:
+        raise SaveError(f"Version de sauvegarde non supportée: {version}")
+    expected_size = _HEADER.size + _BODY_V1.size
+    if version >= 2:
+        expected_size += _BODY_V2_EXT.size
+    if version >= 3:
+        expected_size += _BODY_V3_EXT.size
+    # v3 : le combat en cours (taille variable) suit la partie fixe
+    if len(payload) < expected_size or (version < 3 and len(payload) != expected_size):
+        raise SaveError("Taille de sauvegarde invalide")
+
+    (floor, potions, gold, kills, dealt, taken,
+     p_hp, p_max_hp, p_attack, p_defense,
+     enemy_code, e_hp, e_max_hp, e_attack, e_defense, e_gold,
+     state_code) = _BODY_V1.unpack_from(payload, _HEADER.size)
+
+    if state_code >= len(SAVE_STATES):
+        raise SaveError("Sauvegarde invalide")
+
+    # Les sauvegardes v1 n'ont ni graine ni historique des récompenses
+    seed, rewards = None, []
+    if version >= 2:
+        seed, count, codes = _BODY_V2_EXT.unpack_from(payload, _HEADER.size + _BODY_V1.size)
+        if count > MAX_FLOOR or not all(0 < c <= len(REWARD_TYPES) for c in codes[:count]):
+            raise SaveError("Sauvegarde invalide")
+        rewards = [REWARD_TYPES[c - 1] for c in codes[:count]]
+
+    # Les sauvegardes v1 et v2 reprennent le combat sans posture ni effet
+    combatants = ((False, 0, []), (False, 0, []))
+    if version >= 3:
+        (key,) = _BODY_V3_EXT.unpack_from(payload, _HEADER.size + _BODY_V1.size + _BODY_V2_EXT.size)
+        enemy_type = key.rstrip(b"\0").decode("utf-8", "replace")
+        player_combat, offset = _parse_combatant(payload, expected_size)
+        enemy_combat, offset = _parse_combatant(payload, offset)
+        if offset != len(payload):
+            raise SaveError("Taille de sauvegarde invalide")
+        combatants = (player_combat, enemy_combat)
+    elif enemy_code < len(LEGACY_ENEMY_CODES):
+        enemy_type = LEGACY_ENEMY_CODES[enemy_code]
+    else:
+        raise SaveError("Sauvegarde invalide")
+    if enemy_type not in ENEMY_CATALOG.index:
+        raise SaveError(f"Ennemi inconnu du catalogue: {enemy_type}")
+
+    return {
+        "floor": floor,
+        "potions": potions,
+        "gold": gold,
+        "enemies_killed": kills,
+        "total_damage_dealt": dealt,
+        "total_damage_taken": taken,
+        "player": (p_hp, p_max_hp, p_attack, p_defense),
+        "player_combat": combatants[0],
+        "enemy_type": enemy_type,
+        "enemy": (e_hp, e_max_hp, e_attack, e_defense, e_gold),
+        "enemy_combat": combatants[1],
+        "state": SAVE_STATES[state_code],
+        "seed": seed,
+        "rewards": rewards,
+    }
+
+
+def load_game(game, data):
+    """
+    Restaure une partie à partir d'un instantané binaire
+
+    Args:
+        game (Game): Partie à mettre à jour
+        data (bytes): Contenu d'une sauvegarde
+
+    Raises:
+        SaveError: Si la sauvegarde est invalide
+    """
+    fields = parse_save(data)
+
+    game.floor = fields["floor"]
+    game.potions = fields["potions"]
+    game.gold = fields["gold"]
+    game.enemies_killed = fields["enemies_killed"]
+    game.total_damage_dealt = fields["total_damage_dealt"]
+    game.total_damage_taken = fields["total_damage_taken"]
+    game.reward_history.clear()
+    game.reward_history.extend(fields["rewards"])
+    if fields["seed"] is not None:
+        game.seed = fields["seed"]
+        # Le flux aléatoire reprend de façon déterministe pour l'étage restauré
+        game.rng.seed(f"{game.seed}:{game.floor}")
+
+    player = game.player
+    player.hp, player.max_hp, player.attack, player.defense = fields["player"]
+    _restore_combatant(player, *fields["player_combat"])
+
+    game._spawn_enemy(fields["enemy_type"])
+    enemy = game.enemy
+    enemy.hp, enemy.max_hp, enemy.attack, enemy.defense, enemy.gold_reward = fields["enemy"]
+    _restore_combatant(enemy, *fields["enemy_combat"])
+
+    game.state = fields["state"]
+    game.update_potion_button()
+    if game.state == "rewards":
+        game._create_reward_buttons()
+    elif game.state == "enemy_turn":
+        # Le tour ennemi interrompu reprend (le joueur garde sa posture défensive)
+        game._schedule_enemy_turn()
+    game.show_message(f"Reprise - Étage {game.floor}")
+
+
+def _restore_combatant(character, defending, shield, effects):
+    """
+    Remet la posture et les effets de statut sauvegardés d'un personnage
+
+    Args:
+        character (Character): Joueur ou ennemi
+        defending (bool): Posture défensive
+        shield (int): Points de bouclier restants
+        effects (list): Tuples (type, puissance, tours restants)
+    """
+    character.is_defending = defending
+    character.clear_effects()
+    if effects:
+        character.effects = StatusEffects()
+        character.effects.restore(effects, shield)
+
+
+def read_save(path=SAVE_FILE):
+    """
+    Lit une sauvegarde depuis le disque
+
+    Args:
+        path (str): Chemin du fichier de sauvegarde
+
+    Returns:
+        bytes: Contenu de la sauvegarde, ou None si elle n'existe pas
+    """
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def write_save(data, path=SAVE_FILE):
+    """
+    Écrit une sauvegarde de manière atomique (fichier temporaire + renommage)
+
+    Args:
+        data (bytes): Instantané binaire
+        path (str): Chemin du fichier de sauvegarde
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class Autosaver:
+    """Écrit les sauvegardes sur un thread d'arrière-plan"""
+
+    def __init__(self, path=SAVE_FILE):
+        """
+        Initialise la sauvegarde automatique
+
+        Args:
+            path (str): Chemin du fichier de sauvegarde
+        """
+        self.path = path
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    def submit(self, data):
+        """
+        Programme l'écriture d'un instantané (non bloquant)
+
+        Args:
+            data (bytes): Instantané produit par dump_game sur le thread principal
+        """
+        self._queue.put(data)
+
+    def clear(self):
+        """Programme la suppression de la sauvegarde (fin de run)"""
+        self._queue.put(b"")
+
+    def flush(self):
+        """Attend que toutes les écritures en attente soient terminées"""
+        self._queue.join()
+
+    def _run(self):
+        """Boucle du thread d'écriture"""
+        while True:
+            data = self._queue.get()
+            pending = 1
+            # Seul le dernier instantané compte
+            while True:
+                try:
+                    data = self._queue.get_nowait()
+                    pending += 1
+                except queue.Empty:
+                    break
+            try:
+                if data:
+                    write_save(data, self.path)
+                elif os.path.exists(self.path):
+                    os.remove(self.path)
+            except OSError as e:
+                print(f"Erreur lors de la sauvegarde {self.path}: {e}")
+            finally:
+                for _ in range(pending):
+                    self._queue.task_done()
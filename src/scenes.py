@@ -0,0 +1,81 @@
+"""
+Module des scènes - Pile de scènes persistantes
+
+Le menu et les parties (normale, infinie, horde) sont créés une seule fois au
+démarrage et enregistrés par nom. Changer d'écran empile ou dépile une scène
+existante : aucun sprite rechargé ni bouton recréé, une nouvelle run est
+réinitialisée sur place (Game.reset_game). Les écrans Options et pause sont
+des états de ces scènes, dont les boutons sont eux aussi créés une fois.
+"""
+
+
+class SceneManager:
+    """Scènes enregistrées par nom et pile des scènes affichées"""
+
+    def __init__(self):
+        """Initialise un gestionnaire sans scène"""
+        self.scenes = {}  # Nom -> scène (Menu, Game...)
+        self.stack = []  # Noms des scènes empilées (la dernière est affichée)
+
+    def register(self, name, scene):
+        """
+        Enregistre une scène persistante
+
+        Args:
+            name (str): Nom de la scène
+            scene: Scène (Menu, Game...)
+
+        Raises:
+            ValueError: Si le nom est déjà pris
+        """
+        if name in self.scenes:
+            raise ValueError(f"Scène déjà enregistrée : {name}")
+        self.scenes[name] = scene
+
+    @property
+    def current_name(self):
+        """Nom de la scène affichée (None si la pile est vide)"""
+        return self.stack[-1] if self.stack else None
+
+    @property
+    def current(self):
+        """Scène affichée (None si la pile est vide)"""
+        return self.scenes[self.stack[-1]] if self.stack else None
+
+    def push(self, name):
+        """
+        Affiche une scène par-dessus la scène courante
+
+        Args:
+            name (str): Nom d'une scène enregistrée
+
+        Returns:
+            Scène affichée
+
+        Raises:
+            KeyError: Si la scène n'est pas enregistrée
+        """
+        scene = self.scenes[name]
+        self.stack.append(name)
+        self._enter(scene)
+        return scene
+
+    def pop(self):
+        """
+        Retire la scène courante et revient à la précédente
+
+        Returns:
+            Scène de nouveau affichée (None si la pile est vide)
+        """
+        self.stack.pop()
+        scene = self.current
+        if scene is not None:
+            self._enter(scene)
+        return scene
+
+    @staticmethod
+    def _enter(scene):
+        """Prévient une scène qu'elle redevient visible (méthode on_enter optionnelle)"""
+        on_enter = getattr(scene, "on_enter", None)
+        if on_enter is not None:
+            on_enter()
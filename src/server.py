@@ -0,0 +1,194 @@
+"""
+Serveur de jeu headless - Des milliers de runs dans une seule boucle asyncio
+
+Protocole binaire à taille fixe (little-endian), requêtes pipelinables :
+
+    Requête : opcode (u8), session (u32), argument (u32)
+    Réponse : statut (u8), session (u32), état de la partie (voir STATE)
+
+Opcodes :
+    NEW     argument = graine            -> crée une session
+    ACTION  argument = index de ACTIONS  -> action du joueur (l'ennemi répond aussitôt)
+    REWARD  argument = index de REWARD_TYPES
+    STATE   argument ignoré              -> lecture de l'état
+    CLOSE   argument ignoré              -> ferme la session
+
+Une connexion n'accède qu'aux sessions qu'elle a créées (sinon STATUS_NO_SESSION).
+
+Usage : python -m src.server [--host H] [--port P | --unix CHEMIN]
+"""
+import argparse
+import asyncio
+import os
+import struct
+from .headless import HeadlessGame
+from .constants import REWARD_TYPES, SERVER_HOST, SERVER_PORT, SERVER_BACKLOG
+
+REQUEST = struct.Struct("<BII")
+RESPONSE = struct.Struct("<BI")
+# état (code), étage, or, potions, ennemis tués, joueur hp/max/atk/def, ennemi hp/max
+STATE = struct.Struct("<BHIHI iiii ii")
+
+OP_NEW, OP_ACTION, OP_REWARD, OP_STATE, OP_CLOSE = range(1, 6)
+STATUS_OK, STATUS_NO_SESSION, STATUS_BAD_REQUEST = range(3)
+
+ACTIONS = ["attack", "defend", "potion"]
+GAME_STATES = ["player_turn", "enemy_turn", "rewards", "game_over", "victory_final", "pause"]
+
+_EMPTY_STATE = bytes(STATE.size)
+
+
+def pack_state(game):
+    """
+    Encode l'état visible d'une partie
+
+    Args:
+        game (Game): Partie
+
+    Returns:
+        bytes: État encodé (STATE)
+    """
+    player, enemy = game.player, game.enemy
+    return STATE.pack(
+        GAME_STATES.index(game.state), game.floor, game.gold, game.potions,
+        game.enemies_killed, player.hp, player.max_hp, player.attack, player.defense,
+        enemy.hp, enemy.max_hp,
+    )
+
+
+def unpack_response(data):
+    """
+    Décode une réponse du serveur
+
+    Args:
+        data (bytes): Réponse complète (RESPONSE + STATE)
+
+    Returns:
+        tuple: (statut, session, dict de l'état)
+    """
+    status, session = RESPONSE.unpack_from(data)
+    (state, floor, gold, potions, kills, hp, max_hp, attack, defense,
+     enemy_hp, enemy_max_hp) = STATE.unpack_from(data, RESPONSE.size)
+    return status, session, {
+        "state": GAME_STATES[state], "floor": floor, "gold": gold, "potions": potions,
+        "enemies_killed": kills, "hp": hp, "max_hp": max_hp, "attack": attack,
+        "defense": defense, "enemy_hp": enemy_hp, "enemy_max_hp": enemy_max_hp,
+    }
+
+
+class GameServer:
+    """Héberge les sessions headless et traite les requêtes des clients"""
+
+    def __init__(self):
+        """Initialise le serveur sans session"""
+        self.sessions = {}
+        self._next_session = 1
+        self.requests_handled = 0
+
+    def handle_request(self, opcode, session, argument, owned):
+        """
+        Traite une requête (synchrone : une action de jeu ne bloque jamais)
+
+        Un client n'agit que sur ses propres sessions : une session ouverte par
+        une autre connexion est traitée comme inexistante.
+
+        Args:
+            opcode (int): Opcode de la requête
+            session (int): Identifiant de session
+            argument (int): Argument de l'opcode
+            owned (set): Sessions ouvertes par la connexion (mis à jour par NEW et CLOSE)
+
+        Returns:
+            bytes: Réponse encodée
+        """
+        self.requests_handled += 1
+
+        if opcode == OP_NEW:
+            session = self._next_session
+            self._next_session += 1
+            game = HeadlessGame(argument)
+            self.sessions[session] = game
+            owned.add(session)
+            return RESPONSE.pack(STATUS_OK, session) + pack_state(game)
+
+        game = self.sessions.get(session) if session in owned else None
+        if game is None:
+            return RESPONSE.pack(STATUS_NO_SESSION, session) + _EMPTY_STATE
+
+        if opcode == OP_ACTION and argument < len(ACTIONS) and game.state == "player_turn":
+            game.player_action(ACTIONS[argument])
+        elif opcode == OP_REWARD and argument < len(REWARD_TYPES) and game.state == "rewards":
+            game.apply_reward(REWARD_TYPES[argument])
+        elif opcode == OP_CLOSE:
+            del self.sessions[session]
+            owned.discard(session)
+        elif opcode != OP_STATE:
+            return RESPONSE.pack(STATUS_BAD_REQUEST, session) + pack_state(game)
+
+        return RESPONSE.pack(STATUS_OK, session) + pack_state(game)
+
+    async def handle_client(self, reader, writer):
+        """
+        Sert une connexion client jusqu'à sa fermeture
+
+        Args:
+            reader (asyncio.StreamReader): Flux entrant
+            writer (asyncio.StreamWriter): Flux sortant
+        """
+        owned = set()
+        try:
+            while True:
+                data = await reader.readexactly(REQUEST.size)
+                opcode, session, argument = REQUEST.unpack(data)
+                response = self.handle_request(opcode, session, argument, owned)
+                writer.write(response)
+                # Ne rend la main qu'une fois le tampon d'envoi plein
+                if writer.transport.get_write_buffer_size() > 65536:
+                    await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            # Les sessions d'un client déconnecté sont libérées
+            for session in owned:
+                self.sessions.pop(session, None)
+            writer.close()
+
+    async def serve(self, host=SERVER_HOST, port=SERVER_PORT, unix_path=None):
+        """
+        Démarre le serveur et sert indéfiniment
+
+        Args:
+            host (str): Adresse d'écoute TCP
+            port (int): Port TCP
+            unix_path (str): Socket Unix à utiliser à la place de TCP - optionnel
+        """
+        if unix_path:
+            if os.path.exists(unix_path):
+                os.remove(unix_path)
+            server = await asyncio.start_unix_server(self.handle_client, unix_path,
+                                                    backlog=SERVER_BACKLOG)
+            print(f"Serveur de jeu sur {unix_path}")
+        else:
+            server = await asyncio.start_server(self.handle_client, host, port,
+                                               backlog=SERVER_BACKLOG)
+            print(f"Serveur de jeu sur {host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    """Point d'entrée du serveur"""
+    parser = argparse.ArgumentParser(description="Serveur de jeu headless")
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--unix", help="Chemin d'un socket Unix (remplace TCP)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(GameServer().serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
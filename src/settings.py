@@ -0,0 +1,185 @@
+"""
+Module des options - Réglages de performance conservés entre les lancements
+
+Chaque option a une liste fixe de valeurs possibles : l'écran Options les fait
+défiler au clic, et un fichier modifié à la main ne peut pas introduire de
+valeur inattendue (les valeurs inconnues sont ignorées).
+"""
+import json
+import os
+from .constants import SETTINGS_FILE, SCREEN_WIDTH, SCREEN_HEIGHT, FPS, ENEMY_ACTION_DELAY
+
+# Valeurs possibles de chaque option, dans l'ordre de défilement
+#   fps_cap : FPS maximum (0 = illimité) ; idle_throttle : ralenti au repos
+#   render_scale : résolution interne (image dessinée) par rapport à la mise en page 800x600
+#   pixel_art : mise à l'échelle par facteur entier, sans lissage
+#   enemy_delay : délai en ms avant l'action de l'ennemi
+#   renderer : backend de rendu (surface pygame ou textures SDL), appliqué au prochain lancement
+SETTINGS_CHOICES = {
+    "fps_cap": [30, 60, 120, 144, 0],
+    "idle_throttle": [False, True],
+    "vsync": [False, True],
+    "render_scale": [0.5, 0.75, 1.0],
+    "fullscreen": [False, True],
+    "pixel_art": [False, True],
+    "enemy_delay": [2500, ENEMY_ACTION_DELAY, 750, 250],
+    "profiler": [False, True],
+    "low_latency": [False, True],
+    "renderer": ["surface", "texture"],
+}
+
+DEFAULT_SETTINGS = {
+    "fps_cap": FPS,
+    "idle_throttle": False,
+    "vsync": False,
+    "render_scale": 1.0,
+    "fullscreen": False,
+    "pixel_art": False,
+    "enemy_delay": ENEMY_ACTION_DELAY,
+    "profiler": False,
+    "low_latency": False,
+    "renderer": "surface",
+}
+
+# Libellés de l'écran Options
+SETTINGS_LABELS = {
+    "fps_cap": "FPS max",
+    "idle_throttle": "Ralenti au repos",
+    "vsync": "Synchro verticale",
+    "render_scale": "Résolution interne",
+    "fullscreen": "Plein écran",
+    "pixel_art": "Pixel art (échelle entière)",
+    "enemy_delay": "Tour ennemi",
+    "profiler": "Profileur (F3)",
+    "low_latency": "Faible latence",
+    "renderer": "Rendu",
+}
+ENEMY_DELAY_LABELS = {2500: "Lent", ENEMY_ACTION_DELAY: "Normal", 750: "Rapide", 250: "Très rapide"}
+RENDERER_LABELS = {"surface": "Surface", "texture": "Textures (au prochain lancement)"}
+
+
+class SettingsError(Exception):
+    """Erreur levée quand le fichier d'options est illisible"""
+
+
+class Settings:
+    """Options du jeu (valeurs de SETTINGS_CHOICES)"""
+
+    def __init__(self, path=SETTINGS_FILE):
+        """
+        Initialise les options aux valeurs par défaut
+
+        Args:
+            path (str): Chemin du fichier d'options
+        """
+        self.path = path
+        self.values = dict(DEFAULT_SETTINGS)
+
+    def __getitem__(self, name):
+        """
+        Valeur d'une option
+
+        Args:
+            name (str): Nom de l'option
+
+        Returns:
+            Valeur de l'option
+        """
+        return self.values[name]
+
+    def set(self, name, value):
+        """
+        Modifie une option
+
+        Args:
+            name (str): Nom de l'option
+            value: Nouvelle valeur (parmi SETTINGS_CHOICES[name])
+
+        Raises:
+            ValueError: Si la valeur n'est pas proposée pour cette option
+        """
+        if value not in SETTINGS_CHOICES[name]:
+            raise ValueError(f"{name}: valeur non proposée ({value!r})")
+        self.values[name] = value
+
+    def cycle(self, name):
+        """
+        Passe à la valeur suivante d'une option
+
+        Args:
+            name (str): Nom de l'option
+
+        Returns:
+            Nouvelle valeur
+        """
+        choices = SETTINGS_CHOICES[name]
+        self.values[name] = choices[(choices.index(self.values[name]) + 1) % len(choices)]
+        return self.values[name]
+
+    def label(self, name):
+        """
+        Texte affiché pour une option
+
+        Args:
+            name (str): Nom de l'option
+
+        Returns:
+            str: Libellé et valeur
+        """
+        value = self.values[name]
+        if name == "fps_cap":
+            text = str(value) if value else "Illimité"
+        elif name == "render_scale":
+            text = f"{round(value * 100)} % ({round(SCREEN_WIDTH * value)}x{round(SCREEN_HEIGHT * value)})"
+        elif name == "enemy_delay":
+            text = ENEMY_DELAY_LABELS[value]
+        elif name == "renderer":
+            text = RENDERER_LABELS[value]
+        else:
+            text = "Oui" if value else "Non"
+        return f"{SETTINGS_LABELS[name]} : {text}"
+
+    def load(self):
+        """
+        Charge les options depuis le fichier (valeurs inconnues ignorées)
+
+        Returns:
+            bool: True si le fichier existait
+
+        Raises:
+            SettingsError: Si le fichier est illisible
+        """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            raise SettingsError(f"{self.path}: {e}") from e
+        if not isinstance(data, dict):
+            raise SettingsError(f"{self.path}: objet JSON attendu")
+
+        for name, choices in SETTINGS_CHOICES.items():
+            value = data.get(name)
+            # bool est un int : 1 ne doit pas passer pour True (ni l'inverse)
+            if value in choices and type(value) is type(DEFAULT_SETTINGS[name]):
+                self.values[name] = value
+            elif name == "render_scale" and type(value) is int and float(value) in choices:
+                self.values[name] = float(value)
+        return True
+
+    def dumps(self):
+        """
+        Contenu du fichier d'options (écrit par save, ou par AsyncRuntime.write_file)
+
+        Returns:
+            str: Options au format JSON
+        """
+        return json.dumps(self.values, indent=2)
+
+    def save(self):
+        """Écrit les options de manière atomique (fichier temporaire + renommage)"""
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.dumps())
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,220 @@
+"""
+Module des effets de statut - Poison, régénération, bonus, bouclier, étourdissement
+
+Un personnage n'alloue un StatusEffects qu'à son premier effet (sinon il
+partage NO_EFFECTS). Les modificateurs sont agrégés
+à l'application et au retrait d'un effet ; les expirations sont rangées dans
+un tas (heapq). Un tour ne coûte donc que le nombre d'effets qui expirent,
+quel que soit le nombre d'effets actifs.
+"""
+import heapq
+from types import MappingProxyType
+from .constants import STATUS_EFFECTS
+
+
+class StatusEffects:
+    """Effets actifs d'un personnage et modificateurs précalculés"""
+
+    __slots__ = ("turn", "attack_bonus", "defense_bonus", "hp_per_turn", "shield", "stun",
+                 "power", "_heap", "_seq", "_generation")
+
+    def __init__(self):
+        """Initialise un ensemble d'effets vide"""
+        self.clear()
+
+    def clear(self):
+        """Retire tous les effets"""
+        self.turn = 0  # Nombre de tours écoulés pour ce personnage
+
+        # Modificateurs agrégés (lus directement par Character)
+        self.attack_bonus = 0
+        self.defense_bonus = 0
+        self.hp_per_turn = 0  # Régénération - poison
+        self.shield = 0
+        self.stun = 0
+
+        # Puissance cumulée par type d'effet (pour l'affichage)
+        self.power = {}
+
+        # Tas des expirations : (tour d'expiration, séquence, type, puissance, génération)
+        self._heap = []
+        self._seq = 0
+        # Génération courante des effets non cumulables (les entrées périmées sont ignorées)
+        self._generation = {}
+
+    def __len__(self):
+        """Nombre de types d'effets actifs"""
+        return len(self.power)
+
+    def add(self, kind, power, duration):
+        """
+        Applique un effet en respectant sa règle de cumul
+
+        Args:
+            kind (str): Type d'effet (clé de STATUS_EFFECTS)
+            power (int): Puissance (dégâts, soin, bonus ou points de bouclier par tour)
+            duration (int): Durée en tours du personnage
+        """
+        stacking = STATUS_EFFECTS[kind]["stacking"]
+        expire = self.turn + duration
+
+        if stacking == "refresh":
+            # Une seule instance : la plus forte puissance, durée réinitialisée
+            current = self.power.get(kind, 0)
+            power = max(power, current)
+            self._apply(kind, power - current)
+            generation = self._generation.get(kind, 0) + 1
+            self._generation[kind] = generation
+        else:
+            # Cumul : chaque application a sa propre expiration
+            self._apply(kind, power)
+            generation = None
+
+        heapq.heappush(self._heap, (expire, self._seq, kind, power, generation))
+        self._seq += 1
+
+    def tick(self):
+        """
+        Passe un tour : calcule les effets périodiques puis retire les effets expirés
+
+        Returns:
+            tuple: (variation de HP à appliquer, True si le personnage est étourdi)
+        """
+        self.turn += 1
+        hp_delta = self.hp_per_turn
+        stunned = self.stun > 0
+
+        heap = self._heap
+        while heap and heap[0][0] <= self.turn:
+            _, _, kind, power, generation = heapq.heappop(heap)
+            if generation is not None and generation != self._generation.get(kind):
+                continue  # Instance remplacée par un rafraîchissement
+            self._apply(kind, -power if generation is None else -self.power.get(kind, 0))
+
+        return hp_delta, stunned
+
+    def active(self):
+        """
+        Effets en cours, pour une sauvegarde (voir restore)
+
+        Returns:
+            list: Tuples (type, puissance, tours restants), dans l'ordre des expirations
+        """
+        return [(kind, power, expire - self.turn)
+                for expire, _, kind, power, generation in sorted(self._heap)
+                if generation is None or generation == self._generation.get(kind)]
+
+    def restore(self, effects, shield):
+        """
+        Remplace les effets par des effets sauvegardés (voir active)
+
+        Args:
+            effects (list): Tuples (type, puissance, tours restants)
+            shield (int): Points de bouclier restants (bouclier déjà entamé)
+        """
+        self.clear()
+        for kind, power, remaining in effects:
+            self.add(kind, power, remaining)
+        self.absorb(self.shield - shield)
+
+    def absorb(self, damage):
+        """
+        Fait absorber des dégâts par le bouclier
+
+        Args:
+            damage (int): Dégâts entrants
+
+        Returns:
+            int: Dégâts restants après le bouclier
+        """
+        if self.shield <= 0:
+            return damage
+        absorbed = min(self.shield, damage)
+        self.shield -= absorbed
+        if self.shield:
+            self.power["shield"] = self.shield
+        else:
+            self.power.pop("shield", None)
+        return damage - absorbed
+
+    def _apply(self, kind, delta):
+        """
+        Met à jour les modificateurs agrégés
+
+        Args:
+            kind (str): Type d'effet
+            delta (int): Variation de puissance (négative au retrait)
+        """
+        if kind == "shield":
+            # Le bouclier consommé ne peut pas être retiré deux fois
+            delta = max(delta, -self.shield)
+        total = self.power.get(kind, 0) + delta
+        if total > 0:
+            self.power[kind] = total
+        else:
+            self.power.pop(kind, None)
+
+        if kind == "poison":
+            self.hp_per_turn -= delta
+        elif kind == "regen":
+            self.hp_per_turn += delta
+        elif kind == "attack_up":
+            self.attack_bonus += delta
+        elif kind == "defense_up":
+            self.defense_bonus += delta
+        elif kind == "shield":
+            self.shield += delta
+        elif kind == "stun":
+            self.stun += delta
+
+
+class _NoEffects:
+    """Absence d'effet partagée par tous les personnages sans effet actif"""
+
+    __slots__ = ()
+
+    turn = 0
+    attack_bonus = 0
+    defense_bonus = 0
+    hp_per_turn = 0
+    shield = 0
+    stun = 0
+    power = MappingProxyType({})
+
+    def __len__(self):
+        """Aucun effet actif"""
+        return 0
+
+    def tick(self):
+        """
+        Tour sans effet
+
+        Returns:
+            tuple: (0, False)
+        """
+        return 0, False
+
+    def active(self):
+        """
+        Aucun effet à sauvegarder
+
+        Returns:
+            list: Liste vide
+        """
+        return []
+
+    def absorb(self, damage):
+        """
+        Pas de bouclier
+
+        Args:
+            damage (int): Dégâts entrants
+
+        Returns:
+            int: Dégâts inchangés
+        """
+        return damage
+
+
+# Instance unique : un personnage n'alloue un StatusEffects qu'à son premier effet
+NO_EFFECTS = _NoEffects()
@@ -2,7 +2,98 @@
 Module pour les éléments d'interface utilisateur
 """
 import pygame
-from .constants import WHITE
+from collections import OrderedDict
+from .constants import WHITE, TEXT_CACHE_SIZE
+from .metrics import TEXT_CACHE_HITS, TEXT_CACHE_MISSES, IMAGE_CACHE_HITS, IMAGE_CACHE_MISSES
+
+# Textes déjà rendus : (police, texte, couleur) -> surface, du plus ancien au plus récent
+_text_cache = OrderedDict()
+# Images chargées, par échelle : (chemin, échelle) -> surface
+_image_cache = {}
+
+
+def render_text(font, text, color):
+    """
+    Rend un texte anti-aliasé en réutilisant les rendus précédents
+
+    Les surfaces renvoyées sont partagées : elles se blittent, mais ne doivent
+    pas être modifiées.
+
+    Args:
+        font: Police pygame
+        text (str): Texte à rendre
+        color (tuple): Couleur (R, G, B)
+
+    Returns:
+        pygame.Surface: Texte rendu
+    """
+    key = (font, text, color)
+    surface = _text_cache.get(key)
+    if surface is None:
+        TEXT_CACHE_MISSES.inc()
+        surface = font.render(text, True, color)
+        _text_cache[key] = surface
+        if len(_text_cache) > TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    else:
+        TEXT_CACHE_HITS.inc()
+        _text_cache.move_to_end(key)
+    return surface
+
+
+def load_image(path, scale=1):
+    """
+    Charge une image à une échelle donnée, une seule fois par (chemin, échelle)
+
+    Les surfaces renvoyées sont partagées : elles se blittent, mais ne doivent
+    pas être modifiées.
+
+    Args:
+        path (str): Chemin de l'image
+        scale (float): Facteur d'échelle
+
+    Returns:
+        pygame.Surface: Image convertie au format de l'affichage (s'il y en a un)
+
+    Raises:
+        pygame.error: Si l'image est illisible
+    """
+    key = (path, scale)
+    image = _image_cache.get(key)
+    if image is None:
+        IMAGE_CACHE_MISSES.inc()
+        original = _image_cache.get((path, 1))
+        if original is None:
+            original = pygame.image.load(path)
+            # Pas de surface d'affichage avec le backend "texture" : l'image part en texture telle quelle
+            if pygame.display.get_surface() is not None:
+                original = original.convert_alpha()
+            _image_cache[(path, 1)] = original
+        if scale == 1:
+            image = original
+        else:
+            size = (int(original.get_width() * scale), int(original.get_height() * scale))
+            image = pygame.transform.scale(original, size)
+        _image_cache[key] = image
+    else:
+        IMAGE_CACHE_HITS.inc()
+    return image
+
+
+def prerender_buttons(buttons):
+    """
+    Travail d'arrière-plan : rend à l'avance le texte de boutons (voir JobScheduler)
+
+    Args:
+        buttons (list): Boutons dont le texte sera affiché plus tard
+
+    Yields:
+        None: Après chaque texte rendu
+    """
+    for button in buttons:
+        if button.font is not None:
+            button.prerender()
+        yield
 
 
 class Button:
@@ -34,16 +125,25 @@ class Button:
         Dessine le bouton
 
         Args:
-            surface: Surface pygame où dessiner
+            surface: Backend de rendu où dessiner (voir src.render)
         """
         color = self.hover_color if self.is_hovered else self.color
-        pygame.draw.rect(surface, color, self.rect)
-        pygame.draw.rect(surface, WHITE, self.rect, 3)
+        surface.rect(color, self.rect)
+        surface.rect(WHITE, self.rect, 3)
 
-        text_surface = self.font.render(self.text, True, WHITE)
+        text_surface = self.prerender()
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
 
+    def prerender(self):
+        """
+        Rend le texte du bouton (mis en cache par render_text)
+
+        Returns:
+            pygame.Surface: Texte rendu
+        """
+        return render_text(self.font, self.text, WHITE)
+
     def handle_event(self, event):
         """
         Gère les événements du bouton
@@ -0,0 +1,122 @@
+"""
+Vérification des allocations au repos : aucune surface créée par frame
+
+Affiche chaque écran (menu, combat, pause, récompenses, fin de run, horde)
+sans interaction, puis un combat où des centaines de nombres flottants et
+d'éclairs sont créés et recyclés en continu (pool de EffectLayer), mesure
+les frames avec AllocationTracker et échoue si une frame crée une surface.
+
+Usage : python -m tools.alloc_check [frames]
+"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402  (le pilote vidéo doit être choisi avant l'import)
+from src.allocations import AllocationTracker, SteadyStateError  # noqa: E402
+from src.game import Game  # noqa: E402
+from src.horde import HordeGame  # noqa: E402
+from src.menu import Menu  # noqa: E402
+from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT  # noqa: E402
+
+WARMUP_FRAMES = 3  # Frames non mesurées (remplissage des caches)
+EFFECTS_PER_FRAME = 8  # Nombres flottants créés par frame (environ 450 actifs à la fois)
+FRAME_MS = 16  # Temps simulé d'une frame pour les effets
+
+
+def scenes(screen, fonts):
+    """
+    Écrans à vérifier
+
+    Args:
+        screen: Surface d'affichage
+        fonts (tuple): Polices (grande, moyenne, petite)
+
+    Returns:
+        list: Couples (nom, fonction qui dessine une frame)
+    """
+    menu = Menu(screen, *fonts)
+
+    def game_in(state):
+        game = Game(screen, *fonts, seed=1)
+        if state == "pause":
+            game.previous_state, game.state = game.state, "pause"
+        elif state == "rewards":
+            game.enemy.hp = 0
+            game._enemy_defeated()
+        elif state == "game_over":
+            game.player.hp = 0
+            game._player_defeated()
+        return game
+
+    def frame(game):
+        def draw():
+            game.update()
+            game.draw()
+        return draw
+
+    def effects_frame(game):
+        # Horloge simulée : les effets expirent et leur place est reprise au fil des frames
+        ticks = [0]
+        game.effects.clock = lambda: ticks[0]
+
+        def draw():
+            ticks[0] += FRAME_MS
+            for i in range(EFFECTS_PER_FRAME):
+                game._show_hp_change(game.enemy, -7 * (i + 1), hit=i % 3 == 0)
+            game.update()
+            game.draw()
+        return draw
+
+    return [
+        ("menu", menu.draw),
+        ("combat", frame(game_in("player_turn"))),
+        ("pause", frame(game_in("pause"))),
+        ("récompenses", frame(game_in("rewards"))),
+        ("game over", frame(game_in("game_over"))),
+        ("horde", frame(HordeGame(screen, *fonts, seed=1, horde_size=100))),
+        ("effets", effects_frame(game_in("player_turn"))),
+    ]
+
+
+def main():
+    """Mesure chaque écran au repos et vérifie qu'aucune surface n'est créée"""
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    fonts = (pygame.font.Font(None, 72), pygame.font.Font(None, 36), pygame.font.Font(None, 24))
+
+    failed = False
+    print(f"{'écran':>12} {'surfaces':>9} {'octets':>8} {'pic':>8} {'GC':>6}")
+    for name, draw in scenes(screen, fonts):
+        for _ in range(WARMUP_FRAMES):
+            draw()
+        tracker = AllocationTracker(frames=frames)
+        tracker.start()
+        try:
+            for _ in range(frames):
+                tracker.begin_frame()
+                draw()
+                tracker.end_frame()
+        finally:
+            tracker.stop()
+
+        summary = tracker.summary()
+        print(f"{name:>12} {summary['surfaces']:>9.2f} {summary['net_bytes']:>8.0f} "
+              f"{summary['peak_bytes']:>8.0f} {summary['collections']:>6.2f}")
+        try:
+            tracker.assert_steady()
+        except SteadyStateError as e:
+            print(f"ÉCHEC ({name}) : {e}")
+            print(tracker.report())
+            failed = True
+
+    pygame.quit()
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark de la boucle asyncio : régularité des frames sous charge de fond
+
+Fait tourner une boucle de frames cadencée par FramePacer.wait_async et
+relève le retard de chaque frame sur son échéance, seule puis avec, à chaque
+frame, l'écriture d'un fichier (AsyncRuntime.write_file) et des simulations
+de runs en continu dans le pool de processus (AsyncRuntime.compute).
+
+Échoue si, avec les tâches de fond, le p99 du retard dépasse une demi-frame.
+
+Usage : python -m tools.async_bench [secondes] [ko_par_écriture]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import pygame
+from src.headless import HeadlessGame, play_run
+from src.latency import FramePacer
+from src.runtime import AsyncRuntime
+from src.constants import FPS
+from src.profiler import percentile
+
+
+def simulate(first_seed, runs):
+    """
+    Simule des runs headless (exécuté dans le pool de processus)
+
+    Args:
+        first_seed (int): Graine de la première run
+        runs (int): Nombre de runs
+
+    Returns:
+        int: Or cumulé des runs
+    """
+    return sum(play_run(HeadlessGame(seed))["gold"] for seed in range(first_seed, first_seed + runs))
+
+
+async def run_frames(seconds, mode, path, size):
+    """
+    Boucle de frames d'une durée donnée
+
+    Args:
+        seconds (float): Durée de la boucle
+        mode (str): "seule" ou "tâches" (écritures et calculs de fond)
+        path (str): Fichier écrit à chaque frame
+        size (int): Taille de chaque écriture (octets)
+
+    Returns:
+        tuple: (retards des frames triés en ms, runs simulées)
+    """
+    runtime = AsyncRuntime()
+    pacer = FramePacer(pygame.time.Clock(), FPS, present=lambda: None)
+    data = os.urandom(size)
+    simulated = 0
+
+    async def simulations():
+        nonlocal simulated
+        seed = 0
+        while True:
+            await runtime.compute(simulate, seed, 50)
+            seed += 50
+            simulated += 50
+
+    if mode == "tâches":
+        runtime.spawn(simulations(), "simulations", daemon=True)
+    lateness = []
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        await pacer.wait_async()
+        lateness.append((time.perf_counter() - pacer._deadline) * 1000)
+        if mode == "tâches":
+            runtime.spawn(runtime.write_file(path, data), "écriture")
+    await runtime.shutdown()
+    lateness.sort()
+    return lateness, simulated
+
+
+def main():
+    """Point d'entrée du benchmark"""
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    size = int(sys.argv[2]) * 1024 if len(sys.argv) > 2 else 1024 * 1024
+
+    budget = 1000 / FPS
+    print(f"{'mode':>10} {'frames':>7} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'runs':>7}"
+          f"  (retard sur l'échéance, budget {budget:.1f} ms)")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.dat")
+        for mode in ("seule", "tâches"):
+            lateness, simulated = asyncio.run(run_frames(seconds, mode, path, size))
+            p99 = percentile(lateness, 0.99)
+            print(f"{mode:>10} {len(lateness):>7} {percentile(lateness, 0.5):>8.3f} "
+                  f"{p99:>8.3f} {lateness[-1]:>8.3f} {simulated:>7}")
+            if mode == "tâches" and p99 > budget / 2:
+                print(f"ÉCHEC : frames en retard avec les tâches de fond (p99 {p99:.3f} ms)")
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
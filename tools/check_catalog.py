@@ -0,0 +1,32 @@
+"""
+Validation du catalogue d'ennemis
+
+Charge et compile le fichier comme le jeu, puis affiche un résumé des
+ennemis et des tirages par étage.
+
+Usage : python -m tools.check_catalog [chemin]
+"""
+import sys
+from src.catalog import CATALOG_FILE, CatalogError, EnemyCatalog
+
+
+def main():
+    """Valide un fichier de catalogue et affiche un résumé"""
+    path = sys.argv[1] if len(sys.argv) > 1 else CATALOG_FILE
+    try:
+        catalog = EnemyCatalog(path)
+    except CatalogError as e:
+        print(f"Catalogue invalide: {e}")
+        sys.exit(1)
+
+    print(f"Catalogue valide: {len(catalog.ids)} ennemis, étages 1 à {catalog.floors}")
+    previous = None
+    for floor in range(1, catalog.floors + 1):
+        choices, _ = catalog.spawn_tables[floor]
+        if choices != previous:
+            print(f"  Dès l'étage {floor:2d}: " + ", ".join(catalog.names[i] for i in choices))
+            previous = choices
+
+
+if __name__ == "__main__":
+    main()
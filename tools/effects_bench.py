@@ -0,0 +1,78 @@
+"""
+Benchmark des effets visuels : des centaines de nombres flottants et d'éclairs
+
+Maintient un nombre cible d'effets actifs dans un combat (de nouveaux effets
+remplacent ceux qui expirent, sur une horloge simulée de 16 ms par frame) et
+chronomètre les frames complètes (update, draw, flip).
+
+Échoue si le p99 du temps de frame dépasse le budget d'une frame.
+
+Usage : python -m tools.effects_bench [effets_actifs] [frames]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402  (le pilote vidéo doit être choisi avant l'import)
+from src.game import Game  # noqa: E402
+from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, EFFECT_NUMBER_MS  # noqa: E402
+from src.profiler import percentile  # noqa: E402
+
+FRAME_MS = 16  # Temps simulé d'une frame
+
+
+def bench_effects(game, active, frames):
+    """
+    Chronomètre des frames avec environ `active` effets à l'écran
+
+    Args:
+        game (Game): Partie en combat
+        active (int): Effets actifs visés
+        frames (int): Frames chronométrées (après autant de frames de mise en route)
+
+    Returns:
+        tuple: (durées triées en ms, effets actifs en fin de mesure, effets ignorés)
+    """
+    ticks = [0]
+    game.effects.clock = lambda: ticks[0]
+    per_frame = max(1, active * FRAME_MS // EFFECT_NUMBER_MS)
+    times = []
+    for frame in range(frames * 2):
+        start = time.perf_counter()
+        ticks[0] += FRAME_MS
+        for i in range(per_frame):
+            game._show_hp_change(game.enemy if i % 2 else game.player, -(i * 37 % 250 + 1),
+                                 hit=i % 4 == 0)
+        game.update()
+        game.draw()
+        pygame.display.flip()
+        if frame >= frames:
+            times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return times, game.effects.count, game.effects.dropped
+
+
+def main():
+    """Point d'entrée du benchmark"""
+    active = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    fonts = (pygame.font.Font(None, 72), pygame.font.Font(None, 36), pygame.font.Font(None, 24))
+    game = Game(screen, *fonts, seed=0)
+
+    budget = 1000 / FPS
+    times, count, dropped = bench_effects(game, active, frames)
+    print(f"{count} effets actifs ({dropped} ignorés) : frame p50 {percentile(times, 0.5):.3f} "
+          f"p99 {percentile(times, 0.99):.3f} max {times[-1]:.3f} ms (budget {budget:.1f} ms)")
+    pygame.quit()
+    if percentile(times, 0.99) > budget:
+        print("ÉCHEC : frames au-delà du budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark du mode Horde : temps de frame selon la taille de la horde
+
+Chaque frame, quelques ennemis reçoivent des dégâts (sprites sales) puis la
+partie est mise à jour et dessinée, comme dans la boucle principale.
+
+Usage : python -m tools.horde_bench [frames] [taille1,taille2,...]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402  (le pilote vidéo doit être choisi avant l'import)
+from src.horde import HordeGame  # noqa: E402
+from src.profiler import percentile  # noqa: E402
+from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS  # noqa: E402
+
+HITS_PER_FRAME = 4  # Ennemis touchés par frame
+
+
+def bench_size(screen, fonts, size, frames):
+    """
+    Mesure les temps de frame pour une taille de horde
+
+    Args:
+        screen: Surface d'affichage
+        fonts (tuple): Polices (grande, moyenne, petite)
+        size (int): Nombre d'ennemis
+        frames (int): Nombre de frames mesurées
+
+    Returns:
+        list: Temps de frame triés (ms)
+    """
+    game = HordeGame(screen, *fonts, seed=size, horde_size=size)
+    times = []
+    for frame in range(frames):
+        start = time.perf_counter()
+        for hit in range(HITS_PER_FRAME):
+            enemy = game.enemies[(frame * HITS_PER_FRAME + hit) % size]
+            if enemy.hp > 1:
+                enemy.hp -= 1
+        game.update()
+        game.draw()
+        pygame.display.flip()
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return times
+
+
+def main():
+    """Point d'entrée du benchmark"""
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    sizes = [int(n) for n in sys.argv[2].split(",")] if len(sys.argv) > 2 \
+        else [10, 50, 100, 250, 500]
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    fonts = (pygame.font.Font(None, 72), pygame.font.Font(None, 36), pygame.font.Font(None, 24))
+
+    budget = 1000 / FPS
+    print(f"{'N':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}  (budget {budget:.1f} ms)")
+    for size in sizes:
+        times = bench_size(screen, fonts, size, frames)
+        print(f"{size:>5} {percentile(times, 0.5):>8.3f} {percentile(times, 0.95):>8.3f} "
+              f"{percentile(times, 0.99):>8.3f} {times[-1]:>8.3f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+Stress des entrées : flux d'événements aléatoires (mais reproductibles)
+
+Injecte à pleine vitesse des clics sur les boutons visibles, des clics au
+hasard, des mouvements de souris, ESC, ESPACE et le timer de l'ennemi dans
+Game.handle_event et Menu.handle_events, sans rendu (pilote vidéo "dummy"),
+et vérifie les invariants de la machine à états après chaque événement :
+état valide, previous_state défini pendant la pause, HP dans leurs bornes,
+potions jamais négatives, tour ennemi toujours programmé. Affiche le débit
+en événements par seconde.
+
+Le timer de l'ennemi est modélisé comme pygame.time.set_timer : USEREVENT
+n'arrive que s'il est programmé, et continue d'arriver tant qu'il n'est
+pas annulé.
+
+Usage : python -m tools.input_stress [événements] [graine]
+"""
+import os
+import random
+import sys
+import time
+from collections import deque
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402  (le pilote vidéo doit être choisi avant l'import)
+from src.game import Game  # noqa: E402
+from src.menu import Menu  # noqa: E402
+from src.settings import Settings, SETTINGS_CHOICES  # noqa: E402
+from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT  # noqa: E402
+
+GAME_STATES = {"player_turn", "enemy_turn", "rewards", "pause", "game_over", "victory_final"}
+MENU_STATES = {"main", "options", "leaderboard"}
+MENU_ACTIONS = {None, "play", "endless", "horde", "settings", "quit"}
+
+HISTORY_SIZE = 20  # Derniers événements affichés en cas d'échec
+
+# Événements tirés et leurs poids
+EVENT_WEIGHTS = {
+    "button": 10,  # Clic au centre d'un bouton visible
+    "click": 2,  # Clic n'importe où
+    "motion": 4,
+    "escape": 2,
+    "space": 1,
+    "timer": 4,  # USEREVENT, seulement si le timer est programmé
+}
+
+
+class InvariantError(AssertionError):
+    """Erreur levée quand un invariant de la machine à états est violé"""
+
+
+class StressGame(Game):
+    """Partie dont le timer de l'ennemi est modélisé au lieu d'être programmé"""
+
+    def __init__(self, *args, **kwargs):
+        """Initialise la partie (timer de l'ennemi annulé)"""
+        self.enemy_timer = False
+        super().__init__(*args, **kwargs)
+
+    def _schedule_enemy_turn(self):
+        """Programme le timer modélisé"""
+        self.enemy_timer = True
+
+    def _cancel_enemy_turn(self):
+        """Annule le timer modélisé"""
+        self.enemy_timer = False
+
+
+def visible_buttons(target):
+    """
+    Boutons qui réagissent dans l'état courant
+
+    Args:
+        target: Game ou Menu
+
+    Returns:
+        list: Boutons cliquables
+    """
+    if isinstance(target, Menu):
+        if target.state == "main":
+            return target.main_buttons
+        if target.state == "leaderboard":
+            return [target.back_button, target.sort_button]
+        return [target.back_button] + target.option_buttons
+    if target.state == "pause":
+        return target.pause_buttons
+    if target.state == "player_turn":
+        return target.action_buttons
+    if target.state == "rewards":
+        return target.reward_buttons
+    return []
+
+
+def random_event(rng, target):
+    """
+    Tire un événement
+
+    Args:
+        rng (random.Random): Aléatoire du flux
+        target: Game ou Menu qui va recevoir l'événement
+
+    Returns:
+        pygame.event.Event: Événement (None si le timer n'est pas programmé)
+    """
+    kind = rng.choices(list(EVENT_WEIGHTS), list(EVENT_WEIGHTS.values()))[0]
+    if kind == "button":
+        buttons = visible_buttons(target)
+        if buttons:
+            return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=rng.choice(buttons).rect.center, button=1)
+        kind = "click"
+    if kind in ("click", "motion"):
+        pos = (rng.randrange(SCREEN_WIDTH), rng.randrange(SCREEN_HEIGHT))
+        if kind == "click":
+            return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)
+        return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+    if kind in ("escape", "space"):
+        key = pygame.K_ESCAPE if kind == "escape" else pygame.K_SPACE
+        return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)
+    if isinstance(target, StressGame) and target.enemy_timer:
+        return pygame.event.Event(pygame.USEREVENT)
+    return None
+
+
+def check_game(game):
+    """
+    Vérifie les invariants d'une partie
+
+    Args:
+        game (StressGame): Partie à vérifier
+
+    Raises:
+        InvariantError: Si un invariant est violé
+    """
+    if game.state not in GAME_STATES:
+        raise InvariantError(f"état invalide : {game.state!r}")
+    if game.state == "pause" and getattr(game, "previous_state", None) not in GAME_STATES - {"pause"}:
+        raise InvariantError(f"pause sans état précédent valide : {getattr(game, 'previous_state', None)!r}")
+    for character in (game.player, game.enemy):
+        if not 0 <= character.hp <= character.max_hp:
+            raise InvariantError(f"HP hors bornes : {character.name} {character.hp}/{character.max_hp}")
+    if game.potions < 0:
+        raise InvariantError(f"potions négatives : {game.potions}")
+    if game.state == "enemy_turn" and not game.enemy_timer:
+        raise InvariantError("tour ennemi sans timer programmé : la partie est bloquée")
+    if game.state == "rewards" and not game.reward_buttons:
+        raise InvariantError("écran des récompenses sans bouton")
+    if game.state in ("player_turn", "enemy_turn") and not game.player.is_alive():
+        raise InvariantError(f"joueur mort en état {game.state}")
+
+
+def check_menu(menu, action):
+    """
+    Vérifie les invariants du menu
+
+    Args:
+        menu (Menu): Menu à vérifier
+        action (str): Action renvoyée par handle_events
+
+    Raises:
+        InvariantError: Si un invariant est violé
+    """
+    if menu.state not in MENU_STATES:
+        raise InvariantError(f"état du menu invalide : {menu.state!r}")
+    if action not in MENU_ACTIONS:
+        raise InvariantError(f"action du menu invalide : {action!r}")
+    for name, choices in SETTINGS_CHOICES.items():
+        if menu.settings[name] not in choices:
+            raise InvariantError(f"option invalide : {name}={menu.settings[name]!r}")
+
+
+def stress(target, events, seed):
+    """
+    Injecte un flux d'événements et vérifie les invariants après chacun
+
+    Args:
+        target: StressGame ou Menu
+        events (int): Nombre d'événements injectés
+        seed (int): Graine du flux
+
+    Returns:
+        float: Durée en secondes
+
+    Raises:
+        InvariantError: Si un invariant est violé (avec les derniers événements)
+    """
+    rng = random.Random(seed)
+    history = deque(maxlen=HISTORY_SIZE)
+    is_game = isinstance(target, StressGame)
+    start = time.perf_counter()
+    injected = 0
+    while injected < events:
+        event = random_event(rng, target)
+        if event is None:
+            continue
+        injected += 1
+        history.append((target.state, pygame.event.event_name(event.type), getattr(event, "pos", None)))
+        try:
+            if is_game:
+                target.handle_event(event)
+                target.return_to_menu = False  # La boucle principale changerait d'écran
+                check_game(target)
+            else:
+                check_menu(target, target.handle_events(event))
+        except InvariantError as e:
+            trace = "\n".join(f"    {state:>13}  {name} {pos or ''}" for state, name, pos in history)
+            raise InvariantError(f"événement {injected} (graine {seed}) : {e}\n  Derniers événements :\n{trace}")
+    return time.perf_counter() - start
+
+
+def main():
+    """Point d'entrée du stress des entrées"""
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    fonts = (pygame.font.Font(None, 72), pygame.font.Font(None, 36), pygame.font.Font(None, 24))
+
+    failed = False
+    targets = (("game", StressGame(screen, *fonts, seed=seed)),
+               ("menu", Menu(screen, *fonts, settings=Settings())))
+    for name, target in targets:
+        try:
+            elapsed = stress(target, events, seed)
+        except InvariantError as e:
+            print(f"ÉCHEC ({name}) : {e}")
+            failed = True
+            continue
+        print(f"{name:>5} : {events} événements en {elapsed:.2f} s ({events / elapsed:,.0f} événements/s)")
+
+    pygame.quit()
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
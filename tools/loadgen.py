@@ -0,0 +1,125 @@
+"""
+Générateur de charge pour le serveur de jeu headless
+
+Chaque client ouvre une connexion, joue des runs complètes (politique simple)
+et mesure la latence de chaque requête. Affiche le débit et les percentiles.
+
+Usage : python -m tools.loadgen [--clients N] [--duration S] [--port P | --unix CHEMIN] [--inprocess]
+"""
+import argparse
+import asyncio
+import functools
+import random
+import time
+from src.server import (
+    GameServer, REQUEST, RESPONSE, STATE, OP_NEW, OP_ACTION, OP_REWARD, OP_CLOSE,
+    STATUS_OK, ACTIONS, unpack_response
+)
+from src.profiler import percentile
+from src.constants import (
+    REWARD_TYPES, SERVER_HOST, SERVER_PORT, SERVER_BACKLOG, POTION_HEAL_AMOUNT
+)
+
+RESPONSE_SIZE = RESPONSE.size + STATE.size
+
+
+async def run_client(connect, deadline, latencies, counters, seed):
+    """
+    Joue des runs jusqu'à l'échéance
+
+    Args:
+        connect: Coroutine qui ouvre la connexion (reader, writer)
+        deadline (float): Instant de fin (time.perf_counter)
+        latencies (list): Latences mesurées (secondes), complétée
+        counters (dict): Compteurs partagés ('requests', 'runs', 'errors')
+        seed (int): Graine du client
+    """
+    reader, writer = await connect()
+    rng = random.Random(seed)
+
+    async def request(opcode, session, argument=0):
+        start = time.perf_counter()
+        writer.write(REQUEST.pack(opcode, session, argument))
+        data = await reader.readexactly(RESPONSE_SIZE)
+        latencies.append(time.perf_counter() - start)
+        counters["requests"] += 1
+        return unpack_response(data)
+
+    try:
+        while time.perf_counter() < deadline:
+            status, session, state = await request(OP_NEW, 0, rng.randrange(2 ** 32))
+            while status == STATUS_OK and state["state"] not in ("game_over", "victory_final"):
+                if time.perf_counter() >= deadline:
+                    break
+                if state["state"] == "rewards":
+                    choices = len(REWARD_TYPES) if state["potions"] < 5 else len(REWARD_TYPES) - 1
+                    status, _, state = await request(OP_REWARD, session, rng.randrange(choices))
+                else:
+                    low = state["hp"] < state["max_hp"] * 0.35 and \
+                        state["max_hp"] - state["hp"] >= POTION_HEAL_AMOUNT
+                    action = "potion" if low and state["potions"] > 0 else "attack"
+                    status, _, state = await request(OP_ACTION, session, ACTIONS.index(action))
+            if status != STATUS_OK:
+                counters["errors"] += 1
+            elif state["state"] in ("game_over", "victory_final"):
+                counters["runs"] += 1
+            await request(OP_CLOSE, session)
+    finally:
+        writer.close()
+
+
+async def run_load(args):
+    """
+    Lance les clients et affiche le rapport
+
+    Args:
+        args: Arguments de la ligne de commande
+    """
+    server = None
+    if args.inprocess:
+        server = await asyncio.start_server(GameServer().handle_client, SERVER_HOST, 0,
+                                            backlog=SERVER_BACKLOG)
+        port = server.sockets[0].getsockname()[1]
+        connect = functools.partial(asyncio.open_connection, SERVER_HOST, port)
+    elif args.unix:
+        connect = functools.partial(asyncio.open_unix_connection, args.unix)
+    else:
+        connect = functools.partial(asyncio.open_connection, args.host, args.port)
+
+    latencies = []
+    counters = {"requests": 0, "runs": 0, "errors": 0}
+    start = time.perf_counter()
+    deadline = start + args.duration
+    await asyncio.gather(*(run_client(connect, deadline, latencies, counters, seed)
+                           for seed in range(args.clients)))
+    elapsed = time.perf_counter() - start
+
+    if server:
+        server.close()
+        await server.wait_closed()
+
+    latencies.sort()
+    print(f"Clients: {args.clients}   Durée: {elapsed:.1f}s")
+    print(f"Requêtes: {counters['requests']} ({counters['requests'] / elapsed:.0f}/s)   "
+          f"Runs terminées: {counters['runs']} ({counters['runs'] / elapsed:.1f}/s)   "
+          f"Erreurs: {counters['errors']}")
+    print("Latence (ms): " + "   ".join(
+        f"p{ratio * 100:g}={percentile(latencies, ratio) * 1000:.3f}"
+        for ratio in (0.5, 0.9, 0.99, 0.999)))
+
+
+def main():
+    """Point d'entrée du générateur de charge"""
+    parser = argparse.ArgumentParser(description="Générateur de charge du serveur de jeu")
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--unix", help="Chemin du socket Unix du serveur")
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--inprocess", action="store_true",
+                        help="Démarre le serveur dans le même processus")
+    asyncio.run(run_load(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark des métriques : coût d'une mise à jour et effet des collectes
+
+Mesure le coût d'une mise à jour (Counter.inc, Histogram.observe) et vérifie
+que des centaines de milliers de mises à jour ne conservent pas de mémoire
+(tracemalloc : les nouvelles valeurs remplacent seulement les anciennes).
+Rend ensuite des frames de jeu sans collecte, puis pendant qu'un client
+interroge /metrics en boucle (MetricsServer sur un socket Unix).
+
+Échoue si les mises à jour conservent plus de UPDATE_MEMORY_LIMIT octets, ou
+si le p99 du temps de frame pendant les collectes dépasse une frame.
+
+Usage : python -m tools.metrics_bench [frames]
+"""
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402  (le pilote vidéo doit être choisi avant l'import)
+from src.game import Game  # noqa: E402
+from src.metrics import METRICS, FRAME_TIME, TEXT_CACHE_HITS, MetricsServer  # noqa: E402
+from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS  # noqa: E402
+from src.profiler import percentile  # noqa: E402
+
+UPDATE_MEMORY_LIMIT = 1024  # Octets conservés tolérés (valeurs courantes des métriques)
+
+
+def bench_updates(count):
+    """
+    Coût et allocations conservées des mises à jour
+
+    Args:
+        count (int): Nombre de mises à jour de chaque sorte
+
+    Returns:
+        tuple: (ns par inc, ns par observe, octets conservés)
+    """
+    start = time.perf_counter_ns()
+    for _ in range(count):
+        TEXT_CACHE_HITS.inc()
+    inc_ns = (time.perf_counter_ns() - start) / count
+    start = time.perf_counter_ns()
+    for _ in range(count):
+        FRAME_TIME.observe(0.005)
+    observe_ns = (time.perf_counter_ns() - start) / count
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(count):
+        TEXT_CACHE_HITS.inc()
+        FRAME_TIME.observe(0.005)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    kept = sum(stat.size_diff for stat in after.compare_to(before, "filename")
+               if stat.traceback[0].filename.endswith("metrics.py"))
+    return inc_ns, observe_ns, kept
+
+
+def scrape_forever(path, stop, counter):
+    """
+    Client qui interroge /metrics en boucle (thread)
+
+    Args:
+        path (str): Socket Unix du serveur
+        stop (threading.Event): Arrêt demandé
+        counter (list): Nombre de collectes (une case)
+    """
+    while not stop.is_set():
+        client = socket.socket(socket.AF_UNIX)
+        client.connect(path)
+        client.sendall(b"GET /metrics HTTP/1.0\r\n\r\n")
+        while client.recv(65536):
+            pass
+        client.close()
+        counter[0] += 1
+
+
+def bench_frames(game, frames):
+    """
+    Temps de frame (update + draw + flip)
+
+    Args:
+        game (Game): Partie affichée
+        frames (int): Nombre de frames
+
+    Returns:
+        list: Durées triées (ms)
+    """
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        game.update()
+        game.draw()
+        pygame.display.flip()
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return times
+
+
+def main():
+    """Point d'entrée du benchmark"""
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+
+    inc_ns, observe_ns, kept = bench_updates(200000)
+    print(f"Counter.inc {inc_ns:.0f} ns, Histogram.observe {observe_ns:.0f} ns, "
+          f"{kept} octets conservés")
+    if kept > UPDATE_MEMORY_LIMIT:
+        print("ÉCHEC : les mises à jour conservent de la mémoire")
+        sys.exit(1)
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    fonts = (pygame.font.Font(None, 72), pygame.font.Font(None, 36), pygame.font.Font(None, 24))
+    game = Game(screen, *fonts, seed=0)
+
+    budget = 1000 / FPS
+    print(f"{'collectes':>10} {'frames':>7} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'scrapes':>8}"
+          f"  (budget {budget:.1f} ms)")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "metrics.sock")
+        server = MetricsServer(METRICS, f"unix:{path}")
+        server.start()
+        for scraping in (False, True):
+            stop = threading.Event()
+            counter = [0]
+            client = threading.Thread(target=scrape_forever, args=(path, stop, counter), daemon=True)
+            if scraping:
+                client.start()
+            times = bench_frames(game, frames)
+            stop.set()
+            if scraping:
+                client.join()
+            p99 = percentile(times, 0.99)
+            print(f"{'oui' if scraping else 'non':>10} {len(times):>7} {percentile(times, 0.5):>8.3f} "
+                  f"{p99:>8.3f} {times[-1]:>8.3f} {counter[0]:>8}")
+            if scraping and p99 > budget:
+                print(f"ÉCHEC : frames au-delà du budget pendant les collectes (p99 {p99:.3f} ms)")
+                sys.exit(1)
+        server.stop()
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
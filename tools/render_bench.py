@@ -0,0 +1,284 @@
+"""
+Benchmark du rendu sans écran (pilote vidéo SDL "dummy")
+
+Construit le menu et une partie, amène chaque écran dans son état par des
+entrées scriptées (clics, touches, timer de l'ennemi), puis chronomètre des
+milliers d'appels à draw() par état. Une seconde passe, plus courte et
+suivie par AllocationTracker, compte les textes rendus, les blits, les
+surfaces créées et les octets alloués par frame.
+
+Les résultats peuvent être écrits dans une référence JSON (--save) ou
+comparés à une référence (--compare) : un état plus lent, ou qui rend,
+blitte ou alloue plus que la référence au-delà du seuil, fait échouer la
+commande. Les temps comparés sont la moyenne et la médiane ; un écart
+inférieur à --tolerance-ms est ignoré (bruit de mesure d'une exécution à
+l'autre, à l'échelle de frames de moins d'une ms). Le p99, sensible aux
+préemptions du système, est affiché et enregistré sans être comparé.
+
+Avec --backend texture, les écrans dessinent par le renderer SDL (logiciel
+sous le pilote "dummy") : chaque frame chronométrée inclut la présentation,
+qui exécute les commandes de rendu mises en lot par SDL. Avec
+--render-scale 0.5, le backend surface dessine dans l'image interne réduite
+(option Résolution interne).
+
+Usage : python -m tools.render_bench [--frames N] [--backend surface|texture] [--render-scale 1.0]
+                                     [--save FICHIER] [--compare FICHIER] [--threshold 0.2]
+                                     [--tolerance-ms 0.5]
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402  (le pilote vidéo doit être choisi avant l'import)
+from src.allocations import AllocationTracker  # noqa: E402
+from src.display import RENDERER_BACKENDS, Display  # noqa: E402
+from src.game import Game  # noqa: E402
+from src.menu import Menu  # noqa: E402
+from src.settings import Settings  # noqa: E402
+from src.profiler import percentile  # noqa: E402
+from src.constants import MAX_FLOOR  # noqa: E402
+
+WARMUP_FRAMES = 10  # Frames non mesurées (remplissage des caches)
+COUNTED_FRAMES = 100  # Frames de la passe de comptage (plus lente)
+
+# Mesures comparées à la référence
+METRICS = ("ms_per_frame", "p50_ms", "renders", "blits", "surfaces", "peak_bytes")
+TIME_METRICS = ("ms_per_frame", "p50_ms")  # Mesures en ms, soumises à la tolérance absolue
+TIME_TOLERANCE_MS = 0.5  # Écart de temps ignoré, quel que soit le seuil relatif
+
+
+def click(target, button):
+    """
+    Clique au centre d'un bouton
+
+    Args:
+        target: Menu ou Game qui reçoit l'événement
+        button (Button): Bouton à cliquer
+    """
+    handle = target.handle_event if isinstance(target, Game) else target.handle_events
+    handle(pygame.event.Event(pygame.MOUSEMOTION, pos=button.rect.center, rel=(0, 0), buttons=(0, 0, 0)))
+    handle(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=button.rect.center, button=1))
+
+
+def press(game, key):
+    """
+    Appuie sur une touche
+
+    Args:
+        game (Game): Partie qui reçoit l'événement
+        key (int): Touche pygame
+    """
+    game.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+
+
+def enemy_turn_elapsed(game):
+    """
+    Déclenche le timer de l'action ennemie
+
+    Args:
+        game (Game): Partie qui reçoit l'événement
+    """
+    game.handle_event(pygame.event.Event(pygame.USEREVENT))
+
+
+def scripted_states(screen, fonts, seed=1):
+    """
+    Écrans amenés dans chaque état par des entrées scriptées
+
+    Args:
+        screen: Backend de rendu
+        fonts (tuple): Polices (grande, moyenne, petite)
+        seed (int): Graine des parties - optionnel
+
+    Returns:
+        list: Couples (état, objet à dessiner)
+    """
+    menu = Menu(screen, *fonts)
+
+    options = Menu(screen, *fonts, settings=Settings())
+    click(options, options.main_buttons[4])  # Options
+
+    player_turn = Game(screen, *fonts, seed=seed)
+
+    enemy_turn = Game(screen, *fonts, seed=seed)
+    click(enemy_turn, enemy_turn.action_buttons[1])  # Défense
+
+    rewards = Game(screen, *fonts, seed=seed)
+    rewards.enemy.hp = 1
+    click(rewards, rewards.action_buttons[0])  # Attaque fatale
+
+    pause = Game(screen, *fonts, seed=seed)
+    press(pause, pygame.K_ESCAPE)
+
+    game_over = Game(screen, *fonts, seed=seed)
+    game_over.player.hp = 1
+    game_over.player.defense = 0
+    click(game_over, game_over.action_buttons[1])  # Défense, puis riposte fatale
+    enemy_turn_elapsed(game_over)
+
+    victory_final = Game(screen, *fonts, seed=seed)
+    victory_final.floor = MAX_FLOOR
+    victory_final.enemy.hp = 1
+    click(victory_final, victory_final.action_buttons[0])
+    click(victory_final, victory_final.reward_buttons[0])
+
+    # Les tours ennemis et les messages restent figés pendant la mesure
+    pygame.time.set_timer(pygame.USEREVENT, 0)
+    for game in (player_turn, enemy_turn, rewards, pause, game_over, victory_final):
+        game.message_until = math.inf
+
+    states = [
+        ("menu", menu, menu.state == "main"),
+        ("options", options, options.state == "options"),
+        ("player_turn", player_turn, player_turn.state == "player_turn"),
+        ("enemy_turn", enemy_turn, enemy_turn.state == "enemy_turn"),
+        ("rewards", rewards, rewards.state == "rewards"),
+        ("pause", pause, pause.state == "pause"),
+        ("game_over", game_over, game_over.state == "game_over"),
+        ("victory_final", victory_final, victory_final.state == "victory_final"),
+    ]
+    for name, _, reached in states:
+        if not reached:
+            raise RuntimeError(f"Script de l'état {name} : état non atteint")
+    return [(name, screen_object) for name, screen_object, _ in states]
+
+
+def bench_state(screen_object, frames, flush=None):
+    """
+    Mesure le rendu d'un écran
+
+    Args:
+        screen_object: Menu ou Game à dessiner
+        frames (int): Nombre de draw() chronométrés
+        flush: Fonction appelée après chaque draw() (présentation du renderer) - optionnel
+
+    Returns:
+        dict: Mesures par frame (voir METRICS), plus le p99 en ms
+    """
+    if flush is None:
+        draw = screen_object.draw
+    else:
+        def draw():
+            screen_object.draw()
+            flush()
+    for _ in range(WARMUP_FRAMES):
+        draw()
+
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        draw()
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+
+    # Comptage séparé : le hook du suivi fausserait les temps
+    tracker = AllocationTracker(frames=COUNTED_FRAMES, by_site=False)
+    tracker.start()
+    try:
+        for _ in range(COUNTED_FRAMES):
+            tracker.begin_frame()
+            draw()
+            tracker.end_frame()
+    finally:
+        tracker.stop()
+    counts = tracker.summary()
+
+    return {
+        "ms_per_frame": sum(times) / len(times),
+        "p50_ms": percentile(times, 0.5),
+        "p99_ms": percentile(times, 0.99),
+        "renders": counts["renders"],
+        "blits": counts["blits"],
+        "surfaces": counts["surfaces"],
+        "peak_bytes": counts["peak_bytes"],
+    }
+
+
+def compare(results, baseline, threshold, tolerance_ms=TIME_TOLERANCE_MS):
+    """
+    Compare les mesures à une référence
+
+    Args:
+        results (dict): État -> mesures
+        baseline (dict): Référence chargée (voir --save)
+        threshold (float): Hausse tolérée (0.2 = +20 %)
+        tolerance_ms (float): Hausse de temps ignorée, en ms - optionnel
+
+    Returns:
+        list: Régressions lisibles (vide si aucune)
+    """
+    regressions = []
+    for name, metrics in results.items():
+        reference = baseline["states"].get(name)
+        if reference is None:
+            continue
+        for metric in METRICS:
+            if metric not in reference:
+                continue
+            if metric in TIME_METRICS and metrics[metric] - reference[metric] < tolerance_ms:
+                continue
+            if metrics[metric] > reference[metric] * (1 + threshold):
+                regressions.append(f"{name}.{metric} : {metrics[metric]:.3f} "
+                                   f"(référence {reference[metric]:.3f})")
+    return regressions
+
+
+def main():
+    """Point d'entrée du benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark du rendu sans écran")
+    parser.add_argument("--frames", type=int, default=2000, help="draw() chronométrés par état")
+    parser.add_argument("--backend", choices=RENDERER_BACKENDS, default="surface",
+                        help="Backend de rendu mesuré")
+    parser.add_argument("--render-scale", type=float, default=1.0,
+                        help="Résolution interne du backend surface (0.5 = moitié)")
+    parser.add_argument("--save", help="Écrit les mesures dans une référence JSON")
+    parser.add_argument("--compare", help="Compare les mesures à une référence JSON")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Hausse tolérée avant de signaler une régression (0.2 = +20 %%)")
+    parser.add_argument("--tolerance-ms", type=float, default=TIME_TOLERANCE_MS,
+                        help="Hausse de temps ignorée, en ms (bruit de mesure)")
+    args = parser.parse_args()
+
+    pygame.init()
+    display = Display(backend=args.backend)
+    display.configure(args.render_scale)
+    screen = display.backend
+    flush = display.renderer.present if display.texture_mode else None
+    fonts = (pygame.font.Font(None, 72), pygame.font.Font(None, 36), pygame.font.Font(None, 24))
+
+    results = {}
+    print(f"{'état':>14} {'ms/frame':>9} {'p99 ms':>8} {'textes':>7} {'blits':>7} "
+          f"{'surfaces':>9} {'pic o':>8}")
+    for name, screen_object in scripted_states(screen, fonts):
+        metrics = bench_state(screen_object, args.frames, flush)
+        results[name] = metrics
+        print(f"{name:>14} {metrics['ms_per_frame']:>9.3f} {metrics['p99_ms']:>8.3f} "
+              f"{metrics['renders']:>7.2f} {metrics['blits']:>7.1f} "
+              f"{metrics['surfaces']:>9.2f} {metrics['peak_bytes']:>8.0f}")
+    pygame.quit()
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"frames": args.frames, "backend": args.backend,
+                       "render_scale": args.render_scale, "states": results}, f, indent=2)
+        print(f"Référence écrite : {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.tolerance_ms)
+        if regressions:
+            print(f"ÉCHEC : {len(regressions)} régression(s) au-delà de +{args.threshold:.0%}")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"Aucune régression au-delà de +{args.threshold:.0%} ({args.compare})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+Captures d'écran headless et comparaison aux images de référence
+
+Rend chaque état visuel du menu et des parties (états scriptés de
+render_bench, plus le mode Horde) pour une matrice de graines et de tailles
+de fenêtre, avec le pilote vidéo SDL "dummy" : l'image interne passe par
+Display.present, comme en jeu (mise à l'échelle, bandes noires). Les
+captures sont réparties sur un pool de processus (une tâche par graine et
+par taille) et écrites en PNG.
+
+Chaque capture est comparée à son image de référence par une différence
+perceptuelle calculée avec NumPy sur des vues surfarray.pixels3d (sans copie
+des pixels) et des tampons réutilisés : écart de luminance pondéré (BT.601)
+par pixel, et part des pixels dont l'écart dépasse la tolérance. Une capture
+qui diffère écrit aussi une image des pixels en cause.
+
+Les états du menu ne dépendent pas de la graine : ils sont capturés une fois
+par taille. Les nombres flottants sont figés (horloge des effets fixée).
+
+Échoue si une capture diffère de sa référence ou si la référence manque.
+Les références sont propres à la machine (rendu des polices) : elles se
+créent avec --update sur une version validée.
+
+Usage : python -m tools.screenshots [--seeds 1 2 3] [--sizes 800x600 1280x720]
+                                    [--workers N] [--update] [--goldens DOSSIER]
+                                    [--out DOSSIER] [--tolerance 12] [--ratio 0.001]
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # numpy est optionnel pour le jeu, requis ici
+    np = None
+
+DEFAULT_SEEDS = (1, 2, 3)
+DEFAULT_SIZES = ("800x600", "1280x720", "640x480", "1920x1080")
+GOLDENS_DIR = os.path.join("screenshots", "goldens")
+OUTPUT_DIR = os.path.join("screenshots", "current")
+PIXEL_TOLERANCE = 12  # Écart de luminance (0-255) au-delà duquel un pixel diffère
+DIFF_RATIO = 0.001  # Part des pixels différents tolérée
+EFFECTS_ELAPSED_MS = 150  # Instant auquel les nombres flottants sont figés
+HORDE_SIZE = 60  # Ennemis de l'état "horde"
+
+# Luminance BT.601 : l'œil est plus sensible au vert qu'au rouge, au rouge qu'au bleu
+LUMA = (0.299, 0.587, 0.114)
+
+# État du processus de capture (initialisé par _init_worker)
+_worker = {}
+
+
+def _init_worker():
+    """Initialise pygame, les polices et l'affichage d'un processus de capture"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    import pygame
+    from src.display import Display
+    pygame.init()
+    display = Display()
+    display.configure()
+    _worker["fonts"] = (pygame.font.Font(None, 72), pygame.font.Font(None, 36),
+                        pygame.font.Font(None, 24))
+    _worker["display"] = display
+    _worker["buffers"] = {}
+
+
+def freeze_effects(game):
+    """
+    Fige les nombres flottants d'une partie (capture reproductible)
+
+    Args:
+        game (Game): Partie capturée
+    """
+    effects = game.effects
+    if effects is None:
+        return
+    for i in range(effects.count):
+        effects.pool[i].start = 0
+    effects.clock = lambda: EFFECTS_ELAPSED_MS
+
+
+def build_states(seed, with_menus):
+    """
+    États à capturer pour une graine
+
+    Args:
+        seed (int): Graine des parties
+        with_menus (bool): Inclure les états du menu (indépendants de la graine)
+
+    Returns:
+        list: Couples (nom, objet à dessiner)
+    """
+    from src.game import Game
+    from src.horde import HordeGame
+    from src.menu import Menu
+    from tools.render_bench import scripted_states
+
+    display = _worker["display"]
+    fonts = _worker["fonts"]
+    states = scripted_states(display.backend, fonts, seed)
+    states.append(("horde", HordeGame(display.backend, *fonts, seed=seed, horde_size=HORDE_SIZE)))
+    leaderboard = Menu(display.backend, *fonts)
+    leaderboard.state = "leaderboard"
+    states.append(("leaderboard", leaderboard))
+    for _, screen_object in states:
+        if isinstance(screen_object, Game):
+            freeze_effects(screen_object)
+    if not with_menus:
+        states = [(name, screen_object) for name, screen_object in states
+                  if isinstance(screen_object, Game)]
+    return states
+
+
+def perceptual_diff(current, golden, tolerance):
+    """
+    Différence perceptuelle entre deux surfaces de même taille
+
+    Les pixels sont lus par des vues surfarray.pixels3d (les surfaces restent
+    verrouillées pendant le calcul) ; les tampons de calcul sont réutilisés
+    d'une capture à l'autre.
+
+    Args:
+        current (pygame.Surface): Capture
+        golden (pygame.Surface): Image de référence
+        tolerance (float): Écart de luminance au-delà duquel un pixel diffère
+
+    Returns:
+        tuple: (part des pixels différents, écart maximum, masque des pixels différents)
+    """
+    from pygame import surfarray
+    a = surfarray.pixels3d(current)
+    b = surfarray.pixels3d(golden)
+    try:
+        if a.shape != b.shape:
+            return 1.0, 255.0, None
+        buffers = _worker["buffers"].get(a.shape)
+        if buffers is None:
+            buffers = (np.empty(a.shape, np.float32), np.empty(a.shape[:2], np.float32),
+                       np.empty(a.shape[:2], np.bool_), np.array(LUMA, np.float32))
+            _worker["buffers"][a.shape] = buffers
+        delta, luma, mask, weights = buffers
+        np.subtract(a, b, out=delta, dtype=np.float32)
+        np.abs(delta, out=delta)
+        np.matmul(delta, weights, out=luma)
+        np.greater(luma, tolerance, out=mask)
+        return np.count_nonzero(mask) / mask.size, float(luma.max()), mask
+    finally:
+        del a, b  # Déverrouille les surfaces
+
+
+def capture_task(seed, size, with_menus, goldens, output, update, tolerance, ratio):
+    """
+    Capture et compare les états d'une graine à une taille de fenêtre (processus du pool)
+
+    Args:
+        seed (int): Graine des parties
+        size (tuple): Taille de la fenêtre (largeur, hauteur)
+        with_menus (bool): Inclure les états du menu
+        goldens (str): Dossier des images de référence
+        output (str): Dossier des captures
+        update (bool): Écrire les captures comme nouvelles références
+        tolerance (float): Écart de luminance toléré par pixel
+        ratio (float): Part des pixels différents tolérée
+
+    Returns:
+        list: Tuples (nom du fichier, statut, part différente, écart maximum)
+    """
+    import pygame
+    from pygame import surfarray
+    display = _worker["display"]
+    window = pygame.display.set_mode(size, pygame.RESIZABLE)
+    display.handle_event(pygame.event.Event(pygame.VIDEORESIZE, size=size, w=size[0], h=size[1]))
+
+    results = []
+    for name, screen_object in build_states(seed, with_menus):
+        screen_object.draw()
+        display.dirty = True
+        display.present()
+
+        label = name if not hasattr(screen_object, "seed") else f"{name}_s{seed}"
+        filename = f"{label}_{size[0]}x{size[1]}.png"
+        golden_path = os.path.join(goldens, filename)
+        if update:
+            pygame.image.save(window, golden_path)
+            results.append((filename, "référence", 0.0, 0.0))
+            continue
+        pygame.image.save(window, os.path.join(output, filename))
+        if not os.path.exists(golden_path):
+            results.append((filename, "absente", 1.0, 255.0))
+            continue
+        different, worst, mask = perceptual_diff(window, pygame.image.load(golden_path), tolerance)
+        status = "ok" if different <= ratio else "différente"
+        if status != "ok" and mask is not None:
+            diff_image = surfarray.make_surface(mask.astype(np.uint8) * 255)
+            pygame.image.save(diff_image, os.path.join(output, f"diff_{filename}"))
+        results.append((filename, status, different, worst))
+    return results
+
+
+def parse_size(text):
+    """
+    Taille de fenêtre écrite LARGEURxHAUTEUR
+
+    Args:
+        text (str): Taille (ex: 1280x720)
+
+    Returns:
+        tuple: (largeur, hauteur)
+
+    Raises:
+        argparse.ArgumentTypeError: Si la taille est invalide
+    """
+    try:
+        width, height = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Taille invalide : {text} (attendu LARGEURxHAUTEUR)")
+    return width, height
+
+
+def main():
+    """Point d'entrée des captures"""
+    parser = argparse.ArgumentParser(description="Captures d'écran headless et comparaison")
+    parser.add_argument("--seeds", type=int, nargs="+", default=list(DEFAULT_SEEDS))
+    parser.add_argument("--sizes", type=parse_size, nargs="+",
+                        default=[parse_size(size) for size in DEFAULT_SIZES])
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--update", action="store_true", help="Remplacer les images de référence")
+    parser.add_argument("--goldens", default=GOLDENS_DIR)
+    parser.add_argument("--out", default=OUTPUT_DIR)
+    parser.add_argument("--tolerance", type=float, default=PIXEL_TOLERANCE)
+    parser.add_argument("--ratio", type=float, default=DIFF_RATIO)
+    args = parser.parse_args()
+
+    if np is None:
+        print("numpy est requis pour comparer les captures (pip install numpy)")
+        sys.exit(2)
+    os.makedirs(args.goldens if args.update else args.out, exist_ok=True)
+
+    start = time.perf_counter()
+    # "spawn" : chaque processus ouvre son propre affichage SDL
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(args.workers, mp_context=context, initializer=_init_worker) as pool:
+        futures = [
+            pool.submit(capture_task, seed, size, seed == args.seeds[0], args.goldens, args.out,
+                        args.update, args.tolerance, args.ratio)
+            for seed in args.seeds for size in args.sizes
+        ]
+        results = sorted(result for future in futures for result in future.result())
+    elapsed = time.perf_counter() - start
+
+    failed = [result for result in results if result[1] not in ("ok", "référence")]
+    for filename, status, different, worst in failed:
+        print(f"{filename:>40} {status:>10}  {different:.2%} des pixels, écart max {worst:.0f}")
+    print(f"{len(results)} captures en {elapsed:.1f} s ({args.workers} processus), "
+          f"{len(failed)} en échec -> {args.goldens if args.update else args.out}")
+    if failed:
+        print("ÉCHEC : captures différentes des références (voir diff_*.png)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
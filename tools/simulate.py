@@ -0,0 +1,30 @@
+"""
+Simulation headless de runs, enregistrées dans l'historique colonnaire
+
+Usage : python -m tools.simulate [nombre_de_runs] [dossier] [graine_initiale]
+"""
+import sys
+import time
+from src.headless import HeadlessGame, play_run
+from src.history import RunHistory
+from src.constants import HISTORY_DIR
+
+
+def main():
+    """Simule des runs et affiche le débit"""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    path = sys.argv[2] if len(sys.argv) > 2 else HISTORY_DIR
+    first_seed = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+
+    history = RunHistory(path)
+    start = time.perf_counter()
+    for seed in range(first_seed, first_seed + runs):
+        history.append(play_run(HeadlessGame(seed)))
+    history.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"{runs} runs en {elapsed:.2f}s ({runs / elapsed:.0f} runs/s) -> {path}")
+
+
+if __name__ == "__main__":
+    main()
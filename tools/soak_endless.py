@@ -0,0 +1,111 @@
+"""
+Test d'endurance du mode infini : la mémoire doit rester plate
+
+Joue une run headless en mode infini sur un grand nombre d'étages (joueur
+rendu invulnérable : seule la mémoire est mesurée) et relève la RSS à
+intervalles réguliers. Échoue si la RSS augmente de plus de la tolérance
+après l'échauffement, ou si le coût d'un changement d'étage dérive.
+
+Usage : python -m tools.soak_endless [étages] [tolérance_ko]
+"""
+import gc
+import os
+import sys
+import time
+from src.headless import HeadlessGame
+from src.constants import MESSAGE_LOG_SIZE, MAX_FLOOR, STAT_LIMIT
+
+SAMPLES = 20  # Nombre de relevés de RSS
+WARMUP_SAMPLES = 2  # Relevés ignorés (caches, arènes de l'allocateur)
+
+
+def rss_kb():
+    """
+    RSS courante du processus
+
+    Returns:
+        int: RSS en Ko (pic de RSS si /proc n'est pas disponible)
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def soak_action(game):
+    """
+    Politique d'endurance : joueur invulnérable, ennemi vaincu en deux coups
+
+    Args:
+        game (Game): Partie en cours
+
+    Returns:
+        str: Action ('attack')
+    """
+    player, enemy = game.player, game.enemy
+    # HP au plafond : survit aux enchaînements d'étourdissements
+    player.max_hp = player.hp = STAT_LIMIT
+    player.attack = enemy.defense + enemy.max_hp // 2 + 1
+    return "attack"
+
+
+def main():
+    """Joue les étages, relève la RSS et vérifie qu'elle reste plate"""
+    floors = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    tolerance_kb = int(sys.argv[2]) if len(sys.argv) > 2 else 2048
+
+    game = HeadlessGame(seed=0, endless=True)
+    step = max(1, floors // SAMPLES)
+    samples = []
+    next_sample = step
+    start = time.perf_counter()
+    lap = start
+
+    while game.floor <= floors:
+        if game.state == "player_turn":
+            game.player_action(soak_action(game))
+        elif game.state == "rewards":
+            game.apply_reward("attack")
+        elif game.state == "enemy_turn":
+            game.enemy_action()
+        else:
+            print(f"Run terminée à l'étage {game.floor} ({game.state})")
+            sys.exit(1)
+
+        if game.floor >= next_sample:
+            gc.collect()
+            now = time.perf_counter()
+            samples.append((game.floor, rss_kb(), (now - lap) / step * 1e6))
+            lap = now
+            next_sample += step
+
+    elapsed = time.perf_counter() - start
+    print(f"{floors} étages en {elapsed:.1f}s ({floors / elapsed:.0f} étages/s)")
+    print("     étage    RSS Ko   µs/étage")
+    for floor, rss, cost in samples:
+        print(f"{floor:10d} {rss:9d} {cost:10.1f}")
+
+    failures = []
+    steady = samples[WARMUP_SAMPLES:] or samples
+    growth = max(rss for _, rss, _ in steady) - steady[0][1]
+    if growth > tolerance_kb:
+        failures.append(f"RSS +{growth} Ko après l'échauffement (tolérance {tolerance_kb} Ko)")
+    costs = sorted(cost for _, _, cost in steady)
+    if costs[-1] > costs[len(costs) // 2] * 3:
+        failures.append("coût par étage non constant")
+    if len(game.message_log) > MESSAGE_LOG_SIZE or len(game.reward_history) > MAX_FLOOR:
+        failures.append("journal ou historique des récompenses non borné")
+
+    if failures:
+        for failure in failures:
+            print(f"ÉCHEC : {failure}")
+        sys.exit(1)
+    print(f"OK : RSS plate (+{growth} Ko), coût par étage constant")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark du changement d'étage : clic sur une récompense -> nouvel étage
+
+Joue des runs complètes (politiques de headless.py) avec un vrai rendu et
+relève Game.last_transition_ms à chaque récompense, avec et sans
+préchargement de l'étage suivant. Mesure aussi le lancement d'une nouvelle
+run (clic sur « Jouer » -> première frame) : partie reconstruite, ou scène
+persistante réinitialisée sur place (Game.reset_game).
+
+Usage : python -m tools.transition_bench [runs]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402  (le pilote vidéo doit être choisi avant l'import)
+from src.game import Game  # noqa: E402
+from src.headless import choose_action, choose_reward  # noqa: E402
+from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS  # noqa: E402
+from src.profiler import percentile  # noqa: E402
+
+
+def bench_transitions(screen, fonts, runs, prefetch):
+    """
+    Mesure les changements d'étage sur plusieurs runs
+
+    Args:
+        screen: Surface d'affichage
+        fonts (tuple): Polices (grande, moyenne, petite)
+        runs (int): Nombre de runs jouées
+        prefetch (bool): False pour désactiver le préchargement
+
+    Returns:
+        list: Durées des changements d'étage triées (ms)
+    """
+    times = []
+    for seed in range(runs):
+        game = Game(screen, *fonts, seed=seed)
+        game._schedule_enemy_turn = game.enemy_action  # Pas de délai entre les tours
+        if not prefetch:
+            game._prefetch_next_floor = lambda: None
+        while game.state not in ("game_over", "victory_final"):
+            if game.state == "player_turn":
+                game.player_action(choose_action(game))
+            elif game.state == "rewards":
+                game.draw()  # Frames de l'écran des récompenses
+                game.apply_reward(choose_reward(game))
+                times.append(game.last_transition_ms)
+                game.draw()
+    times.sort()
+    return times
+
+
+def bench_new_runs(screen, fonts, runs, in_place):
+    """
+    Mesure le lancement de nouvelles runs, première frame comprise
+
+    Args:
+        screen: Surface d'affichage
+        fonts (tuple): Polices (grande, moyenne, petite)
+        runs (int): Nombre de runs lancées
+        in_place (bool): True pour réinitialiser une seule partie, False pour en créer une par run
+
+    Returns:
+        list: Durées des lancements triées (ms)
+    """
+    times = []
+    game = Game(screen, *fonts, seed=0)
+    for seed in range(runs):
+        start = time.perf_counter()
+        if in_place:
+            game.reset_game(seed)
+        else:
+            game = Game(screen, *fonts, seed=seed)
+        game.draw()
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return times
+
+
+def main():
+    """Point d'entrée du benchmark"""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    fonts = (pygame.font.Font(None, 72), pygame.font.Font(None, 36), pygame.font.Font(None, 24))
+
+    budget = 1000 / FPS
+    print(f"{'mode':>14} {'n':>6} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}  (budget {budget:.1f} ms)")
+    for prefetch in (False, True):
+        times = bench_transitions(screen, fonts, runs, prefetch)
+        label = "préchargé" if prefetch else "synchrone"
+        print(f"{label:>14} {len(times):>6} {percentile(times, 0.5):>8.3f} "
+              f"{percentile(times, 0.99):>8.3f} {times[-1]:>8.3f}")
+        if prefetch and times[-1] > budget:
+            print(f"ÉCHEC : changement d'étage au-delà d'une frame ({times[-1]:.3f} ms)")
+            sys.exit(1)
+    for in_place in (False, True):
+        times = bench_new_runs(screen, fonts, runs * 10, in_place)
+        label = "run sur place" if in_place else "run recréée"
+        print(f"{label:>14} {len(times):>6} {percentile(times, 0.5):>8.3f} "
+              f"{percentile(times, 0.99):>8.3f} {times[-1]:>8.3f}")
+        if in_place and times[-1] > budget:
+            print(f"ÉCHEC : nouvelle run au-delà d'une frame ({times[-1]:.3f} ms)")
+            sys.exit(1)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()